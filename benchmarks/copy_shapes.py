@@ -0,0 +1,69 @@
+"""Compares ElementBase.copy() with Python's generic deepcopy
+on shapes that are typically copied many times in a script.
+
+Run with:
+    python benchmarks/copy_shapes.py"""
+
+import contextlib
+import copy
+import timeit
+from unittest import mock
+
+import classy_blocks as cb
+from classy_blocks.base.element import ElementBase
+from classy_blocks.construct.edges import Line
+from classy_blocks.construct.operations.operation import Operation
+from classy_blocks.construct.point import Point
+
+REPEATS = 200
+
+
+@contextlib.contextmanager
+def generic_deepcopy():
+    """Disables all custom __deepcopy__ methods"""
+    with contextlib.ExitStack() as stack:
+        for cls in (ElementBase, Point, Operation, Line):
+            stack.enter_context(mock.patch.object(cls, "__deepcopy__", None))
+
+        yield
+
+
+def get_cylinder() -> cb.Cylinder:
+    cylinder = cb.Cylinder([0, 0, 0], [0, 0, 1], [1, 0, 0])
+    cylinder.chop_axial(count=10)
+    cylinder.chop_radial(count=5)
+    cylinder.chop_tangential(count=5)
+
+    return cylinder
+
+
+def get_stack() -> cb.ExtrudedStack:
+    base = cb.Grid([0, 0, 0], [1, 1, 0], 5, 5)
+    stack = cb.ExtrudedStack(base, 1, 4)
+    stack.chop(count=5)
+
+    return stack
+
+
+def get_revolved_ring() -> cb.RevolvedRing:
+    ring = cb.RevolvedRing([0, 0, 0], [1, 0, 0], cb.Face([[0, 1, 0], [1, 1, 0], [1, 2, 0], [0, 2, 0]]))
+    ring.chop_axial(count=10)
+    ring.chop_radial(count=5)
+    ring.chop_tangential(count=5)
+
+    return ring
+
+
+def benchmark(name: str, entity: ElementBase) -> None:
+    fast = timeit.timeit(entity.copy, number=REPEATS) / REPEATS
+
+    with generic_deepcopy():
+        generic = timeit.timeit(lambda: copy.deepcopy(entity), number=REPEATS) / REPEATS
+
+    print(f"{name:<15} copy(): {fast*1000:8.3f} ms, deepcopy: {generic*1000:8.3f} ms, speedup: {generic/fast:5.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark("Cylinder", get_cylinder())
+    benchmark("ExtrudedStack", get_stack())
+    benchmark("RevolvedRing", get_revolved_ring())
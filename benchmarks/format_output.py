@@ -0,0 +1,53 @@
+"""Compares formatting of vertices and spline edges for blockMeshDict
+one vector at a time with bulk formatting of whole arrays.
+
+Run with:
+    python benchmarks/format_output.py"""
+
+import timeit
+
+import numpy as np
+
+from classy_blocks.construct import edges
+from classy_blocks.items.edges.factory import factory
+from classy_blocks.items.vertex import Vertex
+from classy_blocks.lists.vertex_list import VertexList
+from classy_blocks.util import constants
+
+VERTEX_COUNT = 100_000
+SPLINE_POINT_COUNT = 500_000
+REPEATS = 3
+
+
+def get_vertex_list() -> VertexList:
+    vertex_list = VertexList()
+    positions = np.random.default_rng(0).uniform(-100, 100, size=(VERTEX_COUNT, 3))
+    vertex_list.vertices = [Vertex(position, i) for i, position in enumerate(positions)]
+
+    return vertex_list
+
+
+def format_vertices_single(vertex_list: VertexList) -> str:
+    return "vertices\n(\n" + "".join([f"\t{vertex.description}\n" for vertex in vertex_list.vertices]) + ");\n\n"
+
+
+def benchmark(name: str, single, bulk) -> None:
+    assert single() == bulk(), "Bulk formatting is not identical"
+
+    single_time = timeit.timeit(single, number=REPEATS) / REPEATS
+    bulk_time = timeit.timeit(bulk, number=REPEATS) / REPEATS
+
+    print(f"{name:<10} single: {single_time:6.3f} s, bulk: {bulk_time:6.3f} s, speedup: {single_time/bulk_time:5.2f}x")
+
+
+if __name__ == "__main__":
+    vertex_list = get_vertex_list()
+    benchmark("Vertices", lambda: format_vertices_single(vertex_list), lambda: vertex_list.description)
+
+    points = np.random.default_rng(1).random((SPLINE_POINT_COUNT, 3))
+    edge = factory.create(vertex_list.vertices[0], vertex_list.vertices[1], edges.Spline(points))
+    benchmark(
+        "Spline",
+        lambda: " ".join([constants.vector_format(point) for point in edge.point_array]),
+        lambda: constants.vector_list_format(edge.point_array),
+    )
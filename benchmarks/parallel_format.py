@@ -0,0 +1,44 @@
+"""Compares serial and parallel formatting of blocks and edges of a large mesh.
+
+Run with:
+    python benchmarks/parallel_format.py"""
+
+import time
+
+from classy_blocks.construct.shapes.cylinder import Cylinder
+from classy_blocks.mesh import Mesh
+
+# cylinders in each direction
+GRID_SIZE = (8, 8)
+WORKERS = (1, 2, 4)
+
+
+def create_mesh() -> Mesh:
+    mesh = Mesh()
+
+    for i in range(GRID_SIZE[0]):
+        for j in range(GRID_SIZE[1]):
+            cylinder = Cylinder([3 * i, 3 * j, 0], [3 * i, 3 * j, 1], [3 * i + 1, 3 * j, 0])
+            cylinder.chop_axial(count=10)
+            cylinder.chop_radial(count=5, total_expansion=2)
+            cylinder.chop_tangential(count=10)
+            mesh.add(cylinder)
+
+    mesh.assemble()
+    mesh.block_list.assemble()
+
+    return mesh
+
+
+if __name__ == "__main__":
+    mesh = create_mesh()
+    print(f"{len(mesh.blocks)} blocks, {len(mesh.edge_list.edges)} edges")
+
+    serial = mesh.format_sections()
+
+    for workers in WORKERS:
+        start = time.perf_counter()
+        sections = mesh.format_sections(workers)
+        elapsed = time.perf_counter() - start
+
+        print(f"{workers} worker(s): {elapsed:6.3f} s, identical: {sections == serial}")
@@ -0,0 +1,62 @@
+"""Measures reading of a large blockMeshDict: tokenizing and parsing
+separately and creation of the whole mesh (vertices, blocks and their relations).
+
+Run with:
+    python benchmarks/read_dict.py"""
+
+import os
+import tempfile
+import time
+
+from classy_blocks.mesh import Mesh
+from classy_blocks.util.dict_reader import parse_dict, read_tokens
+
+# blocks in each direction
+GRID_SIZE = (40, 40, 10)
+
+
+def write_grid(path: str) -> None:
+    """Writes a blockMeshDict with a structured grid of blocks"""
+    size_x, size_y, size_z = GRID_SIZE
+
+    def index(i: int, j: int, k: int) -> int:
+        return i + (size_x + 1) * (j + (size_y + 1) * k)
+
+    with open(path, "w", encoding="utf-8") as output:
+        output.write("scale 1;\n\nvertices\n(\n")
+
+        for k in range(size_z + 1):
+            for j in range(size_y + 1):
+                for i in range(size_x + 1):
+                    output.write(f"\t({i:.8f} {j:.8f} {k:.8f}) // {index(i, j, k)}\n")
+
+        output.write(");\n\nblocks\n(\n")
+
+        for k in range(size_z):
+            for j in range(size_y):
+                for i in range(size_x):
+                    corners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+                    indexes = " ".join(str(index(i + c[0], j + c[1], k + c[2])) for c in corners)
+                    output.write(f"\thex ( {indexes} ) ( 4 4 4 ) simpleGrading ( 1 1 2 )\n")
+
+        output.write(");\n\nedges\n(\n);\n\nboundary\n(\n);\n")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dict_path = os.path.join(tmpdir, "blockMeshDict")
+        write_grid(dict_path)
+
+        size = os.path.getsize(dict_path) / 2**20
+
+        start = time.perf_counter()
+        parse_dict(read_tokens(dict_path), top_level=True)
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mesh = Mesh.read(dict_path)
+        read_time = time.perf_counter() - start
+
+    print(f"{size:.1f} MB, {len(mesh.blocks)} blocks")
+    print(f"Tokenize and parse: {parse_time:6.3f} s")
+    print(f"Read mesh:          {read_time:6.3f} s")
@@ -24,6 +24,7 @@ from .construct.operations.loft import Loft
 from .construct.operations.operation import Operation
 from .construct.operations.revolve import Revolve
 from .construct.operations.wedge import Wedge
+from .construct.pattern import LinearPattern, Pattern, PolarPattern
 from .construct.shape import ExtrudedShape, LoftedShape, RevolvedShape, Shape
 from .construct.shapes.cylinder import Cylinder, QuarterCylinder, SemiCylinder
 from .construct.shapes.elbow import Elbow
@@ -105,6 +106,10 @@ __all__ = [
     "RevolvedRing",
     "Hemisphere",
     "Shell",
+    # Patterns
+    "Pattern",
+    "PolarPattern",
+    "LinearPattern",
     # Stacks
     "TransformedStack",
     "ExtrudedStack",
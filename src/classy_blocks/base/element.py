@@ -1,12 +1,19 @@
 import abc
 import copy
-from typing import Dict, List, Optional, Sequence, TypeVar
+import functools
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
+
+import numpy as np
 
 from classy_blocks.base import transforms as tr
-from classy_blocks.types import NPPointType, PointType, VectorType
+from classy_blocks.types import NPPointListType, NPPointType, PointType, VectorType
+from classy_blocks.util import functions as f
 
 ElementBaseT = TypeVar("ElementBaseT", bound="ElementBase")
 
+# attribute values that can be shared between copies
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
 
 class ElementBase(abc.ABC):
     """Base class for mesh-building elements and tools
@@ -15,57 +22,48 @@ class ElementBase(abc.ABC):
     def translate(self: ElementBaseT, displacement: VectorType) -> ElementBaseT:
         """Move by displacement vector; returns the same instance
         to enable chaining of transformations."""
-        for component in self.parts:
-            component.translate(displacement)
-
-        return self
+        return self._transform([tr.Translation(displacement)])
 
     def rotate(self: ElementBaseT, angle: float, axis: VectorType, origin: Optional[PointType] = None) -> ElementBaseT:
         """Rotate by 'angle' around 'axis' going through 'origin';
         returns the same instance to enable chaining of transformations."""
-        if origin is None:
-            origin = self.center
-
-        for component in self.parts:
-            component.rotate(angle, axis, origin)
-
-        return self
+        return self._transform([tr.Rotation(axis, angle, origin)])
 
     def scale(self: ElementBaseT, ratio: float, origin: Optional[PointType] = None) -> ElementBaseT:
         """Scale with respect to given origin; returns the same instance
         to enable chaining of transformations. If no origin is given,
         the entity is scaled with respect to its center"""
-        if origin is None:
-            origin = self.center
-
-        for component in self.parts:
-            component.scale(ratio, origin)
-
-        return self
+        return self._transform([tr.Scaling(ratio, origin)])
 
     def mirror(self: ElementBaseT, normal: VectorType, origin: Optional[PointType] = None) -> ElementBaseT:
         """Mirror around a plane, defined by a normal vector and passing through origin;
         if origin is not given, [0, 0, 0] is assumed"""
-        if origin is None:
-            origin = [0, 0, 0]
-
-        for component in self.parts:
-            component.mirror(normal, origin)
-
-        return self
+        return self._transform([tr.Mirror(normal, origin)])
 
     def shear(
         self: ElementBaseT, normal: VectorType, origin: PointType, direction: VectorType, angle: float
     ) -> ElementBaseT:
-        for component in self.parts:
-            component.shear(normal, origin, direction, angle)
-
-        return self
+        return self._transform([tr.Shear(normal, origin, direction, angle)])
 
     def copy(self: ElementBaseT) -> ElementBaseT:
         """Returns a copy of this object"""
         return copy.deepcopy(self)
 
+    def __deepcopy__(self: ElementBaseT, memo: Dict[int, Any]) -> ElementBaseT:
+        # the default deepcopy goes through pickling machinery (__reduce_ex__ and
+        # reconstruction) for every object and visits every immutable attribute;
+        # entities are copied many times so do it directly
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+
+        for key, value in self.__dict__.items():
+            if not isinstance(value, IMMUTABLE_TYPES):
+                value = copy.deepcopy(value, memo)
+
+            clone.__dict__[key] = value
+
+        return clone
+
     @property
     @abc.abstractmethod
     def parts(self: ElementBaseT) -> List[ElementBaseT]:
@@ -87,43 +85,128 @@ class ElementBase(abc.ABC):
         projected to an ad-hoc defined searchableSphere"""
         return None
 
+    def get_coordinates(self) -> NPPointListType:
+        """Coordinates of all points of this element as a (N, 3) array;
+        only implemented by the lowest-level elements (points and arrays)
+        whose parts are themselves"""
+        raise NotImplementedError(f"{type(self)} does not hold coordinates directly")
+
+    def set_coordinates(self, coordinates: NPPointListType) -> None:
+        """Replaces coordinates with given (N, 3) array
+        in the same order as returned by get_coordinates()"""
+        raise NotImplementedError(f"{type(self)} does not hold coordinates directly")
+
+    def _gather(self, method: str) -> Tuple[List["ElementBase"], List["ElementBase"]]:
+        """Collects all lowest-level elements (leaves) under this element
+        that can be transformed together with given 'method' and elements
+        that reimplement 'method' and must be transformed separately."""
+        leaves: List[ElementBase] = []
+        separate: List[ElementBase] = []
+        visited: Set[int] = set()
+
+        def walk(element: ElementBase) -> None:
+            if id(element) in visited:
+                return
+            visited.add(id(element))
+
+            parts = element.parts
+            if len(parts) == 1 and parts[0] is element:
+                leaves.append(element)
+                return
+
+            if element is not self and getattr(type(element), method) is not getattr(ElementBase, method):
+                separate.append(element)
+                return
+
+            for part in parts:
+                walk(part)
+
+        walk(self)
+
+        return leaves, separate
+
     def transform(self: ElementBaseT, transforms: Sequence[tr.Transformation]) -> ElementBaseT:
+        """Applies a sequence of transformations. Consecutive affine transformations
+        (translation, rotation, scaling, mirror) are composed into a single matrix that is
+        applied to coordinates of all points under this element at once;
+        shear is applied in a separate vectorized stage."""
+        return self._transform(transforms)
+
+    def _transform(self: ElementBaseT, transforms: Sequence[tr.Transformation]) -> ElementBaseT:
+        # the actual work of transform() but without any subclass' additions
+        gathered: Dict[str, Tuple[List[ElementBase], List[ElementBase]]] = {}
+
+        leaves: List[ElementBase] = []
+        matrix: Optional[NPPointType] = None
+
+        def apply(function: Callable[[NPPointListType], NPPointListType]) -> None:
+            # transform coordinates of all leaves in a single call
+            coordinates = [leaf.get_coordinates() for leaf in leaves]
+            if len(coordinates) == 0:
+                return
+
+            indexes = np.cumsum([len(c) for c in coordinates])[:-1]
+            transformed = function(np.concatenate(coordinates))
+
+            for leaf, leaf_coordinates in zip(leaves, np.split(transformed, indexes)):
+                leaf.set_coordinates(leaf_coordinates)
+
+        def flush() -> None:
+            nonlocal matrix
+
+            if matrix is not None:
+                affine = matrix
+                apply(lambda points: np.dot(points, affine[:3, :3].T) + affine[:3, 3])
+
+            matrix = None
+
         for t7m in transforms:
-            # remember center or it will change during transformation
-            # of each self.part
-            center = self.center
-
-            for part in self.parts:
-                if isinstance(t7m, tr.Translation):
-                    part.translate(t7m.displacement)
-                    continue
-
-                if isinstance(t7m, tr.Rotation):
-                    origin = t7m.origin
-                    if origin is None:
-                        origin = center
-
-                    part.rotate(t7m.angle, t7m.axis, origin=origin)
-                    continue
-
-                if isinstance(t7m, tr.Scaling):
-                    origin = t7m.origin
-                    if origin is None:
-                        origin = center
-
-                    part.scale(t7m.ratio, origin=origin)
-                    continue
-
-                if isinstance(t7m, tr.Mirror):
-                    origin = t7m.origin
-                    if origin is None:
-                        origin = [0, 0, 0]
-
-                    part.mirror(t7m.normal, origin=origin)
-                    continue
-
-                if isinstance(t7m, tr.Shear):
-                    part.shear(t7m.normal, t7m.origin, t7m.direction, t7m.angle)
-                    continue
+            if t7m.method not in gathered:
+                step_leaves, separate = self._gather(t7m.method)
+
+                # in most cases all methods gather the same leaves;
+                # reuse the same list so that transforms can be composed
+                for other_leaves, _ in gathered.values():
+                    if [id(leaf) for leaf in other_leaves] == [id(leaf) for leaf in step_leaves]:
+                        step_leaves = other_leaves
+                        break
+
+                gathered[t7m.method] = (step_leaves, separate)
+
+            step_leaves, separate = gathered[t7m.method]
+
+            if step_leaves is not leaves:
+                # a different set of elements to transform, apply what's been accumulated so far
+                flush()
+                leaves = step_leaves
+
+            origin = getattr(t7m, "origin", None)
+
+            if isinstance(t7m, (tr.Rotation, tr.Scaling)) and origin is None:
+                # center changes with every transform;
+                # the previous ones must be applied to find it
+                flush()
+                origin = self.center
+            elif isinstance(t7m, tr.Mirror) and origin is None:
+                origin = [0, 0, 0]
+
+            for element in separate:
+                t7m.apply(element, origin)
+
+            if isinstance(t7m, tr.AffineTransformation):
+                step_matrix = t7m.get_matrix(origin)
+                matrix = step_matrix if matrix is None else np.dot(step_matrix, matrix)
+                continue
+
+            if isinstance(t7m, tr.Shear):
+                flush()
+
+                apply(
+                    functools.partial(
+                        f.shear, normal=t7m.normal, origin=t7m.origin, direction=t7m.direction, angle=t7m.angle
+                    )
+                )
+
+        flush()
 
         return self
@@ -105,6 +105,21 @@ class InconsistentGradingsError(Exception):
     """Raised when cell counts for edges on the same axis is not consistent"""
 
 
+### Mesh generation
+class MeshGenerationError(Exception):
+    """Raised when the built-in mesh generator is asked for something
+    that only blockMesh can do (projections, merged patches, ...)"""
+
+
+### Saving/loading
+class MeshArchiveError(Exception):
+    """Raised when a saved mesh cannot be loaded"""
+
+
+class DictParseError(Exception):
+    """Raised when an existing blockMeshDict cannot be read"""
+
+
 class NoInstructionError(Exception):
     """Raised when building a catalogue"""
 
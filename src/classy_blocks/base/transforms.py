@@ -2,9 +2,13 @@
 into an easily digestable function/method arguments"""
 
 import dataclasses
-from typing import Optional
+from typing import ClassVar, Optional
 
-from classy_blocks.types import PointType, VectorType
+import numpy as np
+
+from classy_blocks.types import NPPointType, PointType, VectorType
+from classy_blocks.util import constants
+from classy_blocks.util import functions as f
 
 
 @dataclasses.dataclass
@@ -12,39 +16,103 @@ class Transformation:
     """A superclass that addresses all
     dataclasses for transformation parameters"""
 
+    # name of ElementBase's method that does the same transformation
+    method: ClassVar[str]
+
+    def apply(self, element, origin: Optional[PointType]) -> None:
+        """Transforms given element by calling its appropriate method"""
+        raise NotImplementedError
+
 
 @dataclasses.dataclass
-class Translation(Transformation):
+class AffineTransformation(Transformation):
+    """Transformations that can be described with
+    a 4x4 affine matrix and can therefore be composed"""
+
+    def get_matrix(self, origin: Optional[PointType]) -> NPPointType:
+        """Returns a 4x4 matrix that transforms homogeneous coordinates"""
+        raise NotImplementedError
+
+    @staticmethod
+    def _about(linear, origin: Optional[PointType]) -> NPPointType:
+        """Returns an affine matrix that applies the 'linear' 3x3 matrix around origin"""
+        matrix = np.eye(4, dtype=constants.DTYPE)
+        matrix[:3, :3] = linear
+
+        if origin is not None:
+            origin = np.asarray(origin, dtype=constants.DTYPE)
+            matrix[:3, 3] = origin - np.dot(linear, origin)
+
+        return matrix
+
+
+@dataclasses.dataclass
+class Translation(AffineTransformation):
     """Parameters required to translate an entity"""
 
     displacement: VectorType
 
+    method = "translate"
+
+    def apply(self, element, _origin):
+        element.translate(self.displacement)
+
+    def get_matrix(self, _origin):
+        matrix = np.eye(4, dtype=constants.DTYPE)
+        matrix[:3, 3] = self.displacement
+
+        return matrix
+
 
 @dataclasses.dataclass
-class Rotation(Transformation):
+class Rotation(AffineTransformation):
     """Parameters required to rotate an entity"""
 
     axis: VectorType
     angle: float
     origin: Optional[PointType] = None
 
+    method = "rotate"
+
+    def apply(self, element, origin):
+        element.rotate(self.angle, self.axis, origin)
+
+    def get_matrix(self, origin):
+        return self._about(f.rotation_matrix(self.axis, self.angle), origin)
+
 
 @dataclasses.dataclass
-class Scaling(Transformation):
+class Scaling(AffineTransformation):
     """Parameters required to scale an entity"""
 
     ratio: float
     origin: Optional[PointType] = None
 
+    method = "scale"
+
+    def apply(self, element, origin):
+        element.scale(self.ratio, origin)
+
+    def get_matrix(self, origin):
+        return self._about(np.eye(3) * self.ratio, origin)
+
 
 @dataclasses.dataclass
-class Mirror(Transformation):
+class Mirror(AffineTransformation):
     """Parameters required to mirror an entity around an
     arbitrary plane"""
 
     normal: VectorType
     origin: Optional[PointType] = None
 
+    method = "mirror"
+
+    def apply(self, element, origin):
+        element.mirror(self.normal, origin)
+
+    def get_matrix(self, origin):
+        return self._about(f.mirror_matrix(f.unit_vector(self.normal)), origin)
+
 
 @dataclasses.dataclass
 class Shear(Transformation):
@@ -55,3 +123,8 @@ class Shear(Transformation):
 
     direction: VectorType
     angle: float
+
+    method = "shear"
+
+    def apply(self, element, _origin):
+        element.shear(self.normal, self.origin, self.direction, self.angle)
@@ -4,11 +4,10 @@ import numpy as np
 
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import ArrayCreationError
-from classy_blocks.types import PointListType, PointType, VectorType
+from classy_blocks.construct.point import next_version
+from classy_blocks.types import NPPointListType, PointListType, PointType, VectorType
 from classy_blocks.util import functions as f
-from classy_blocks.util.constants import DTYPE, TOL
-
-# TODO! Tests
+from classy_blocks.util.constants import DTYPE
 
 
 class Array(ElementBase):
@@ -24,6 +23,20 @@ class Array(ElementBase):
         if len(self.points) <= 1:
             raise ArrayCreationError("Provide at least 2 points in 3D space!")
 
+    @property
+    def points(self) -> NPPointListType:
+        return self._points
+
+    @points.setter
+    def points(self, points: NPPointListType) -> None:
+        self._points = points
+        self._version = next_version()
+
+    @property
+    def version(self) -> int:
+        """A number that changes whenever any of the points is moved"""
+        return self._version
+
     def translate(self, displacement):
         self.points += np.asarray(displacement, dtype=DTYPE)
 
@@ -33,11 +46,7 @@ class Array(ElementBase):
         if origin is None:
             origin = f.vector(0, 0, 0)
 
-        axis = np.array(axis)
-        matrix = f.rotation_matrix(axis, angle)
-        rotated_points = np.dot(self.points - origin, matrix.T)
-
-        self.points = rotated_points + origin
+        self.points = f.rotate(self.points, angle, axis, origin)
 
         return self
 
@@ -53,32 +62,24 @@ class Array(ElementBase):
         if origin is None:
             origin = f.vector(0, 0, 0)
 
-        normal = np.array(normal)
-        matrix = f.mirror_matrix(normal)
-
-        self.points -= origin
+        matrix = f.mirror_matrix(f.unit_vector(normal))
 
-        mirrored_points = np.dot(self.points - origin, matrix.T)
-        self.points = mirrored_points + origin
+        self.points = np.dot(self.points - origin, matrix.T) + origin
 
         return self
 
     def shear(self, normal: VectorType, origin: PointType, direction: VectorType, angle: float):
-        """Move point along the plane, given by origin and normal"""
-        # if the point is on the plane, do nothing
-        normal = np.asarray(normal, dtype=DTYPE)
-        origin = np.asarray(origin, dtype=DTYPE)
-
-        # TODO: do this within a single array
-        for i, point in enumerate(self.points):
-            if f.point_to_plane_distance(origin, normal, point) > TOL:
-                distance = f.point_to_plane_distance(origin, normal, point)
-                direction = f.unit_vector(direction)
-                amount = distance / np.tan(angle)
-
-                self.points[i] += direction * amount
+        """Move points along the plane, given by origin and normal"""
+        self.points = f.shear(self.points, normal, origin, direction, angle)
+
         return self
 
+    def get_coordinates(self) -> NPPointListType:
+        return self.points
+
+    def set_coordinates(self, coordinates: NPPointListType) -> None:
+        self.points = np.array(coordinates, dtype=DTYPE)
+
     @property
     def center(self):
         return np.average(self.points, axis=0)
@@ -1,11 +1,12 @@
-from typing import Optional, Tuple
+from typing import Hashable, Optional, Tuple
 
 import numpy as np
 
 from classy_blocks.construct.curves.curve import FunctionCurveBase
 from classy_blocks.construct.point import Point
-from classy_blocks.types import NPVectorType, ParamCurveFuncType, PointType, VectorType
+from classy_blocks.types import NPPointListType, NPPointType, NPVectorType, ParamCurveFuncType, PointType, VectorType
 from classy_blocks.util import functions as f
+from classy_blocks.util.constants import DTYPE
 
 
 class AnalyticCurve(FunctionCurveBase):
@@ -21,6 +22,11 @@ class AnalyticCurve(FunctionCurveBase):
     def parts(self):
         raise NotImplementedError("Transforming arbitrary analytic curves is currently not supported")
 
+    @property
+    def version(self) -> Hashable:
+        # the function can't be transformed so it's the same as long as it's not replaced
+        return (id(self.function), self.bounds)
+
     def get_length(self, param_from: Optional[float] = None, param_to: Optional[float] = None) -> float:
         # simply discretize the curve and sum up the segments;
         # numerical integration is not reliable and can often yield totally wrong results
@@ -38,7 +44,11 @@ class LineCurve(AnalyticCurve):
         self.point_1 = Point(point_1)
         self.point_2 = Point(point_2)
 
-        super().__init__(lambda t: self.point_1.position + self.vector * t, bounds)
+        # a bound method (contrary to a lambda) is rebound to the new object on copy
+        super().__init__(self._get_position, bounds)
+
+    def _get_position(self, param: float) -> NPPointType:
+        return self.point_1.position + self.vector * param
 
     @property
     def vector(self) -> NPVectorType:
@@ -48,6 +58,17 @@ class LineCurve(AnalyticCurve):
     def parts(self):
         return [self.point_1, self.point_2]
 
+    @property
+    def version(self) -> Hashable:
+        return (self.point_1.version, self.point_2.version, self.bounds)
+
+    def get_closest_param(self, point: PointType) -> float:
+        """Projects the point to the line; no iterative search is needed"""
+        vector = self.vector
+        param = np.dot(np.asarray(point, dtype=DTYPE) - self.point_1.position, vector) / np.dot(vector, vector)
+
+        return float(np.clip(param, self.bounds[0], self.bounds[1]))
+
     @property
     def center(self):
         # this one is easy
@@ -71,12 +92,24 @@ class CircleCurve(AnalyticCurve):
         normal = f.unit_vector(normal)
         self.atop = Point(origin + normal)
 
-        super().__init__(lambda t: f.rotate(self.rim.position, t, self.normal, self.origin.position), bounds)
+        super().__init__(self._get_position, bounds)
+
+    def _get_position(self, param: float) -> NPPointType:
+        return f.rotate(self.rim.position, param, self.normal, self.origin.position)
 
     @property
     def normal(self) -> NPVectorType:
         return self.atop.position - self.origin.position
 
+    def discretize(
+        self, param_from: Optional[float] = None, param_to: Optional[float] = None, count: int = 15
+    ) -> NPPointListType:
+        # rotate rim point by all angles at once
+        param_from, param_to = self._get_params(param_from, param_to)
+        params = np.linspace(param_from, param_to, num=count)
+
+        return f.rotate(self.rim.position, params, self.normal, self.origin.position)
+
     @property
     def center(self):
         return self.origin.position
@@ -84,3 +117,25 @@ class CircleCurve(AnalyticCurve):
     @property
     def parts(self):
         return [self.origin, self.rim, self.atop]
+
+    @property
+    def version(self) -> Hashable:
+        return (self.origin.version, self.rim.version, self.atop.version, self.bounds)
+
+    def get_closest_param(self, point: PointType) -> float:
+        """Returns the angle between rim and point, projected to circle's plane;
+        if the angle is out of bounds, the closer of the two bounds is returned"""
+        point = np.asarray(point, dtype=DTYPE)
+        normal = f.unit_vector(self.normal)
+        radius = self.rim.position - self.origin.position
+        arm = point - self.origin.position
+
+        angle = np.arctan2(np.dot(np.cross(radius, arm), normal), np.dot(radius, arm))
+
+        # take the smallest equivalent angle within bounds, if there is one
+        param = self.bounds[0] + (angle - self.bounds[0]) % (2 * np.pi)
+        if param <= self.bounds[1]:
+            return float(param)
+
+        distances = [f.norm(self.function(bound) - point) for bound in self.bounds]
+        return float(self.bounds[int(np.argmin(distances))])
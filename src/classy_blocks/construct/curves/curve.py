@@ -1,6 +1,6 @@
 import abc
 import warnings
-from typing import Optional, Tuple, Union
+from typing import Hashable, Optional, Tuple, Union
 
 import numpy as np
 import scipy.optimize
@@ -58,6 +58,12 @@ class CurveBase(ElementBase):
         """Returns full length of the curve between provided bounds"""
         return self.get_length(self.bounds[0], self.bounds[1])
 
+    @property
+    def version(self) -> Hashable:
+        """Identifies the current geometric state of this curve;
+        changes whenever any of the defining points are moved"""
+        return (*[part.version for part in self.parts], self.bounds)
+
     @abc.abstractmethod
     def get_closest_param(self, point: PointType) -> float:
         """Finds the parameter on curve where point is the closest to given point;
@@ -68,7 +74,7 @@ class CurveBase(ElementBase):
         point = np.array(point)
         all_points = self.discretize()
 
-        distances = np.array([f.norm(p - point) for p in all_points])
+        distances = np.linalg.norm(all_points - point, axis=1)
         params = np.linspace(self.bounds[0], self.bounds[1], num=len(distances))
 
         i_distance = np.argmin(distances)
@@ -1,5 +1,5 @@
 import abc
-from typing import Optional, Type
+from typing import Hashable, Optional, Type
 
 import numpy as np
 
@@ -44,6 +44,11 @@ class InterpolatedCurveBase(FunctionCurveBase, abc.ABC):
 
         return [self.array]
 
+    @property
+    def version(self) -> Hashable:
+        # do not use parts as that invalidates the interpolation function
+        return (self.array.version, self.bounds)
+
     def get_length(self, param_from: Optional[float] = None, param_to: Optional[float] = None) -> float:
         """Returns the length of this curve by summing distance between
         points. The 'count' parameter is ignored as the original points are taken."""
@@ -1,5 +1,5 @@
 import warnings
-from typing import List
+from typing import Hashable, List
 
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import EdgeCreationError
@@ -29,12 +29,22 @@ class EdgeData(ElementBase):
         # what goes into blockMeshDict's edge definition
         return self.kind
 
+    @property
+    def version(self) -> Hashable:
+        """Identifies the current geometric state of this edge's definition;
+        changes whenever any of the defining points are moved"""
+        return tuple(part.version for part in self.parts)
+
 
 class Line(EdgeData):
     """A 'line' edge is created by default and needs no extra parameters"""
 
     kind = "line"
 
+    def __deepcopy__(self, memo):
+        # there's nothing to copy
+        return self
+
 
 class Arc(EdgeData):
     """Parameters for an arc edge: classic OpenFOAM circular arc
@@ -72,6 +82,10 @@ class Origin(EdgeData):
     def parts(self):
         return [self.origin]
 
+    @property
+    def version(self) -> Hashable:
+        return (self.origin.version, self.flatness)
+
 
 class Angle(EdgeData):
     """Parameters for an arc edge, alternative definition
@@ -100,6 +114,10 @@ class Angle(EdgeData):
     def parts(self):
         return [self.axis]
 
+    @property
+    def version(self) -> Hashable:
+        return (self.axis.version, self.angle)
+
 
 class Project(EdgeData):
     """Parameters for a 'project' edge"""
@@ -160,6 +178,10 @@ class OnCurve(EdgeData):
     def representation(self) -> EdgeKindType:
         return self._repr
 
+    @property
+    def version(self) -> Hashable:
+        return (self.curve.version, self.n_points)
+
     def discretize(self, param_from: float, param_to: float) -> NPPointListType:
         return self.curve.discretize(param_from, param_to, self.n_points + 2)
 
@@ -7,7 +7,7 @@ import numpy as np
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import FaceCreationError
 from classy_blocks.construct.edges import EdgeData, Line, Project
-from classy_blocks.construct.point import Point
+from classy_blocks.construct.point import Point, PointBuffer
 from classy_blocks.types import NPPointListType, NPPointType, NPVectorType, PointListType, PointType, ProjectToType
 from classy_blocks.util import constants
 from classy_blocks.util import functions as f
@@ -42,6 +42,8 @@ class Face(ElementBase):
             )
 
         self.points = [Point(p) for p in points]
+        # an optional contiguous storage of points' positions, see pack()
+        self.buffer: Optional[PointBuffer] = None
         # Edges
         self.edges: List[EdgeData] = [Line(), Line(), Line(), Line()]
         if edges is not None:
@@ -102,12 +104,36 @@ class Face(ElementBase):
 
         self.add_edge(corner, Project(label))
 
+    def pack(self, array: Optional[NPPointListType] = None) -> "Face":
+        """Stores positions of this face's points in a single contiguous (4, 3) array
+        (optionally a provided one, for instance a slice of a bigger buffer);
+        points' positions become views into that array so that the whole
+        face can be read and transformed without gathering individual points."""
+        for point in self.points:
+            point.detach()
+
+        self.buffer = PointBuffer(self.points, array)
+
+        return self
+
+    @property
+    def is_packed(self) -> bool:
+        """True if all points are stored in this face's buffer in the same order"""
+        return self.buffer is not None and self.buffer.holds(self.points)
+
+    def _repack(self) -> None:
+        # keep buffer rows in the same order as points after reordering
+        if self.buffer is not None:
+            self.pack(self.buffer.array)
+
     def invert(self) -> "Face":
         """Reverses the order of points in this face."""
         self.points.reverse()
         self.edges.reverse()
         self.edges = [self.edges[i] for i in (1, 2, 3, 0)]
 
+        self._repack()
+
         return self
 
     def copy(self) -> "Face":
@@ -117,6 +143,9 @@ class Face(ElementBase):
     @property
     def point_array(self) -> NPPointListType:
         """A numpy array of this face's points"""
+        if self.buffer is not None and self.buffer.holds(self.points):
+            return self.buffer.array.copy()
+
         return np.array([p.position for p in self.points])
 
     @property
@@ -141,7 +170,12 @@ class Face(ElementBase):
 
     @property
     def parts(self):
-        return self.points + self.edges
+        if self.buffer is None:
+            return self.points + self.edges
+
+        # points that were replaced after packing are not in the buffer
+        loose = [point for point in self.points if point._buffer is not self.buffer]
+        return [self.buffer, *loose, *self.edges]
 
     def project(self, label: str, edges: bool = False, points: bool = False) -> None:
         """Project this face to given geometry;
@@ -177,6 +211,8 @@ class Face(ElementBase):
         self.points = [self.points[i] for i in indexes]
         self.edges = [self.edges[i] for i in indexes]
 
+        self._repack()
+
         return self
 
     def reorient(self, start_near: PointType) -> "Face":
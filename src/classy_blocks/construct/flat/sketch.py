@@ -2,9 +2,12 @@ import abc
 import copy
 from typing import ClassVar, List, TypeVar
 
+import numpy as np
+
 from classy_blocks.base.element import ElementBase
 from classy_blocks.construct.flat.face import Face
 from classy_blocks.types import NPPointType, NPVectorType
+from classy_blocks.util.constants import DTYPE
 
 SketchT = TypeVar("SketchT", bound="Sketch")
 
@@ -37,6 +40,17 @@ class Sketch(ElementBase):
         """Returns a copy of this sketch"""
         return copy.deepcopy(self)
 
+    def pack(self: SketchT) -> SketchT:
+        """Stores positions of all faces' points in a single
+        contiguous array; see Face.pack()"""
+        faces = self.faces
+        array = np.empty((4 * len(faces), 3), dtype=DTYPE)
+
+        for i, face in enumerate(faces):
+            face.pack(array[4 * i : 4 * (i + 1)])
+
+        return self
+
     @property
     @abc.abstractmethod
     def center(self) -> NPPointType:
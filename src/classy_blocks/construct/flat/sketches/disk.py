@@ -1,5 +1,6 @@
 import abc
-from typing import ClassVar, List, Optional
+import functools
+from typing import ClassVar, List, Optional, Tuple
 
 import numpy as np
 
@@ -19,6 +20,54 @@ from classy_blocks.types import (
 from classy_blocks.util import functions as f
 
 
+def get_spline_template(points: NPPointListType, p_0: NPPointType, p_1: NPPointType) -> NPPointListType:
+    """Expresses points (relative to origin) with coefficients
+    along two in-plane directions, defined by p_0 and p_1;
+    the first direction is p_0 itself and the second is the part of p_1 perpendicular to it.
+
+    The returned (N, 2) array is read-only so that it can be cached and shared."""
+    u_0 = p_0
+    u_1 = p_1 - np.dot(p_1, f.unit_vector(u_0)) * f.unit_vector(u_0)
+
+    d_0 = np.dot(points, f.unit_vector(u_0)) / f.norm(u_0)
+    d_1 = np.dot(points, f.unit_vector(u_1)) / f.norm(u_1)
+
+    template = np.stack((d_0, d_1), axis=1)
+    template.flags.writeable = False
+
+    return template
+
+
+def map_spline_template(
+    template: NPPointListType, p_0: PointType, p_1: PointType, center: PointType
+) -> NPPointListType:
+    """Maps coefficients from get_spline_template() to a plane,
+    defined by center and two points; the inverse of get_spline_template()"""
+    p_0 = np.asarray(p_0)
+    p_1 = np.asarray(p_1)
+    center = np.asarray(center)
+
+    u_0 = p_0 - center
+    u_1 = p_1 - center - np.dot(p_1 - center, f.unit_vector(u_0)) * f.unit_vector(u_0)
+
+    return center + template[:, :1] * u_0 + template[:, 1:] * u_1
+
+
+@functools.lru_cache(maxsize=None)
+def circular_core_template(spline_ratios: Tuple[float, ...]) -> NPPointListType:
+    """Spline points of an optimized core of a round mesh in unitary coordinates;
+    calculated once for each set of spline ratios and then mapped to actual sketches"""
+    spline_points_u = np.array([spline_ratios[-1:6:-1]]).T * np.array([0, 1, 0]) + np.array(
+        [spline_ratios[:7]]
+    ).T * np.array([0, 0, 1])
+
+    # p_1 and p_2 in unitary coordinates
+    p_0_u = np.array([0, 0.8, 0])
+    p_1_u = np.array([0, 6.10535e-01, 6.10535e-01])
+
+    return get_spline_template(spline_points_u, p_0_u, p_1_u)
+
+
 class FanPattern:
     """A helper class for calculation of cylinder points"""
 
@@ -30,7 +79,7 @@ class FanPattern:
         self.radius_vector = self.radius_point - self.center_point
 
     def get_outer_points(self, angles) -> NPPointListType:
-        return np.array([f.rotate(self.radius_point, a, self.normal, self.center_point) for a in angles])
+        return f.rotate(self.radius_point, angles, self.normal, self.center_point)
 
     def get_inner_points(self, angles, ratios: List[float]) -> NPPointListType:
         """Inner points are scaled back by defined ratios
@@ -95,37 +144,17 @@ class DiskBase(MappedSketch, abc.ABC):
         center: Optional[PointType] = None,
     ) -> NPPointListType:
         """Creates the spline points for the core."""
-        p_0 = np.asarray(p_core_ratio)
-        p_1 = np.asarray(p_diagonal_ratio)
         if center is None:
             center = self.center
 
-        # Spline points in unitary coordinates
-        spline_points_u = np.array([self.spline_ratios[-1:6:-1]]).T * np.array([0, 1, 0]) + np.array(
-            [self.spline_ratios[:7]]
-        ).T * np.array([0, 0, 1])
-
-        # p_1 and p_2 in unitary coordinates
-        p_0_u = np.array([0, 0.8, 0])
-        p_1_u = np.array([0, 6.10535e-01, 6.10535e-01])
-
-        # orthogonal vectors based on p_0_u and p_1_u
-        u_0_org = p_0_u
-        u_1_org = p_1_u - np.dot(p_1_u, f.unit_vector(u_0_org)) * f.unit_vector(u_0_org)
-
-        # Spline points in u_0_org and u_1_org
-        spline_d_0_org = np.dot(spline_points_u, f.unit_vector(u_0_org)).reshape((-1, 1)) / f.norm(u_0_org)
-        spline_d_1_org = np.dot(spline_points_u, f.unit_vector(u_1_org)).reshape((-1, 1)) / f.norm(u_1_org)
-
-        # New plane defined by new points
-        u_0 = p_0 - center
-        u_1 = p_1 - center - np.dot(p_1 - center, f.unit_vector(u_0)) * f.unit_vector(u_0)
+        spline_points = map_spline_template(
+            circular_core_template(tuple(self.spline_ratios)), p_core_ratio, p_diagonal_ratio, center
+        )
 
-        spline_points_new = center + spline_d_0_org * u_0 + spline_d_1_org * u_1
         if reverse:
-            return spline_points_new[::-1]
-        else:
-            return spline_points_new
+            return spline_points[::-1]
+
+        return spline_points
 
     def add_core_spline_edges(self) -> None:
         """Add a spline to the core blocks for an optimized mesh."""
@@ -1,6 +1,7 @@
 from typing import List, Union
 
 import numpy as np
+import scipy.spatial
 
 from classy_blocks.construct.flat.face import Face
 from classy_blocks.construct.flat.sketch import Sketch
@@ -25,10 +26,10 @@ class MappedSketch(Sketch):
 
     def update(self, positions: PointListType) -> None:
         """Update faces with updated positions"""
-        for i, quad in enumerate(self.indexes):
-            points = [positions[iq] for iq in quad]
+        quad_points = np.asarray(positions, dtype=constants.DTYPE)[np.asarray(self.indexes)]
 
-            self.faces[i].update(points)
+        for face, points in zip(self.faces, quad_points):
+            face.update(points)
 
     def add_edges(self) -> None:
         """An optional method that will add edges to faces;
@@ -53,11 +54,15 @@ class MappedSketch(Sketch):
     def positions(self) -> NPPointListType:
         """Reconstructs positions back from faces, so they are always up-to-date,
         even after transforms"""
-        indexes = list(np.array(self.indexes).flatten())
-        max_index = max(indexes)
-        all_points = f.flatten_2d_list([face.point_array.tolist() for face in self.faces])
+        indexes = np.asarray(self.indexes).flatten()
+        all_points = np.array([face.point_array for face in self.faces]).reshape((-1, 3))
 
-        return np.array([all_points[indexes.index(i)] for i in range(max_index + 1)])
+        # take each point from the first face that uses it
+        unique, first = np.unique(indexes, return_index=True)
+        positions = np.zeros((unique[-1] + 1, 3), dtype=constants.DTYPE)
+        positions[unique] = all_points[first]
+
+        return positions
 
     def merge(self, other: Union[List["MappedSketch"], "MappedSketch"]):
         """Adds a sketch or list of sketches to itself.
@@ -74,26 +79,22 @@ class MappedSketch(Sketch):
                     f"sketch {sketch_1} with normal {sketch_1.normal}"
                 )
 
-            # All unique points
+            # Points of sketch_2 that coincide with points of sketch_1
+            # are replaced by those; the rest are appended
             sketch_1_pos = sketch_1.positions
-            all_pos = np.asarray(
-                [
-                    *sketch_1_pos.tolist(),
-                    *[
-                        pos
-                        for pos in sketch_2.positions
-                        if all(np.linalg.norm(sketch_1_pos - pos.reshape((1, 3)), axis=1) >= constants.TOL)
-                    ],
-                ]
-            )
-
-            sketch_2_ind = np.asarray(sketch_2.indexes)
+            sketch_2_pos = sketch_2.positions
+
+            used = np.unique(sketch_2.indexes)
+
+            distances, nearest = scipy.spatial.cKDTree(sketch_1_pos).query(sketch_2_pos[used])
+            duplicated = distances < constants.TOL
+
+            index_map = np.zeros(len(sketch_2_pos), dtype=int)
+            index_map[used[duplicated]] = nearest[duplicated]
+            index_map[used[~duplicated]] = len(sketch_1_pos) + np.arange(np.count_nonzero(~duplicated))
+
             # Change sketch_2 indexes to new position list.
-            for i, face in enumerate(sketch_2.faces):
-                for j, pos in enumerate(face.point_array):
-                    sketch_2_ind[i, j] = np.argwhere(
-                        np.linalg.norm(all_pos - pos.reshape((1, 3)), axis=1) < constants.TOL
-                    )[0][0]
+            sketch_2_ind = index_map[np.asarray(sketch_2.indexes)]
 
             # Append indexes and faces to sketch_1
             sketch_1.indexes = [*list(sketch_1.indexes), *sketch_2_ind.tolist()]
@@ -1,14 +1,111 @@
-from typing import ClassVar, Optional
+import functools
+from typing import ClassVar, Optional, Tuple
 
 import numpy as np
 
 from classy_blocks.construct.edges import Origin, Spline
-from classy_blocks.construct.flat.sketches.disk import DiskBase, FourCoreDisk, HalfDisk, QuarterDisk
+from classy_blocks.construct.flat.sketches.disk import (
+    DiskBase,
+    FourCoreDisk,
+    HalfDisk,
+    QuarterDisk,
+    circular_core_template,
+    get_spline_template,
+    map_spline_template,
+)
 from classy_blocks.types import NPPointListType, NPPointType, NPVectorType, PointType
 from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 
 
+@functools.lru_cache(maxsize=None)
+def oval_core_template(
+    spline_ratios: Tuple[float, ...],
+    core_ratio: float,
+    diagonal_ratio: float,
+    side_1: float,
+    radius_2: float,
+    side_2: float,
+    n_straight_spline_points: int,
+    reverse: bool,
+) -> NPPointListType:
+    """Core spline points of an oval in unitary coordinates (radius_1 = 1);
+    see SplineRound.oval_core_spline()"""
+    radius_1 = 1
+
+    # Create unitary points of p_0 and p_1
+    r_1 = radius_1 - side_1
+    r_2 = radius_2 - side_2
+    p_0_u = np.array([0, side_1 + core_ratio * r_1, 0])
+    p_1_u = np.array([0, side_1 + 2 ** (-1 / 2) * diagonal_ratio * r_1, side_2 + 2 ** (-1 / 2) * diagonal_ratio * r_2])
+
+    # In case of oval shape the center and p_0 used to get the curvy spline are adjusted
+    center_u_adj = np.array([0, side_1, side_2])
+    p_0_u_adj = p_0_u + np.array([0, 0, side_2])
+    spline_points_u = map_spline_template(circular_core_template(spline_ratios), p_0_u_adj, p_1_u, center_u_adj)
+    if reverse:
+        spline_points_u = spline_points_u[::-1]
+
+    # Add straight part for ovals
+    if side_2 > constants.TOL:
+        if reverse:
+            side_points_u = np.linspace(
+                p_0_u_adj, p_0_u_adj - np.array([0, 0, 0.05 * side_2]), n_straight_spline_points
+            )
+            spline_points_u = np.append(spline_points_u, side_points_u, axis=0)
+        else:
+            side_points_u = np.linspace(
+                p_0_u_adj - np.array([0, 0, 0.05 * side_2]), p_0_u_adj, n_straight_spline_points
+            )
+            spline_points_u = np.insert(spline_points_u, 0, side_points_u, axis=0)
+
+    return get_spline_template(spline_points_u, p_0_u, p_1_u)
+
+
+@functools.lru_cache(maxsize=None)
+def outer_template(
+    side_1: float,
+    radius_2: float,
+    side_2: float,
+    n_outer_spline_points: int,
+    n_straight_spline_points: int,
+    reverse: bool,
+) -> NPPointListType:
+    """Outer spline points in unitary coordinates (radius_1 = 1);
+    see SplineRound.outer_spline()"""
+    radius_1 = 1
+
+    # Create unitary points of p_0 and p_1
+    r_1 = radius_1 - side_1
+    r_2 = radius_2 - side_2
+    p_0_u = np.array([0, radius_1, 0])
+    p_1_u = np.array([0, side_1 + 2 ** (-1 / 2) * r_1, side_2 + 2 ** (-1 / 2) * r_2])
+
+    p_0_u_adj = p_0_u + np.array([0, 0, side_2])
+    c_0_u_adj = np.array([0, side_1, side_2])
+
+    theta = np.linspace(0, np.pi / 4, n_outer_spline_points)
+    spline_points_u = c_0_u_adj + np.array([np.zeros(len(theta)), r_1 * np.cos(theta), r_2 * np.sin(theta)]).T
+
+    if reverse:
+        spline_points_u = spline_points_u[::-1]
+        # Add straight part for ovals
+        if side_2 > constants.TOL:
+            side_points_u = np.linspace(
+                p_0_u_adj, p_0_u_adj - np.array([0, 0, 0.05 * side_2]), n_straight_spline_points
+            )
+            spline_points_u = np.append(spline_points_u, side_points_u, axis=0)
+    else:
+        # Add straight part for ovals
+        if side_2 > constants.TOL:
+            side_points_u = np.linspace(
+                p_0_u_adj - np.array([0, 0, 0.05 * side_2]), p_0_u_adj, n_straight_spline_points
+            )
+            spline_points_u = np.insert(spline_points_u, 0, side_points_u, axis=0)
+
+    return get_spline_template(spline_points_u, p_0_u, p_1_u)
+
+
 class SplineRound(DiskBase):
     """
     Base class for spline round sketches.
@@ -54,49 +151,19 @@ class SplineRound(DiskBase):
         reverse: bool = False,
     ) -> NPPointListType:
         """Creates the spline points for the core."""
-        p_0 = np.asarray(p_core_ratio)
-        p_1 = np.asarray(p_diagonal_ratio)
-
-        # Create unitary points of p_0 and p_1
-        r_1 = radius_1 - side_1
-        r_2 = radius_2 - side_2
-        p_0_u = np.array([0, side_1 + self.core_ratio * r_1, 0])
-        p_1_u = np.array(
-            [0, side_1 + 2 ** (-1 / 2) * self.diagonal_ratio * r_1, side_2 + 2 ** (-1 / 2) * self.diagonal_ratio * r_2]
+        # the shape of the spline only depends on proportions
+        template = oval_core_template(
+            tuple(self.spline_ratios),
+            self.core_ratio,
+            self.diagonal_ratio,
+            side_1 / radius_1,
+            radius_2 / radius_1,
+            side_2 / radius_1,
+            self.n_straight_spline_points,
+            reverse,
         )
 
-        # In case of oval shape the center and p_0 used to get the curvy spline are adjusted
-        center_u_adj = np.array([0, side_1, side_2])
-        p_0_u_adj = p_0_u + np.array([0, 0, side_2])
-        spline_points_u = self.circular_core_spline(p_0_u_adj, p_1_u, center=center_u_adj, reverse=reverse)
-
-        # Add straight part for ovals
-        if side_2 > constants.TOL:
-            if reverse:
-                side_points_u = np.linspace(
-                    p_0_u_adj, p_0_u_adj - np.array([0, 0, 0.05 * side_2]), self.n_straight_spline_points
-                )
-                spline_points_u = np.append(spline_points_u, side_points_u, axis=0)
-            else:
-                side_points_u = np.linspace(
-                    p_0_u_adj - np.array([0, 0, 0.05 * side_2]), p_0_u_adj, self.n_straight_spline_points
-                )
-                spline_points_u = np.insert(spline_points_u, 0, side_points_u, axis=0)
-
-        # Orthogonal vectors based on p_0_u and p_1_u
-        u_0_org = p_0_u
-        u_1_org = p_1_u - np.dot(p_1_u, f.unit_vector(u_0_org)) * f.unit_vector(u_0_org)
-
-        # Spline points in u_0_org and u_1_org
-        spline_d_0_org = np.dot(spline_points_u, f.unit_vector(u_0_org)).reshape((-1, 1)) / f.norm(u_0_org)
-        spline_d_1_org = np.dot(spline_points_u, f.unit_vector(u_1_org)).reshape((-1, 1)) / f.norm(u_1_org)
-
-        # New plane defined by new points
-        u_0 = p_0 - self.center
-        u_1 = p_1 - self.center - np.dot(p_1 - self.center, f.unit_vector(u_0)) * f.unit_vector(u_0)
-
-        spline_points_new = self.center + spline_d_0_org * u_0 + spline_d_1_org * u_1
-        return spline_points_new
+        return map_spline_template(template, p_core_ratio, p_diagonal_ratio, self.center)
 
     def add_core_spline_edges(self) -> None:
         """Add a spline to the core blocks for an optimized mesh."""
@@ -135,52 +202,18 @@ class SplineRound(DiskBase):
         reverse: bool = False,
     ) -> NPPointListType:
         """Creates the spline points for the core."""
-        p_0 = np.asarray(p_radius)
-        p_1 = np.asarray(p_diagonal)
         center = self.origo if center is None else np.asarray(center)
 
-        # Create unitary points of p_0 and p_1
-        r_1 = radius_1 - side_1
-        r_2 = radius_2 - side_2
-        p_0_u = np.array([0, radius_1, 0])
-        p_1_u = np.array([0, side_1 + 2 ** (-1 / 2) * r_1, side_2 + 2 ** (-1 / 2) * r_2])
-
-        p_0_u_adj = p_0_u + np.array([0, 0, side_2])
-        c_0_u_adj = np.array([0, side_1, side_2])
-
-        theta = np.linspace(0, np.pi / 4, self.n_outer_spline_points)
-        spline_points_u = c_0_u_adj + np.array([np.zeros(len(theta)), r_1 * np.cos(theta), r_2 * np.sin(theta)]).T
+        template = outer_template(
+            side_1 / radius_1,
+            radius_2 / radius_1,
+            side_2 / radius_1,
+            self.n_outer_spline_points,
+            self.n_straight_spline_points,
+            reverse,
+        )
 
-        if reverse:
-            spline_points_u = spline_points_u[::-1]
-            # Add straight part for ovals
-            if side_2 > constants.TOL:
-                side_points_u = np.linspace(
-                    p_0_u_adj, p_0_u_adj - np.array([0, 0, 0.05 * side_2]), self.n_straight_spline_points
-                )
-                spline_points_u = np.append(spline_points_u, side_points_u, axis=0)
-        else:
-            # Add straight part for ovals
-            if side_2 > constants.TOL:
-                side_points_u = np.linspace(
-                    p_0_u_adj - np.array([0, 0, 0.05 * side_2]), p_0_u_adj, self.n_straight_spline_points
-                )
-                spline_points_u = np.insert(spline_points_u, 0, side_points_u, axis=0)
-
-        # Orthogonal vectors based on p_0_u and p_1_u
-        u_0_org = p_0_u
-        u_1_org = p_1_u - np.dot(p_1_u, f.unit_vector(u_0_org)) * f.unit_vector(u_0_org)
-
-        # Spline points in u_0_org and u_1_org
-        spline_d_0_org = np.dot(spline_points_u, f.unit_vector(u_0_org)).reshape((-1, 1)) / f.norm(u_0_org)
-        spline_d_1_org = np.dot(spline_points_u, f.unit_vector(u_1_org)).reshape((-1, 1)) / f.norm(u_1_org)
-
-        # New plane defined by new points
-        u_0 = p_0 - center
-        u_1 = p_1 - center - np.dot(p_1 - center, f.unit_vector(u_0)) * f.unit_vector(u_0)
-
-        spline_points_new = center + spline_d_0_org * u_0 + spline_d_1_org * u_1
-        return spline_points_new
+        return map_spline_template(template, p_radius, p_diagonal, center)
 
     def add_outer_spline_edges(self, center: Optional[NPPointType] = None) -> None:
         """Add curved edge as spline to outside of sketch"""
@@ -11,7 +11,16 @@ from classy_blocks.construct.edges import Arc, EdgeData, Line, Project, Spline
 from classy_blocks.construct.flat.face import Face
 from classy_blocks.construct.point import Point
 from classy_blocks.grading.chop import Chop
-from classy_blocks.types import ChopArgs, DirectionType, NPPointType, OrientType, PointType, ProjectToType, VectorType
+from classy_blocks.types import (
+    ChopArgs,
+    DirectionType,
+    NPPointListType,
+    NPPointType,
+    OrientType,
+    PointType,
+    ProjectToType,
+    VectorType,
+)
 from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 from classy_blocks.util.constants import SIDES_MAP
@@ -39,6 +48,13 @@ class Operation(ElementBase):
         # optionally, put the block in a cell zone
         self.cell_zone = ""
 
+    def __deepcopy__(self, memo):
+        # chops are not modified after creation; share them between copies
+        # but keep separate lists so that chopping a copy doesn't chop the original
+        memo[id(self.chops)] = {axis: list(chops) for axis, chops in self.chops.items()}
+
+        return super().__deepcopy__(memo)
+
     def _project_update(self, edge: EdgeData, label: ProjectToType):
         """Adds a label to a Project edge or creates a new Project edge and returns it"""
         if isinstance(edge, Project):
@@ -209,6 +225,17 @@ class Operation(ElementBase):
         """Returns a list of Point objects that define this Operation"""
         return self.bottom_face.points + self.top_face.points
 
+    def pack(self, array: Optional[NPPointListType] = None) -> "Operation":
+        """Stores positions of all 8 points in a single contiguous (8, 3) array
+        (optionally a provided one); see Face.pack()"""
+        if array is None:
+            array = np.empty((8, 3), dtype=constants.DTYPE)
+
+        self.bottom_face.pack(array[:4])
+        self.top_face.pack(array[4:])
+
+        return self
+
     @property
     def point_array(self) -> NPPointType:
         """Returns 8 points from which this operation is created"""
@@ -0,0 +1,127 @@
+"""Patterns of copies of the same entity, created on demand"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from classy_blocks.base import transforms as tr
+from classy_blocks.base.element import ElementBase
+from classy_blocks.construct.operations.operation import Operation
+from classy_blocks.construct.shape import Shape
+from classy_blocks.types import PointType, VectorType
+
+PatternTemplateType = Union[Operation, Shape]
+
+
+class Pattern(ElementBase):
+    """Copies of a template (an Operation or a Shape), each transformed
+    with its own list of transformations.
+
+    A pattern only holds a reference to the template and the transforms;
+    copies (instances) are created when they are first needed,
+    usually in Mesh.assemble(), and kept from then on. Changes made to the template
+    after that (like adding chops) are not propagated to instances
+    unless clear() is called.
+
+    Args:
+    - template: an operation or a shape to be copied; it is not added to mesh itself
+    - transforms: a list of transformations for each instance;
+        an empty list means an exact copy of the template"""
+
+    def __init__(self, template: PatternTemplateType, transforms: Sequence[Sequence[tr.Transformation]]):
+        self.template = template
+        self.transforms: List[List[tr.Transformation]] = [list(t7ms) for t7ms in transforms]
+
+        self._instances: Optional[List[PatternTemplateType]] = None
+
+    def add(self, transforms: Sequence[tr.Transformation]) -> None:
+        """Adds another instance to this pattern"""
+        self.transforms.append(list(transforms))
+
+        if self._instances is not None:
+            self._instances.append(self.create_instance(len(self.transforms) - 1))
+
+    def create_instance(self, index: int) -> PatternTemplateType:
+        """Returns a new transformed copy of the template"""
+        return self.template.copy().transform(self.transforms[index])
+
+    def clear(self) -> None:
+        """Discards created instances; the next time they are required,
+        they will be re-created from the current template"""
+        self._instances = None
+
+    @property
+    def is_materialized(self) -> bool:
+        """True if instances have already been created"""
+        return self._instances is not None
+
+    @property
+    def instances(self) -> List[PatternTemplateType]:
+        """Transformed copies of the template, created on first access"""
+        if self._instances is None:
+            self._instances = [self.create_instance(i) for i in range(len(self.transforms))]
+
+        return self._instances
+
+    @property
+    def operations(self) -> List[Operation]:
+        operations: List[Operation] = []
+
+        for instance in self.instances:
+            if isinstance(instance, Operation):
+                operations.append(instance)
+            else:
+                operations += instance.operations
+
+        return operations
+
+    @property
+    def parts(self):
+        # transforming a pattern transforms instances, not the template
+        return self.instances
+
+    @property
+    def center(self):
+        return np.average([instance.center for instance in self.instances], axis=0)
+
+    def __len__(self) -> int:
+        return len(self.transforms)
+
+
+class PolarPattern(Pattern):
+    """Copies of template, rotated around an axis.
+
+    Args:
+    - template: an operation or a shape to be copied
+    - count: number of instances, including the first, non-rotated one
+    - axis and origin: rotation axis and a point on it
+    - angle: angle between two consecutive instances;
+        by default, instances are evenly distributed around the full circle"""
+
+    def __init__(
+        self,
+        template: PatternTemplateType,
+        count: int,
+        axis: VectorType,
+        origin: PointType,
+        angle: Optional[float] = None,
+    ):
+        if angle is None:
+            angle = 2 * np.pi / count
+
+        super().__init__(template, [[tr.Rotation(axis, i * angle, origin)] if i > 0 else [] for i in range(count)])
+
+
+class LinearPattern(Pattern):
+    """Copies of template, translated by the same displacement
+    from one instance to the next.
+
+    Args:
+    - template: an operation or a shape to be copied
+    - count: number of instances, including the first, non-translated one
+    - displacement: translation vector between two consecutive instances"""
+
+    def __init__(self, template: PatternTemplateType, count: int, displacement: VectorType):
+        step = np.asarray(displacement)
+
+        super().__init__(template, [[tr.Translation(i * step)] if i > 0 else [] for i in range(count)])
@@ -1,15 +1,27 @@
-from typing import List, Optional, TypeVar
+import copy
+import itertools
+from typing import Hashable, List, Optional, TypeVar
 
 import numpy as np
 
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import PointCreationError
-from classy_blocks.types import NPVectorType, PointType, ProjectToType, VectorType
+from classy_blocks.types import NPPointListType, NPPointType, NPVectorType, PointType, ProjectToType, VectorType
 from classy_blocks.util import functions as f
 from classy_blocks.util.constants import DTYPE, TOL, vector_format
 
 PointT = TypeVar("PointT", bound="Point")
 
+# a global, monotonically increasing counter; every change of any point's
+# position draws a new number so that (version, version, ...) tuples
+# uniquely identify a geometric state and can be used as cache keys
+_versions = itertools.count()
+
+
+def next_version() -> int:
+    """Returns a new, never-before-used version number"""
+    return next(_versions)
+
 
 class Point(ElementBase):
     """A 3D point in space with optional projection
@@ -22,11 +34,53 @@ class Point(ElementBase):
 
         self.projected_to: List[str] = []
 
+    # a PointBuffer this point's position is a view into, if any
+    _buffer: Optional["PointBuffer"] = None
+
+    @property
+    def position(self) -> NPPointType:
+        return self._position
+
+    @position.setter
+    def position(self, position: NPPointType) -> None:
+        if self._buffer is None:
+            self._position = position
+        else:
+            # keep the view into buffer
+            self._position[:] = position
+
+        self._version = next_version()
+
+    @property
+    def version(self) -> Hashable:
+        """A number that changes whenever this point is moved;
+        modifying 'position' array in-place bypasses this mechanism
+        so use move_to() or transforms instead"""
+        if self._buffer is None:
+            return self._version
+
+        return (self._version, self._buffer.version)
+
+    def attach(self, buffer: "PointBuffer", index: int) -> None:
+        """Copies current position to buffer's row 'index'
+        and from then on keeps position as a view into that row"""
+        buffer.array[index] = self._position
+        self._position = buffer.array[index]
+        self._buffer = buffer
+
+    def detach(self) -> None:
+        """Makes position this point's own array again"""
+        if self._buffer is not None:
+            self._position = self._position.copy()
+            self._buffer = None
+
     def move_to(self, position: PointType) -> None:
         """Move this point to supplied position"""
-        self.position[0] = position[0]
-        self.position[1] = position[1]
-        self.position[2] = position[2]
+        self._position[0] = position[0]
+        self._position[1] = position[1]
+        self._position[2] = position[2]
+
+        self._version = next_version()
 
     def translate(self, displacement):
         """Move this point by 'displacement' vector"""
@@ -38,7 +92,7 @@ class Point(ElementBase):
         if origin is None:
             origin = f.vector(0, 0, 0)
 
-        self.position = f.rotate(self.position, angle, f.unit_vector(axis), origin)
+        self.position = f.rotate(self.position, angle, axis, origin)
         return self
 
     def scale(self, ratio, origin: Optional[PointType] = None):
@@ -59,18 +113,27 @@ class Point(ElementBase):
 
     def shear(self, normal: VectorType, origin: PointType, direction: VectorType, angle: float):
         """Move point along the plane, given by origin and normal"""
-        # if the point is on the plane, do nothing
-        normal = np.asarray(normal, dtype=DTYPE)
-        origin = np.asarray(origin, dtype=DTYPE)
+        self.position = f.shear(self.position, normal, origin, direction, angle)
+        return self
 
-        distance = f.point_to_plane_distance(origin, normal, self.position)
+    def __deepcopy__(self, memo):
+        # by far the most copied object; only position and labels are mutable
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
 
-        if distance > TOL:
-            direction = f.unit_vector(direction)
-            amount = distance / np.tan(angle)
+        clone.__dict__.update(self.__dict__)
+        clone._position = self._position.copy()
+        # a copied buffer re-attaches its points
+        clone._buffer = None
+        clone.projected_to = self.projected_to.copy()
 
-            self.position += direction * amount
-        return self
+        return clone
+
+    def get_coordinates(self) -> NPPointListType:
+        return self.position[np.newaxis]
+
+    def set_coordinates(self, coordinates: NPPointListType) -> None:
+        self.position = np.array(coordinates[0], dtype=DTYPE)
 
     def project(self, label: ProjectToType) -> None:
         """Project this vertex to a single or multiple geometries"""
@@ -102,6 +165,95 @@ class Point(ElementBase):
         return repr(self)
 
 
+class PointBuffer(ElementBase):
+    """A contiguous (N, 3) array that holds positions of given points;
+    their positions become views into rows of this array so
+    all of them can be read and transformed at once.
+
+    Args:
+    - points: points to attach; they must not be attached to another buffer
+    - array: an optional (N, 3) array to use as storage, for instance
+        a slice of a bigger buffer; by default a new one is created"""
+
+    def __init__(self, points: List[Point], array: Optional[NPPointListType] = None):
+        if array is None:
+            array = np.empty((len(points), 3), dtype=DTYPE)
+
+        if np.shape(array) != (len(points), 3):
+            raise PointCreationError(
+                "Buffer array must contain a row for each point", f"Points: {len(points)}, array: {np.shape(array)}"
+            )
+
+        self.array = array
+        self.points = points
+        self._version = next_version()
+
+        for i, point in enumerate(points):
+            point.attach(self, i)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever all points are moved at once"""
+        return self._version
+
+    def holds(self, points: List[Point]) -> bool:
+        """Returns True if given points are attached to this buffer
+        in the same order"""
+        if len(points) != len(self.points):
+            return False
+
+        return all(point is mine and point._buffer is self for point, mine in zip(points, self.points))
+
+    def get_coordinates(self) -> NPPointListType:
+        return self.array
+
+    def set_coordinates(self, coordinates: NPPointListType) -> None:
+        self.array[:] = coordinates
+        self._version = next_version()
+
+    def __deepcopy__(self, memo):
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+
+        clone.array = self._copy_array(memo)
+        clone._version = self._version
+        clone.points = [copy.deepcopy(point, memo) for point in self.points]
+
+        for i, point in enumerate(clone.points):
+            if self.points[i]._buffer is self:
+                point._position = clone.array[i]
+                point._buffer = clone
+
+        return clone
+
+    def _copy_array(self, memo) -> NPPointListType:
+        # when the array is a slice of a bigger buffer (a packed operation or shape),
+        # copy the bigger buffer once and take the same slice of it
+        # so that copies are packed in the same way
+        base = self.array.base
+        if not (
+            isinstance(base, np.ndarray)
+            and base.ndim == 2
+            and base.flags.c_contiguous
+            and self.array.flags.c_contiguous
+        ):
+            return self.array.copy()
+
+        if id(base) not in memo:
+            memo[id(base)] = base.copy()
+
+        start = (self.array.ctypes.data - base.ctypes.data) // base.strides[0]
+        return memo[id(base)][start : start + len(self.array)]
+
+    @property
+    def parts(self):
+        return [self]
+
+    @property
+    def center(self):
+        return np.average(self.array, axis=0)
+
+
 class Vector(Point):
     """An 'alias' to avoid confusion in mathematical lingo"""
 
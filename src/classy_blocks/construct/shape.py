@@ -13,6 +13,7 @@ from classy_blocks.construct.operations.loft import Loft
 from classy_blocks.construct.operations.operation import Operation
 from classy_blocks.types import DirectionType, NPPointType, VectorType
 from classy_blocks.util import functions as f
+from classy_blocks.util.constants import DTYPE
 
 ShapeT = TypeVar("ShapeT", bound="Shape")
 
@@ -30,6 +31,17 @@ class Shape(ElementBase, abc.ABC):
     def parts(self):
         return self.operations
 
+    def pack(self: ShapeT) -> ShapeT:
+        """Stores positions of all operations' points in a single
+        contiguous array; see Operation.pack()"""
+        operations = self.operations
+        array = np.empty((8 * len(operations), 3), dtype=DTYPE)
+
+        for i, operation in enumerate(operations):
+            operation.pack(array[8 * i : 8 * (i + 1)])
+
+        return self
+
     def set_cell_zone(self, cell_zone: str) -> None:
         """Sets cell zone for all blocks in this shape"""
         for operation in self.operations:
@@ -1,5 +1,5 @@
 import functools
-from typing import List
+from typing import List, Set, Tuple
 
 import numpy as np
 
@@ -10,6 +10,7 @@ from classy_blocks.construct.point import Point
 from classy_blocks.construct.shape import Shape
 from classy_blocks.types import NPPointType, NPVectorType
 from classy_blocks.util import functions as f
+from classy_blocks.util.spatial_hash import SpatialHash
 
 
 class SharedPoint:
@@ -21,17 +22,20 @@ class SharedPoint:
         self.faces: List[Face] = []
         self.indexes: List[int] = []
 
+        # (id(face), index) of added faces' points
+        self._added: Set[Tuple[int, int]] = set()
+
     def add(self, face: Face, index: int) -> None:
         """Adds an identifies face's point to the list of points at the same position"""
         if face.points[index] != self.point:
             raise PointNotCoincidentError
 
-        for i, this_face in enumerate(self.faces):
-            if this_face == face:
-                if index == self.indexes[i]:
-                    # don't add the same face twice
-                    return
+        key = (id(face), index)
+        if key in self._added:
+            # don't add the same face twice
+            return
 
+        self._added.add(key)
         self.faces.append(face)
         self.indexes.append(index)
 
@@ -56,14 +60,28 @@ class SharedPointStore:
     """A collection of shared points"""
 
     def __init__(self) -> None:
-        self.shared_points: List[SharedPoint] = []
+        self._shared_points: List[SharedPoint] = []
+        self._hash: SpatialHash[SharedPoint] = SpatialHash()
+
+    @property
+    def shared_points(self) -> List[SharedPoint]:
+        return self._shared_points
+
+    @shared_points.setter
+    def shared_points(self, shared_points: List[SharedPoint]) -> None:
+        self._shared_points = shared_points
+
+        self._hash.clear()
+        for shpoint in shared_points:
+            self._hash.add(shpoint.point.position, shpoint)
 
     def find_by_point(self, point: Point) -> SharedPoint:
-        for shpoint in self.shared_points:
-            if shpoint.point == point:
-                return shpoint
+        shpoint = self._hash.find(point.position)
+
+        if shpoint is None:
+            raise SharedPointNotFoundError
 
-        raise SharedPointNotFoundError
+        return shpoint
 
     def add_from_face(self, face: Face, index: int) -> SharedPoint:
         """Returns a shared point at specified location or creates a new one there"""
@@ -73,7 +91,8 @@ class SharedPointStore:
             shpoint = self.find_by_point(point)
         except SharedPointNotFoundError:
             shpoint = SharedPoint(point)
-            self.shared_points.append(shpoint)
+            self._shared_points.append(shpoint)
+            self._hash.add(point.position, shpoint)
 
         shpoint.add(face, index)
 
@@ -9,6 +9,7 @@ from classy_blocks.construct.operations.operation import Operation
 from classy_blocks.construct.shape import LoftedShape
 from classy_blocks.types import DirectionType, PointType, VectorType
 from classy_blocks.util import functions as f
+from classy_blocks.util.constants import DTYPE
 
 
 class Stack(ElementBase):
@@ -50,6 +51,17 @@ class Stack(ElementBase):
 
         return operations
 
+    def pack(self) -> "Stack":
+        """Stores positions of all operations' points in a single
+        contiguous array; see Operation.pack()"""
+        operations = self.operations
+        array = np.empty((8 * len(operations), 3), dtype=DTYPE)
+
+        for i, operation in enumerate(operations):
+            operation.pack(array[8 * i : 8 * (i + 1)])
+
+        return self
+
     def chop(self, **kwargs) -> None:
         """Adds a chop in lofted/extruded/revolved direction to one operation
         in each shape in the stack."""
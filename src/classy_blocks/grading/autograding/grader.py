@@ -1,10 +1,58 @@
 import abc
-from typing import get_args
+import concurrent.futures
+import os
+import warnings
+from typing import Dict, List, Optional, Set, Tuple, get_args
+
+import numpy as np
 
 from classy_blocks.grading.autograding.params import ChopParams, FixedCountParams, HighReChopParams, SimpleChopParams
 from classy_blocks.grading.autograding.probe import Probe, Row
+from classy_blocks.grading.chop import Chop
+from classy_blocks.items.wires.wire import Wire
 from classy_blocks.mesh import Mesh
 from classy_blocks.types import ChopTakeType, DirectionType
+from classy_blocks.util import constants
+
+# a wire to be graded and the count it must obey
+GradingTaskType = Tuple[Wire, int]
+
+
+def get_levels(tasks: List[GradingTaskType]) -> List[int]:
+    """Assigns a level to each task so that all tasks on the same level
+    can be evaluated at once and applied in order afterwards, with
+    exactly the same result as if they were processed one by one.
+
+    A task reads gradings of inline wires (before/after) and writes
+    gradings of its wire and its coincidents; a task that reads what an earlier task
+    writes must go to a later level and a task that writes what an
+    earlier task reads must not go to a sooner level."""
+    writers: Dict[Wire, int] = {}
+    readers: Dict[Wire, List[int]] = {}
+    levels: List[int] = []
+
+    for i, (wire, _) in enumerate(tasks):
+        reads = {joint.wire for joint in wire.before} | {joint.wire for joint in wire.after}
+        writes = {wire, *wire.coincidents}
+
+        level = 0
+
+        for read in reads:
+            if read in writers:
+                level = max(level, levels[writers[read]] + 1)
+
+        for write in writes:
+            for reader in readers.get(write, []):
+                level = max(level, levels[reader])
+
+        levels.append(level)
+
+        for write in writes:
+            writers[write] = i
+        for read in reads:
+            readers.setdefault(read, []).append(i)
+
+    return levels
 
 
 class GraderBase(abc.ABC):
@@ -28,8 +76,10 @@ class GraderBase(abc.ABC):
 
         return count
 
-    def grade_axis(self, axis: DirectionType, take: ChopTakeType, stage: int) -> None:
-        handled_wires = set()
+    def get_tasks(self, axis: DirectionType, take: ChopTakeType) -> List[GradingTaskType]:
+        """Returns wires to be graded in given axis, in the order of processing"""
+        tasks: List[GradingTaskType] = []
+        handled_wires: Set[Wire] = set()
 
         for row in self.probe.get_rows(axis):
             count = self.get_count(row, take)
@@ -44,24 +94,73 @@ class GraderBase(abc.ABC):
                 #    # TODO: test
                 #    continue
 
-                size_before = wire.size_before
-                size_after = wire.size_after
+                tasks.append((wire, count))
 
-                chops = self.params.get_chops(stage, count, wire.length, size_before, size_after)
+                handled_wires.add(wire)
+                handled_wires.update(wire.coincidents)
 
-                wire.grading.clear()
-                for chop in chops:
-                    wire.grading.add_chop(chop)
+        return tasks
 
-                wire.copy_to_coincidents()
+    @staticmethod
+    def apply_chops(wire: Wire, chops: List[Chop]) -> None:
+        wire.grading.clear()
+        for chop in chops:
+            wire.grading.add_chop(chop)
 
-                handled_wires.add(wire)
-                handled_wires.update(wire.coincidents)
+        wire.copy_to_coincidents()
+
+    def grade_axis(
+        self,
+        axis: DirectionType,
+        take: ChopTakeType,
+        stage: int,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        tasks = self.get_tasks(axis, take)
+
+        if executor is None:
+            for wire, count in tasks:
+                chops = self.params.get_chops(stage, count, wire.length, wire.size_before, wire.size_after)
+                self.apply_chops(wire, chops)
+            return
+
+        # wires that don't depend on each other are evaluated in parallel, level by level;
+        # results are applied in the same order as in serial grading
+        levels = get_levels(tasks)
+        leveled_tasks: List[List[GradingTaskType]] = [[] for _ in range(max(levels, default=-1) + 1)]
 
-    def grade(self, take: ChopTakeType = "avg") -> None:
+        for i, task in enumerate(tasks):
+            leveled_tasks[levels[i]].append(task)
+
+        for level_tasks in leveled_tasks:
+            # gather all inputs before any of the results are applied
+            wires = [task[0] for task in level_tasks]
+            results = executor.map(
+                self.params.get_chops,
+                [stage] * len(level_tasks),
+                [task[1] for task in level_tasks],
+                [wire.length for wire in wires],
+                [wire.size_before for wire in wires],
+                [wire.size_after for wire in wires],
+                chunksize=max(1, len(level_tasks) // (4 * (os.cpu_count() or 1))),
+            )
+
+            for wire, chops in zip(wires, results):
+                self.apply_chops(wire, chops)
+
+    def grade(self, take: ChopTakeType = "avg", workers: int = 1) -> None:
+        """Grades all wires of the mesh; with workers > 1, chops of independent
+        wires are calculated in a process pool. The result is the same either way."""
+        if workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                self._grade(take, executor)
+        else:
+            self._grade(take, None)
+
+    def _grade(self, take: ChopTakeType, executor: Optional[concurrent.futures.Executor]) -> None:
         for axis in get_args(DirectionType):
             for stage in range(self.stages):
-                self.grade_axis(axis, take, stage)
+                self.grade_axis(axis, take, stage, executor)
 
 
 class FixedCountGrader(GraderBase):
@@ -85,6 +184,97 @@ class SimpleGrader(GraderBase):
         super().__init__(mesh, SimpleChopParams(cell_size))
 
 
+class TargetCountGrader(GraderBase):
+    """Simple mesh grading (see SimpleGrader) with cell size chosen so that
+    total cell count will be as close as possible to, but not more than, target_count.
+
+    Cell size is found by bisection where only cell counts are evaluated;
+    the mesh is graded only once, with the final cell size."""
+
+    stages = 1
+
+    def __init__(self, mesh: Mesh, target_count: int):
+        self.target_count = target_count
+        self.size_params = SimpleChopParams(1)
+
+        super().__init__(mesh, self.size_params)
+
+    def get_total_count(self, cell_size: float, take: ChopTakeType = "avg") -> int:
+        """Returns the total number of cells that would be obtained with given cell size"""
+        lengths, fixed_counts, block_rows = self._get_count_data(take)
+
+        return self._count(cell_size, lengths, fixed_counts, block_rows)
+
+    def get_cell_size(self, take: ChopTakeType = "avg") -> float:
+        """Finds the smallest cell size that doesn't exceed target cell count"""
+        lengths, fixed_counts, block_rows = self._get_count_data(take)
+
+        if np.all(fixed_counts > 0):
+            # cell size has no influence on count
+            return self.size_params.cell_size
+
+        # the coarsest possible mesh: a single cell in each row
+        high = float(np.max(lengths))
+        if self._count(high, lengths, fixed_counts, block_rows) > self.target_count:
+            warnings.warn(f"Target cell count {self.target_count} is too low for this blocking", stacklevel=2)
+            return high
+
+        low = high / 2
+        while self._count(low, lengths, fixed_counts, block_rows) <= self.target_count:
+            low /= 2
+
+        # total count is a non-increasing step function of cell size;
+        # bisect (in log space) for the smallest size that still stays within budget
+        for _ in range(100):
+            if high / low - 1 < constants.TOL:
+                break
+
+            middle = (low * high) ** 0.5
+
+            if self._count(middle, lengths, fixed_counts, block_rows) > self.target_count:
+                low = middle
+            else:
+                high = middle
+
+        return high
+
+    def _get_count_data(self, take: ChopTakeType) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collects data for quick cell count evaluation:
+        lengths and fixed counts (0 for undefined) of all rows and
+        indexes of rows that each block's axes belong to"""
+        lengths: List[float] = []
+        fixed_counts: List[int] = []
+        block_rows = np.zeros((len(self.mesh.blocks), 3), dtype=int)
+
+        for axis in get_args(DirectionType):
+            for row in self.probe.get_rows(axis):
+                count = row.get_count()
+
+                if count is None:
+                    lengths.append(row.get_length(take))
+                    fixed_counts.append(0)
+                else:
+                    lengths.append(0)
+                    fixed_counts.append(count)
+
+                for i, block in enumerate(row.blocks):
+                    block_rows[block.index][row.headings[i]] = len(lengths) - 1
+
+        return np.array(lengths), np.array(fixed_counts), block_rows
+
+    @staticmethod
+    def _count(cell_size: float, lengths: np.ndarray, fixed_counts: np.ndarray, block_rows: np.ndarray) -> int:
+        # the same as SimpleChopParams.get_count() but a Chop never has less than 1 cell
+        counts = np.where(fixed_counts > 0, fixed_counts, np.maximum(1, np.floor(lengths / cell_size)))
+
+        return int(np.sum(np.prod(counts[block_rows], axis=1)))
+
+    def grade(self, take: ChopTakeType = "avg", workers: int = 1) -> None:
+        self.size_params.cell_size = self.get_cell_size(take)
+
+        super().grade(take, workers)
+
+
 class HighReGrader(GraderBase):
     """Parameters for mesh grading for high-Re cases.
     Two chops are added to all blocks; c2c_expansion and and length_ratio
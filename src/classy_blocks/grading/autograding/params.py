@@ -1,16 +1,22 @@
 import abc
 import dataclasses
+import functools
 import warnings
 from typing import List, Optional, Tuple
 
-import scipy.optimize
+import numpy as np
 
 import classy_blocks.grading.relations as gr
 from classy_blocks.grading.chop import Chop
-from classy_blocks.types import ChopTakeType
+from classy_blocks.types import ChopTakeType, FloatListType
+from classy_blocks.util import constants
 
 CellSizeType = Optional[float]
 
+# limits for length ratio of the first of the two HighRe chops
+MIN_LENGTH_RATIO = 0.1
+MAX_LENGTH_RATIO = 0.9
+
 
 def sum_length(start_size: float, count: int, c2c_expansion: float) -> float:
     """Returns absolute length of the chop"""
@@ -24,6 +30,63 @@ def sum_length(start_size: float, count: int, c2c_expansion: float) -> float:
     return length
 
 
+def get_series_length(first_size: FloatListType, last_size: FloatListType, count: FloatListType) -> FloatListType:
+    """Returns length of geometrically graded cells with given first and last size (count >= 2)"""
+    log_c2c = np.log(last_size / first_size) / (count - 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # expm1() keeps precision when c2c_expansion is close to 1
+        length = first_size * np.expm1(count * log_c2c) / np.expm1(log_c2c)
+
+    return np.where(np.abs(log_c2c) > constants.TOL, length, first_size * count)
+
+
+def get_length_ratios(
+    counts: FloatListType, lengths: FloatListType, sizes_before: FloatListType, sizes_after: FloatListType
+) -> FloatListType:
+    """A batch version of get_length_ratio(); all arguments are arrays of the same length."""
+    counts = np.asarray(counts, dtype=float)
+    lengths = np.asarray(lengths, dtype=float)
+    sizes_before = np.asarray(sizes_before, dtype=float)
+    sizes_after = np.asarray(sizes_after, dtype=float)
+
+    valid = counts > 1
+    counts = np.maximum(counts, 2)
+
+    # total length of both chops only increases with the size of the middle cell;
+    # bisect for it in log space, all problems at once
+    log_low = np.log(lengths * constants.TOL)
+    log_high = np.log(lengths)
+
+    for _ in range(64):
+        log_middle = (log_low + log_high) / 2
+        middle_size = np.exp(log_middle)
+
+        total_length = get_series_length(sizes_before, middle_size, counts) + get_series_length(
+            sizes_after, middle_size, counts
+        )
+
+        too_short = total_length < lengths
+        log_low = np.where(too_short, log_middle, log_low)
+        log_high = np.where(too_short, log_high, log_middle)
+
+    middle_size = np.exp((log_low + log_high) / 2)
+    ratios = get_series_length(sizes_before, middle_size, counts) / lengths
+
+    return np.where(valid, np.clip(ratios, MIN_LENGTH_RATIO, MAX_LENGTH_RATIO), 0.5)
+
+
+@functools.lru_cache(maxsize=10000)
+def get_length_ratio(count: int, length: float, size_before: float, size_after: float) -> float:
+    """Returns length ratio of the first of two chops with 'count' cells each,
+    the first starting with size_before and the second ending with size_after,
+    so that the two cells in the middle (the last of the first and the first of the second chop)
+    are of the same size."""
+    ratios = get_length_ratios(np.array([count]), np.array([length]), np.array([size_before]), np.array([size_after]))
+
+    return float(ratios[0])
+
+
 class ChopParams(abc.ABC):
     @abc.abstractmethod
     def get_count(self, length: float) -> int:
@@ -115,23 +178,12 @@ class HighReChopParams(ChopParams):
 
         # choose length ratio so that cells at the middle of blocks
         # (between the two chops) have the same size
-        def fobj(lratio):
-            chop_1 = Chop(length_ratio=lratio, count=halfcount, start_size=size_before)
-            data_1 = chop_1.calculate(length)
+        lratio = get_length_ratio(halfcount, length, size_before, size_after)
 
-            chop_2 = Chop(length_ratio=1 - lratio, count=halfcount, end_size=size_after)
-            data_2 = chop_2.calculate(length)
-
-            ratio = abs(data_1.end_size - data_2.start_size)
-
-            return ratio, [chop_1, chop_2]
-
-        # it's not terribly important to minimize until the last dx
-        results = scipy.optimize.minimize_scalar(lambda r: fobj(r)[0], bounds=[0.1, 0.9], options={"xatol": 0.1})
-        if not results.success:  # type:ignore
-            warnings.warn("Could not determine optimal grading", stacklevel=1)
-
-        return fobj(results.x)[1]  # type:ignore
+        return [
+            Chop(length_ratio=lratio, count=halfcount, start_size=size_before),
+            Chop(length_ratio=1 - lratio, count=halfcount, end_size=size_after),
+        ]
 
 
 # INVALID! Next on list
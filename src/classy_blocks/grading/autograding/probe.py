@@ -135,8 +135,11 @@ class Catalogue:
 
         block = instruction.block
 
-        for neighbour_axis in block.axes[direction].neighbours:
-            neighbour_block = get_block_from_axis(self.mesh, neighbour_axis)
+        # traverse neighbours in a deterministic order so that rows are always the same
+        neighbours = [(get_block_from_axis(self.mesh, axis), axis) for axis in block.axes[direction].neighbours]
+        neighbours.sort(key=lambda pair: (pair[0].index, pair[0].get_axis_direction(pair[1])))
+
+        for neighbour_block, neighbour_axis in neighbours:
 
             if neighbour_block in row.blocks:
                 continue
@@ -1,4 +1,4 @@
-""" In theory, combination of three of these 6 values can be specified:
+"""In theory, combination of three of these 6 values can be specified:
  - Total length
  - Number of cells
  - Total expansion ratio
@@ -32,19 +32,46 @@ division: an entry in simpleGrading specification in blockMeshDict
 
 calculations meticulously transcribed from the blockmesh grading calculator:
 https://gitlab.com/herpes-free-engineer-hpe/blockmeshgradingweb/-/blob/master/calcBlockMeshGrading.coffee
-(since block length is always known, there's less wrestling but the calculation principle is similar) """
+(since block length is always known, there's less wrestling but the calculation principle is similar)"""
 
 import dataclasses
 import math
 import warnings
 from typing import List
 
+import numpy as np
+
 from classy_blocks.base.exceptions import UndefinedGradingsError
 from classy_blocks.grading.chop import Chop, ChopData
-from classy_blocks.types import GradingSpecType
+from classy_blocks.types import FloatListType, GradingSpecType
 from classy_blocks.util import constants
 
 
+def format_specification(specification: List[GradingSpecType]) -> str:
+    """Formats a grading specification for simple/edgeGrading in blockMeshDict"""
+    if len(specification) == 1:
+        # its a one-number simpleGrading:
+        return str(specification[0][2])
+
+    # multi-grading: make a nice list
+    return "(" + "".join(f"({spec[0]} {spec[1]} {spec[2]})" for spec in specification) + ")"
+
+
+def is_same_specification(this_spec: List[GradingSpecType], other_spec: List[GradingSpecType]) -> bool:
+    """Compares two grading specifications number by number"""
+    # this works theoretically but numerics will probably ruin the party:
+    # return this_spec == other_spec
+    if len(this_spec) != len(other_spec):
+        return False
+
+    for this, other in zip(this_spec, other_spec):
+        for this_value, other_value in zip(this, other):
+            if not math.isclose(this_value, other_value, rel_tol=constants.TOL):
+                return False
+
+    return True
+
+
 class Grading:
     """Grading specification for a single edge"""
 
@@ -153,46 +180,48 @@ class Grading:
         if not self.is_defined:
             raise UndefinedGradingsError(f"Grading not defined: {self}")
 
-        if len(self.specification) == 1:
-            # its a one-number simpleGrading:
-            return str(self.specification[0][2])
+        specification = self.specification
 
-        # multi-grading: make a nice list
-        # FIXME: make a nicer list
-        length_ratio_sum = 0.0
-        out = "("
+        if len(specification) > 1:
+            length_ratio_sum = sum((spec[0] for spec in specification), 0.0)
 
-        for spec in self.specification:
-            out += f"({spec[0]} {spec[1]} {spec[2]})"
-            length_ratio_sum += spec[0]
+            if not math.isclose(length_ratio_sum, 1, rel_tol=constants.TOL):
+                warnings.warn(f"Length ratio doesn't add up to 1: {length_ratio_sum}", stacklevel=2)
 
-        out += ")"
+        return format_specification(specification)
 
-        if not math.isclose(length_ratio_sum, 1, rel_tol=constants.TOL):
-            warnings.warn(f"Length ratio doesn't add up to 1: {length_ratio_sum}", stacklevel=2)
+    @property
+    def divisions(self) -> FloatListType:
+        """Relative positions (0...1) of all cell boundaries along the edge,
+        calculated from specification the same way as blockMesh does"""
+        if not self.is_defined:
+            raise UndefinedGradingsError(f"Grading not defined: {self}")
 
-        return out
+        specification = self.specification
+        length_ratio_sum = sum(spec[0] for spec in specification)
 
-    def __eq__(self, other_grading):
-        # this works theoretically but numerics will probably ruin the party:
-        # return self.specification == other.specification
-        this_spec = self.get_specification(False)
-        other_spec = other_grading.get_specification(False)
+        divisions = [np.zeros(1)]
+        start = 0.0
+
+        for length_ratio, count, total_expansion in specification:
+            length_ratio /= length_ratio_sum
 
-        if len(this_spec) != len(other_spec):
-            return False
+            if count > 1 and not math.isclose(total_expansion, 1, rel_tol=constants.TOL):
+                c2c_expansion = total_expansion ** (1 / (count - 1))
+                section = (1 - c2c_expansion ** np.arange(1, count + 1)) / (1 - c2c_expansion**count)
+            else:
+                section = np.arange(1, count + 1) / count
 
-        # so just compare number-by-number
-        for i, this in enumerate(this_spec):
-            other = other_spec[i]
+            divisions.append(start + length_ratio * section)
+            start += length_ratio
 
-            for j, this_value in enumerate(this):
-                other_value = other[j]
+        result = np.concatenate(divisions)
+        result[-1] = 1
 
-                if not math.isclose(this_value, other_value, rel_tol=constants.TOL):
-                    return False
+        return result
 
-        return True
+    def __eq__(self, other_grading):
+        return is_same_specification(self.get_specification(False), other_grading.get_specification(False))
 
     def __repr__(self) -> str:
         if self.is_defined:
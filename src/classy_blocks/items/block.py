@@ -1,4 +1,6 @@
-from typing import List, get_args
+from typing import List, Sequence, get_args
+
+import numpy as np
 
 from classy_blocks.grading.chop import Chop
 from classy_blocks.items.edges.edge import Edge
@@ -10,6 +12,25 @@ from classy_blocks.util import constants
 from classy_blocks.util.frame import Frame
 
 
+def format_grading(descriptions: List[str], simple: bool) -> str:
+    """Returns the simple/edgeGrading string from formatted gradings of each axis"""
+    keyword = "simpleGrading" if simple else "edgeGrading"
+
+    return f"{keyword} ( " + " ".join(descriptions) + " )"
+
+
+def format_hex(
+    index: int, indexes: Sequence[int], cell_zone: str, counts: Sequence[int], grading: str, comment: str
+) -> str:
+    """hex definition for blockMesh from plain data; used by Block.description
+    and for formatting many blocks in parallel (util/parallel_format.py)"""
+    fmt_vertices = "( " + " ".join(str(vertex_index) for vertex_index in indexes) + " )"
+    fmt_count = "( " + " ".join([str(count) for count in counts]) + " )"
+    fmt_comments = f"// {index} {comment}\n"
+
+    return f"\thex {fmt_vertices} {cell_zone} {fmt_count} {grading} {fmt_comments}"
+
+
 class Block:
     """A Block and everything that belongs to it"""
 
@@ -64,16 +85,44 @@ class Block:
         if candidate == self:
             return
 
-        # axes
+        # inline wires must have at least one common vertex and coincident wires both;
+        # other wires need not be compared at all
+        common = {vertex.index for vertex in self.vertices}.intersection(v.index for v in candidate.vertices)
+        if len(common) == 0:
+            return
+
+        def count_common(wire: Wire) -> int:
+            return (wire.vertices[0].index in common) + (wire.vertices[1].index in common)
+
+        # candidate's wires that touch common vertices, by direction, and those that lie on them
+        touching: List[List[Wire]] = [[], [], []]
+        shared: List[Wire] = []
+
+        for wire in candidate.wire_list:
+            count = count_common(wire)
+
+            if count > 0:
+                touching[wire.direction].append(wire)
+            if count == 2:
+                shared.append(wire)
+
         for this_axis in self.axes:
-            for cnd_axis in candidate.axes:
-                this_axis.add_neighbour(cnd_axis)
-                this_axis.add_sequential(cnd_axis)
+            for this_wire in this_axis.wires:
+                count = count_common(this_wire)
+
+                if count == 0:
+                    continue
+
+                for cnd_wire in touching[this_wire.direction]:
+                    this_wire.add_inline(cnd_wire)
 
-        # wires
-        for this_wire in self.wire_list:
-            for cnd_wire in candidate.wire_list:
-                this_wire.add_coincident(cnd_wire)
+                if count < 2:
+                    continue
+
+                for cnd_wire in shared:
+                    if this_wire.is_coincident(cnd_wire):
+                        this_wire.coincidents.add(cnd_wire)
+                        this_axis.neighbours.add(candidate.axes[cnd_wire.direction])
 
     def add_chops(self, direction: DirectionType, chops: List[Chop]) -> None:
         self.axes[direction].chops += chops
@@ -113,6 +162,72 @@ class Block:
         for axis in self.axes:
             axis.check_consistency()
 
+    @property
+    def cell_count(self) -> int:
+        """Number of cells in this block; zero if any of the axes is not defined yet"""
+        return self.axes[0].count * self.axes[1].count * self.axes[2].count
+
+    def get_points(self) -> np.ndarray:
+        """Positions of all points of this block's cells, obtained by
+        transfinite interpolation from graded edges. Returns an array of shape
+        (count_0 + 1, count_1 + 1, count_2 + 1, 3), indexed by block-local (i, j, k).
+        Gradings must be defined first (see BlockList.assemble())"""
+        directions = get_args(DirectionType)
+
+        def spread(values: np.ndarray, direction: int) -> np.ndarray:
+            """Reshapes a list of values along given direction
+            so that it broadcasts over the whole block"""
+            shape = [1, 1, 1, *np.shape(values)[1:]]
+            shape[direction] = len(values)
+
+            return np.reshape(values, shape)
+
+        def weight(corner: int, params: Sequence[np.ndarray], weight_directions: Sequence[int]) -> np.ndarray:
+            """Interpolation weight of given corner (or an edge, starting in that corner)"""
+            result = np.ones(1)
+
+            for direction in weight_directions:
+                if constants.CORNER_IJK[corner][direction]:
+                    result = result * params[direction]
+                else:
+                    result = result * (1 - params[direction])
+
+            return result
+
+        wires = [self.get_axis_wires(direction) for direction in directions]
+        divisions = [[wire.grading.divisions for wire in wires[direction]] for direction in directions]
+        averages = [spread(np.average(divisions[direction], axis=0), direction) for direction in directions]
+
+        # parameters of each point along each axis: a blend of
+        # divisions of four wires, weighted by their distance to the point
+        params: List[np.ndarray] = []
+        for direction in directions:
+            others = [other for other in directions if other != direction]
+            param = np.zeros(1)
+
+            for i, wire in enumerate(wires[direction]):
+                param = param + weight(wire.corners[0], averages, others) * spread(divisions[direction][i], direction)
+
+            params.append(param)
+
+        # edge-based transfinite interpolation:
+        # a sum of interpolations between opposite edges in each direction, minus
+        # two trilinear interpolations between corners that are included twice too many
+        points = np.zeros((*params[0].shape, 3))
+
+        for direction in directions:
+            others = [other for other in directions if other != direction]
+
+            for wire in wires[direction]:
+                points += weight(wire.corners[0], params, others)[..., np.newaxis] * spread(
+                    wire.get_points(), direction
+                )
+
+        for corner, vertex in enumerate(self.vertices):
+            points -= 2 * weight(corner, params, directions)[..., np.newaxis] * vertex.position
+
+        return points
+
     @property
     def indexes(self) -> IndexType:
         return [vertex.index for vertex in self.vertices]
@@ -120,36 +235,21 @@ class Block:
     def format_grading(self) -> str:
         """Returns the simple/edgeGrading string"""
         if all(axis.is_simple for axis in self.axes):  # is_simple
-            return (
-                "simpleGrading ( "
-                + self.axes[0].wires.format_single()
-                + " "
-                + self.axes[1].wires.format_single()
-                + " "
-                + self.axes[2].wires.format_single()
-                + " )"
-            )
-        else:
-            return (
-                "edgeGrading ( "
-                + self.axes[0].wires.format_all()
-                + " "
-                + self.axes[1].wires.format_all()
-                + " "
-                + self.axes[2].wires.format_all()
-                + " )"
-            )
+            return format_grading([axis.wires.format_single() for axis in self.axes], True)
+
+        return format_grading([axis.wires.format_all() for axis in self.axes], False)
 
     @property
     def description(self) -> str:
         """hex definition for blockMesh"""
-        fmt_vertices = "( " + " ".join(str(v.index) for v in self.vertices) + " )"
-        fmt_count = "( " + " ".join([str(axis.count) for axis in self.axes]) + " )"
-
-        fmt_grading = self.format_grading()
-        fmt_comments = f"// {self.index} {self.comment}\n"
-
-        return f"\thex {fmt_vertices} {self.cell_zone} {fmt_count} {fmt_grading} {fmt_comments}"
+        return format_hex(
+            self.index,
+            self.indexes,
+            self.cell_zone,
+            [axis.count for axis in self.axes],
+            self.format_grading(),
+            self.comment,
+        )
 
     def __hash__(self) -> int:
         return self.index
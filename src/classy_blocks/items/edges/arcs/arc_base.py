@@ -18,13 +18,20 @@ class ArcEdgeBase(Edge, abc.ABC):
     def third_point(self) -> Point:
         """The third point that defines the arc, regardless of how it was specified"""
 
-    @property
-    def length(self) -> float:
+    def calculate_length(self) -> float:
         if self.is_valid:
             return f.arc_length_3point(self.vertex_1.position, self.third_point.position, self.vertex_2.position)
 
         return f.norm(self.vertex_1.position - self.vertex_2.position)
 
+    def get_points(self, fractions):
+        if self.is_valid:
+            return f.divide_arc_3point(
+                self.vertex_1.position, self.third_point.position, self.vertex_2.position, fractions
+            )
+
+        return super().get_points(fractions)
+
     @property
     def description(self):
         # it's always 'arc' for arc edges
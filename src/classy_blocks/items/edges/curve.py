@@ -1,5 +1,6 @@
 import abc
 import dataclasses
+from typing import Hashable, Optional, Tuple
 
 import numpy as np
 
@@ -7,7 +8,8 @@ from classy_blocks.construct import edges
 from classy_blocks.construct.curves.discrete import DiscreteCurve
 from classy_blocks.items.edges.edge import Edge
 from classy_blocks.types import EdgeKindType, NPPointListType
-from classy_blocks.util.constants import vector_format
+from classy_blocks.util import functions as f
+from classy_blocks.util.constants import vector_list_format
 
 
 class CurveEdgeBase(Edge, abc.ABC):
@@ -29,10 +31,23 @@ class CurveEdgeBase(Edge, abc.ABC):
     def param_end(self) -> float:
         return self.data.n_points - 1
 
+    def get_points(self, fractions):
+        points = np.concatenate(([self.vertex_1.position], self.point_array, [self.vertex_2.position]))
+
+        if self.representation == "spline":
+            # blockMesh interpolates a smooth curve between the points
+            points = f.catmull_rom(points)
+
+        return f.divide_polyline(points, fractions)
+
+    def format_description(self, point_list: str) -> str:
+        """Returns description with already formatted points;
+        used for formatting points of many edges at once"""
+        return super().description + "(" + point_list + ")"
+
     @property
     def description(self):
-        point_list = " ".join([vector_format(p) for p in self.point_array])
-        return super().description + "(" + point_list + ")"
+        return self.format_description(vector_list_format(self.point_array))
 
 
 @dataclasses.dataclass
@@ -45,8 +60,7 @@ class SplineEdge(CurveEdgeBase):
     def point_array(self) -> NPPointListType:
         return self.data.discretize(self.param_start, self.param_end)
 
-    @property
-    def length(self):
+    def calculate_length(self):
         points = np.concatenate(([self.vertex_1.position], self.point_array, [self.vertex_2.position]))
 
         return DiscreteCurve(points).length
@@ -65,19 +79,41 @@ class OnCurveEdge(CurveEdgeBase):
 
     data: edges.OnCurve
 
-    @property
-    def length(self):
+    def calculate_length(self):
         return self.data.curve.get_length(self.param_start, self.param_end)
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        # finding the closest parameter on a curve can involve an optimization;
+        # keep the results until vertices or the curve are moved
+        self._params_version: Optional[Hashable] = None
+        self._params = (0.0, 0.0)
+
+    @property
+    def params(self) -> Tuple[float, float]:
+        """Parameters of given curve at vertex 1 and vertex 2"""
+        version = self.version
+
+        if version != self._params_version:
+            curve = self.data.curve
+            self._params = (
+                curve.get_closest_param(self.vertex_1.position),
+                curve.get_closest_param(self.vertex_2.position),
+            )
+            self._params_version = version
+
+        return self._params
+
     @property
     def param_start(self) -> float:
         """Parameter of given curve at vertex 1"""
-        return self.data.curve.get_closest_param(self.vertex_1.position)
+        return self.params[0]
 
     @property
     def param_end(self) -> float:
         """Parameter of given curve at vertex 2"""
-        return self.data.curve.get_closest_param(self.vertex_2.position)
+        return self.params[1]
 
     @property
     def point_array(self) -> NPPointListType:
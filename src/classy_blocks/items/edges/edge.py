@@ -1,12 +1,13 @@
 import abc
 import dataclasses
 import warnings
+from typing import Hashable, Optional
 
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import EdgeCreationError
 from classy_blocks.construct.edges import EdgeData
 from classy_blocks.items.vertex import Vertex
-from classy_blocks.types import EdgeKindType
+from classy_blocks.types import EdgeKindType, FloatListType, NPPointListType
 from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 
@@ -19,13 +20,19 @@ class Edge(ElementBase):
     vertex_2: Vertex
     data: EdgeData
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         if not (isinstance(self.vertex_1, Vertex) and isinstance(self.vertex_2, Vertex)):
             raise EdgeCreationError(
                 "Unable to create `Edge`: at least one of given points is not `Vertex` type",
                 f"Vertex 1: {type(self.vertex_1)}, vertex 2: {type(self.vertex_2)}",
             )
 
+        # length is expensive to calculate for curved edges and is
+        # requested many times during grading; cache it for as long as
+        # the geometry stays the same
+        self._length_version: Optional[Hashable] = None
+        self._length = 0.0
+
     @property
     def kind(self) -> EdgeKindType:
         """A shorthand for edge.data.kind"""
@@ -53,11 +60,32 @@ class Edge(ElementBase):
         return True
 
     @property
-    @abc.abstractmethod
+    def version(self) -> Hashable:
+        """Identifies current geometric state of this edge: changes
+        when vertices or points that define the edge's curve are moved"""
+        return (self.vertex_1.version, self.vertex_2.version, self.data.version)
+
+    @property
     def length(self) -> float:
         """Returns length of this edge's curve"""
+        version = self.version
+
+        if version != self._length_version:
+            self._length = self.calculate_length()
+            self._length_version = version
+
+        return self._length
+
+    @abc.abstractmethod
+    def calculate_length(self) -> float:
+        """Calculates length of this edge's curve"""
         return f.norm(self.vertex_1.position - self.vertex_2.position)
 
+    def get_points(self, fractions: FloatListType) -> NPPointListType:
+        """Returns points on this edge's curve at given fractions (0...1) of its length,
+        measured from vertex_1; used for generating the mesh without blockMesh"""
+        return f.divide_polyline([self.vertex_1.position, self.vertex_2.position], fractions)
+
     @property
     @abc.abstractmethod
     def description(self) -> str:
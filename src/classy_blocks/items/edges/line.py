@@ -10,10 +10,9 @@ class LineEdge(Edge):
 
     data: edges.Line
 
-    @property
-    def length(self):
+    def calculate_length(self):
         # straight line
-        return super().length
+        return super().calculate_length()
 
     @property
     def description(self):
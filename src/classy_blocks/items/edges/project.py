@@ -1,5 +1,6 @@
 import dataclasses
 
+from classy_blocks.base.exceptions import MeshGenerationError
 from classy_blocks.construct import edges
 from classy_blocks.items.edges.edge import Edge
 
@@ -10,10 +11,12 @@ class ProjectEdge(Edge):
 
     data: edges.Project
 
-    @property
-    def length(self):
+    def calculate_length(self):
         # can't say much about that length, eh?
-        return super().length
+        return super().calculate_length()
+
+    def get_points(self, _fractions):
+        raise MeshGenerationError(f"Projected edges need geometry and blockMesh: {self.description}")
 
     @property
     def description(self):
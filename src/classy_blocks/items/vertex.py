@@ -32,7 +32,11 @@ class Vertex(Point):
     @property
     def description(self) -> str:
         """Returns a string representation to be written to blockMeshDict"""
-        point = vector_format(self.position)
+        return self.format_description(vector_format(self.position))
+
+    def format_description(self, point: str) -> str:
+        """Returns description with an already formatted position;
+        used for formatting positions of many vertices at once"""
         comment = f"// {self.index}"
 
         if len(self.projected_to) > 0:
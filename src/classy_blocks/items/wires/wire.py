@@ -1,5 +1,5 @@
 import dataclasses
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from classy_blocks.base.exceptions import InconsistentGradingsError
 from classy_blocks.construct.edges import Line
@@ -7,7 +7,7 @@ from classy_blocks.grading.grading import Grading
 from classy_blocks.items.edges.edge import Edge
 from classy_blocks.items.edges.factory import factory
 from classy_blocks.items.vertex import Vertex
-from classy_blocks.types import DirectionType
+from classy_blocks.types import DirectionType, NPPointListType
 
 
 @dataclasses.dataclass
@@ -42,10 +42,11 @@ class Wire:
         # multiple wires can be at the same spot; this list holds other
         # coincident wires from different blocks
         self.coincidents: Set[Wire] = set()
-        # wires that precede this (end with this wire's beginning vertex)
-        self.before: Set[WireJoint] = set()
+        # wires that precede this (end with this wire's beginning vertex);
+        # dicts are used as ordered sets so that averaging of cell sizes is deterministic
+        self.before: Dict[WireJoint, None] = {}
         # wires that follow this (start with this wire's end vertex)
-        self.after: Set[WireJoint] = set()
+        self.after: Dict[WireJoint, None] = {}
 
     @property
     def length(self) -> float:
@@ -55,6 +56,17 @@ class Wire:
         """Re-sets grading's edge length after the edge has changed"""
         self.grading.length = self.length
 
+    def get_points(self) -> NPPointListType:
+        """Positions of all cell boundaries along this wire,
+        from its first to its last vertex, according to grading"""
+        divisions = self.grading.divisions
+
+        if self.edge.vertex_1 == self.vertices[0]:
+            return self.edge.get_points(divisions)
+
+        # the edge was created by another block, in the opposite direction
+        return self.edge.get_points(1 - divisions)
+
     @property
     def is_valid(self) -> bool:
         """A pair with two equal vertices is useless"""
@@ -63,7 +75,13 @@ class Wire:
     def is_coincident(self, candidate: "Wire") -> bool:
         """Returns True if this wire is in the same spot than the argument,
         regardless of alignment"""
-        return self.vertices in [candidate.vertices, candidate.vertices[::-1]]
+        # compare indexes directly; this is called a lot when searching for neighbours
+        this_indexes = (self.vertices[0].index, self.vertices[1].index)
+
+        return this_indexes in (
+            (candidate.vertices[0].index, candidate.vertices[1].index),
+            (candidate.vertices[1].index, candidate.vertices[0].index),
+        )
 
     def is_aligned(self, candidate: "Wire") -> bool:
         """Returns true is this pair has the same alignment
@@ -88,14 +106,17 @@ class Wire:
         if candidate.direction != self.direction:
             return
 
-        if candidate.vertices[1] == self.vertices[0]:
-            self.before.add(WireJoint(candidate, True))
-        elif candidate.vertices[0] == self.vertices[0]:
-            self.before.add(WireJoint(candidate, False))
-        elif candidate.vertices[0] == self.vertices[1]:
-            self.after.add(WireJoint(candidate, True))
-        elif candidate.vertices[1] == self.vertices[1]:
-            self.after.add(WireJoint(candidate, False))
+        start, end = self.vertices[0].index, self.vertices[1].index
+        cnd_start, cnd_end = candidate.vertices[0].index, candidate.vertices[1].index
+
+        if cnd_end == start:
+            self.before[WireJoint(candidate, True)] = None
+        elif cnd_start == start:
+            self.before[WireJoint(candidate, False)] = None
+        elif cnd_start == end:
+            self.after[WireJoint(candidate, True)] = None
+        elif cnd_end == end:
+            self.after[WireJoint(candidate, False)] = None
 
     def copy_to_coincidents(self):
         """Copies the grading to all coincident wires"""
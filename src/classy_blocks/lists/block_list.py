@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Dict, List, Set
 
 from classy_blocks.base.exceptions import UndefinedGradingsError
 from classy_blocks.items.block import Block
@@ -11,6 +11,10 @@ class BlockList:
     def __init__(self) -> None:
         self.blocks: List[Block] = []
 
+        # blocks that use each vertex (by index); neighbours must share
+        # at least one vertex so there's no need to check all the other blocks
+        self.vertex_blocks: Dict[int, List[Block]] = {}
+
     def add(self, block: Block) -> None:
         """Add blocks"""
         block.index = len(self.blocks)
@@ -20,13 +24,25 @@ class BlockList:
 
     def update_neighbours(self, new_block: Block) -> None:
         """Find and assign neighbours of a given block entry"""
-        for block in self.blocks:
+        candidates: Dict[int, Block] = {}
+
+        for vertex in new_block.vertices:
+            for block in self.vertex_blocks.get(vertex.index, []):
+                candidates[block.index] = block
+
+        # keep the order in which blocks were added
+        for index in sorted(candidates):
+            block = candidates[index]
+
             if block == new_block:
                 continue
 
             block.add_neighbour(new_block)
             new_block.add_neighbour(block)
 
+        for vertex_index in {vertex.index for vertex in new_block.vertices}:
+            self.vertex_blocks.setdefault(vertex_index, []).append(new_block)
+
     def assemble(self) -> None:
         self.update()
         self.grade()
@@ -88,9 +104,15 @@ class BlockList:
         for block in self.blocks:
             block.check_consistency()
 
+    @property
+    def cell_counts(self) -> List[int]:
+        """Number of cells in each block"""
+        return [block.cell_count for block in self.blocks]
+
     def clear(self) -> None:
         """Removes created blocks"""
         self.blocks.clear()
+        self.vertex_blocks.clear()
 
     @property
     def description(self) -> str:
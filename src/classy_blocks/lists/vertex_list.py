@@ -99,11 +99,10 @@ class VertexList:
     @property
     def description(self) -> str:
         """Output for blockMeshDict"""
-        out = "vertices\n(\n"
-
-        for vertex in self.vertices:
-            out += f"\t{vertex.description}\n"
+        points = constants.vector_list_format([vertex.position for vertex in self.vertices], "\n").split("\n")
 
+        out = "vertices\n(\n"
+        out += "".join([f"\t{vertex.format_description(point)}\n" for vertex, point in zip(self.vertices, points)])
         out += ");\n\n"
 
         return out
@@ -1,10 +1,13 @@
 """The Mesh object ties everything together and writes the blockMeshDict in the end."""
 
-from typing import List, Optional, Set, Union, get_args
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Collection, Dict, List, Optional, Set, Union, get_args
 
-from classy_blocks.base.exceptions import EdgeNotFoundError
+from classy_blocks.base.exceptions import EdgeNotFoundError, MeshGenerationError
 from classy_blocks.construct.assemblies.assembly import Assembly
 from classy_blocks.construct.operations.operation import Operation
+from classy_blocks.construct.pattern import Pattern
 from classy_blocks.construct.shape import Shape
 from classy_blocks.construct.stack import Stack
 from classy_blocks.items.block import Block
@@ -17,10 +20,15 @@ from classy_blocks.lists.geometry_list import GeometryList
 from classy_blocks.lists.patch_list import PatchList
 from classy_blocks.lists.vertex_list import VertexList
 from classy_blocks.types import DirectionType
-from classy_blocks.util import constants
-from classy_blocks.util.vtk_writer import write_vtk
+from classy_blocks.util.archive import load_archive, save_archive
+from classy_blocks.util.dict_reader import read_dict
+from classy_blocks.util.dict_writer import DEFAULT_COMPRESSION_LEVEL, INCLUDED_SECTIONS, get_include_path, write_dict
+from classy_blocks.util.parallel_format import format_blocks, format_edges
+from classy_blocks.util.polymesh_writer import write_polymesh
+from classy_blocks.util.section_hashes import get_hashes, read_hashes
+from classy_blocks.util.vtk_writer import get_block_data, write_preview, write_vtk, write_vtu
 
-AdditiveType = Union[Operation, Shape, Stack, Assembly]
+AdditiveType = Union[Operation, Shape, Stack, Assembly, Pattern]
 
 
 class Mesh:
@@ -48,7 +56,7 @@ class Mesh:
         }
 
     def add(self, entity: AdditiveType) -> None:
-        """Add a classy_blocks entity to the mesh (Operation or a Shape)"""
+        """Add a classy_blocks entity to the mesh (Operation, Shape, Stack, Assembly or Pattern)"""
         # this does nothing yet;
         # the data will be processed automatically at an
         # appropriate occasion (before write/optimize)
@@ -206,34 +214,229 @@ class Mesh:
 
         return out
 
-    def write(self, output_path: str, debug_path: Optional[str] = None) -> None:
+    def format_sections(self, workers: int = 1) -> Dict[str, str]:
+        """Returns contents of each blockMeshDict section, in the order they are written;
+        the mesh and gradings must be assembled first.
+
+        With more than one worker, blocks and edges are formatted in a pool of processes;
+        the result is the same but only pays off for large meshes"""
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                blocks = format_blocks(self.block_list.blocks, executor, workers)
+                edges = format_edges(self.edge_list.edges, executor, workers)
+        else:
+            blocks = self.block_list.description
+            edges = self.edge_list.description
+
+        return {
+            "settings": self.format_settings(),
+            "geometry": self.geometry_list.description,
+            "vertices": self.vertex_list.description,
+            "blocks": blocks,
+            "edges": edges,
+            "faces": self.face_list.description,
+            "boundary": self.patch_list.description,
+        }
+
+    @staticmethod
+    def _get_changed(output_path: str, hashes: Dict[str, str], included: Collection[str]) -> List[str]:
+        """Sections that differ from those in an existing file at output_path
+        or are included from a file that doesn't exist"""
+        old_hashes = read_hashes(output_path)
+
+        return [
+            name
+            for name, value in hashes.items()
+            if old_hashes.get(name) != value
+            or (name in included and not os.path.isfile(get_include_path(output_path, name)))
+        ]
+
+    def get_changed_sections(self, output_path: str, split: bool = False) -> List[str]:
+        """Returns names of blockMeshDict sections that differ from
+        those in an existing file at output_path, as written by write();
+        all sections are reported if there's no such file or it was not written by classy_blocks"""
+        if not self.is_assembled:
+            self.assemble()
+
+        self.block_list.assemble()
+
+        included = INCLUDED_SECTIONS if split else ()
+
+        return self._get_changed(output_path, get_hashes(self.format_sections(), included), included)
+
+    def write(
+        self,
+        output_path: str,
+        debug_path: Optional[str] = None,
+        skip_unchanged: bool = False,
+        split: bool = False,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        workers: int = 1,
+    ) -> List[str]:
         """Writes a blockMeshDict to specified location. If debug_path is specified,
-        a VTK file is created first where each block is a single cell, to see simplified
-        blocking in case blockMesh fails with an unfriendly error message."""
+        a VTK file is created where each block is a single cell, to see simplified
+        blocking in case blockMesh fails with an unfriendly error message.
+
+        A debug_path ending with '.vtu' produces a binary VTK XML file with per-block data:
+        cell counts, quality, patches on each side and cell zone; other paths produce
+        a plain legacy ASCII VTK file with block ids only.
+
+        Content hashes of sections are stored in the file; returns names of sections that
+        changed since the last write to the same path (an empty list if none).
+        With skip_unchanged, an existing file with identical contents is not rewritten
+        so that its modification time can be used to avoid re-running blockMesh.
+
+        With split, vertices, blocks, edges, faces and boundary are written to separate files
+        next to output_path (blockMeshDict.vertices, ...), referenced by #include directives;
+        only files of changed sections are rewritten and all files are written concurrently.
+
+        An output_path ending with '.gz' (blockMeshDict.gz) produces gzip-compressed files
+        with given compression_level (1-9); OpenFOAM reads those transparently.
+
+        With workers > 1, blocks and edges are formatted in that many processes;
+        the output is identical, only worth it for meshes with many thousands of blocks."""
         if not self.is_assembled:
             self.assemble()
 
-        if debug_path is not None:
+        try:
+            # gradings: if they are not specified correctly, this will raise an exception
+            # but the debug file is still written
+            self.block_list.assemble()
+        finally:
+            if debug_path is not None:
+                self.write_debug(debug_path)
+
+        included = INCLUDED_SECTIONS if split else ()
+
+        sections = self.format_sections(workers)
+        hashes = get_hashes(sections, included)
+        changed = self._get_changed(output_path, hashes, included)
+
+        if skip_unchanged and len(changed) == 0:
+            return changed
+
+        write_dict(output_path, sections, hashes, included, changed, compression_level=compression_level)
+
+        return changed
+
+    def write_debug(self, debug_path: str) -> None:
+        """Writes blocks as VTK cells; see write() for details"""
+        if not debug_path.endswith(".vtu"):
             write_vtk(debug_path, self.vertex_list.vertices, self.block_list.blocks)
+            return
+
+        patches = self.patches
+        zones = list(dict.fromkeys(block.cell_zone for block in self.blocks if block.cell_zone))
+
+        write_vtu(
+            debug_path,
+            self.vertex_list.vertices,
+            self.block_list.blocks,
+            get_block_data(self.block_list.blocks, patches),
+            comments=[
+                "patches: " + " ".join(f"{i}={patch.name}" for i, patch in enumerate(patches)),
+                "cell_zone: " + " ".join(f"{i}={zone}" for i, zone in enumerate(zones)),
+            ],
+        )
+
+    def write_preview(self, path: str) -> None:
+        """Writes a VTK XML (.vtu) file with actual cells, interpolated from
+        edges and gradings without running blockMesh; use it to check
+        cell sizes and expansion ratios along each block axis.
+        Projected edges are not supported."""
+        if not self.is_assembled:
+            self.assemble()
 
-        # gradings: define after writing VTK;
-        # if it is not specified correctly, this will raise an exception
         self.block_list.assemble()
 
-        with open(output_path, "w", encoding="utf-8") as output:
-            output.write(constants.MESH_HEADER)
+        write_preview(path, self.block_list.blocks)
 
-            output.write(self.format_settings())
+    def write_polymesh(self, case_path: str) -> None:
+        """Generates the mesh without blockMesh and writes it to
+        case_path/constant/polyMesh, ready to be used by OpenFOAM.
+
+        Line, arc, spline, polyLine and curve edges are supported with simple and edge gradings;
+        projections, merged patches and degenerate blocks still need blockMeshDict and blockMesh."""
+        if not self.is_assembled:
+            self.assemble()
+
+        self.block_list.assemble()
 
-            output.write(self.geometry_list.description)
+        if len(self.face_list.faces) > 0 or any(len(vertex.projected_to) > 0 for vertex in self.vertices):
+            raise MeshGenerationError("Projected vertices and faces need geometry and blockMesh")
 
-            output.write(self.vertex_list.description)
-            output.write(self.block_list.description)
-            output.write(self.edge_list.description)
-            output.write(self.face_list.description)
-            output.write(self.patch_list.description)
+        if len(self.patch_list.merged) > 0:
+            raise MeshGenerationError("Merged patches need blockMesh")
 
-            output.write(constants.MESH_FOOTER)
+        if self.settings["prescale"] is not None or self.settings["transform"] is not None:
+            raise MeshGenerationError("Only 'scale' setting is supported when writing polyMesh")
+
+        write_polymesh(
+            os.path.join(case_path, "constant", "polyMesh"),
+            self.vertices,
+            self.blocks,
+            self.patch_list,
+            float(self.settings["scale"] or 1),
+        )
+
+    def save(self, path: str) -> None:
+        """Saves the assembled mesh (vertices, blocks, edges, chops, patches,
+        faces, geometry and settings) to a compressed numpy archive (.npz);
+        the mesh is assembled first, if it hasn't been already.
+        Edges on curves are saved as splines/polylines through the same points."""
+        if not self.is_assembled:
+            self.assemble()
+
+        save_archive(
+            path,
+            self.settings,
+            self.geometry_list,
+            self.vertex_list,
+            self.edge_list,
+            self.block_list,
+            self.patch_list,
+            self.face_list,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Mesh":
+        """Creates an assembled mesh from an archive, created by save(); it is ready for
+        grading, writing or modification of vertices but has no operations in depot,
+        therefore clear() or backport() will not work."""
+        mesh = cls()
+
+        load_archive(
+            path,
+            mesh.settings,
+            mesh.geometry_list,
+            mesh.vertex_list,
+            mesh.edge_list,
+            mesh.block_list,
+            mesh.patch_list,
+            mesh.face_list,
+        )
+
+        return mesh
+
+    @classmethod
+    def read(cls, path: str) -> "Mesh":
+        """Creates an assembled mesh from an existing blockMeshDict (files included
+        with #include are read as well); like a loaded mesh, it can be graded, optimized
+        and written but has no operations in depot. Gradings are converted to chops."""
+        mesh = cls()
+
+        read_dict(
+            path,
+            mesh.settings,
+            mesh.geometry_list,
+            mesh.vertex_list,
+            mesh.edge_list,
+            mesh.block_list,
+            mesh.patch_list,
+            mesh.face_list,
+        )
+
+        return mesh
 
     @property
     def is_assembled(self) -> bool:
@@ -264,3 +467,15 @@ class Mesh:
     @property
     def blocks(self) -> List[Block]:
         return self.block_list.blocks
+
+    @property
+    def block_cell_counts(self) -> List[int]:
+        """Returns number of cells in each block;
+        gradings must be defined first (see block_list.assemble())"""
+        return self.block_list.cell_counts
+
+    @property
+    def cell_count(self) -> int:
+        """Returns total number of cells this mesh will produce;
+        gradings must be defined first (see block_list.assemble())"""
+        return sum(self.block_cell_counts)
@@ -152,6 +152,75 @@ class ViewpointReorienter:
     def _get_aligned(self, triangles: List[Triangle], vector: NPVectorType) -> List[Triangle]:
         return sorted(triangles, key=lambda t: np.dot(t.normal, vector))[-2:]
 
+    def _get_frames(self, centers: NPPointListType) -> NPPointListType:
+        """Vectorized _get_normals(): returns a (N, 3, 3) array of
+        'front', 'left' and 'top' directions for each of N centers"""
+
+        def normalize(vectors):
+            return vectors / np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+
+        v_observer = normalize(self.observer - centers)
+        v_ceiling = normalize(self.ceiling - centers)
+
+        # correct ceiling so that it's always at right angle with observer
+        v_ceiling -= np.sum(v_ceiling * v_observer, axis=1)[:, np.newaxis] * v_observer
+        v_ceiling = normalize(v_ceiling)
+
+        v_left = normalize(np.cross(v_observer, v_ceiling))
+
+        return np.stack((v_observer, v_left, v_ceiling), axis=1)
+
+    def get_permutations(self, points: NPPointListType) -> NPPointListType:
+        """Takes a (N, 8, 3) array of corners of N hexahedra and returns
+        a (N, 8) array of indexes that sort each hexahedron's points as viewed from
+        observer, the same way as reorient() does.
+
+        Instead of building a convex hull for each hexahedron, points are
+        sorted by their coordinates in observer's frame of reference:
+        the top four in 'ceiling' direction go to the top face, two of each four
+        that are closest to observer are in front and the 'left'-most
+        of each pair is on the left. This is done for all hexahedra at once but
+        unlike reorient() it does not check for degenerate geometry."""
+        points = np.asarray(points, dtype=constants.DTYPE)
+        centers = np.average(points, axis=1)
+        frames = self._get_frames(centers)
+
+        # coordinates in (front, left, top) frame
+        local = np.einsum("nij,nkj->nki", frames, points - centers[:, np.newaxis])
+        rows = np.arange(len(points))
+
+        permutations = np.empty((len(points), 8), dtype=int)
+
+        # indexes of 4 bottom and 4 top points
+        by_height = np.argsort(local[:, :, 2], axis=1, kind="stable")
+
+        for start in (0, 4):
+            level = by_height[:, start : start + 4]
+            # sorted from back to front
+            level = np.take_along_axis(level, np.argsort(local[rows[:, np.newaxis], level, 0], axis=1), axis=1)
+
+            # (pair of points, their positions within the face: left, right)
+            for pair, corners in ((level[:, 2:], (0, 1)), (level[:, :2], (3, 2))):
+                is_left = local[rows, pair[:, 0], 1] > local[rows, pair[:, 1], 1]
+
+                permutations[:, start + corners[0]] = np.where(is_left, pair[:, 0], pair[:, 1])
+                permutations[:, start + corners[1]] = np.where(is_left, pair[:, 1], pair[:, 0])
+
+        return permutations
+
+    def reorient_all(self, operations: List[Operation]) -> None:
+        """Reorients many operations at once; see get_permutations()"""
+        if len(operations) == 0:
+            return
+
+        points = np.array([operation.point_array for operation in operations])
+        permutations = self.get_permutations(points)
+        sorted_points = np.take_along_axis(points, permutations[:, :, np.newaxis], axis=1)
+
+        for operation, operation_points in zip(operations, sorted_points):
+            for i, point in enumerate(operation.points):
+                point.position = operation_points[i]
+
     def reorient(self, operation: Operation):
         triangles = self._make_triangles(operation.point_array)
         normals = self._get_normals(operation.center)
@@ -1,6 +1,6 @@
 import abc
 import warnings
-from typing import ClassVar, Dict, List, Optional, Set, Tuple
+from typing import ClassVar, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
@@ -244,3 +244,65 @@ class HexCell(CellBase):
 
         angles = np.sum(sides_1 * sides_2, axis=1)
         return 180 * np.arccos(angles) / np.pi - 90
+
+
+def get_hex_qualities(points: NPPointListType, addressing: Union[List[IndexType], np.ndarray]) -> FloatListType:
+    """Calculates HexCell.quality of many cells at once; cells are given by
+    indexes of their 8 points (the same as cells in HexGrid) and
+    are neighbours if they share a side. Degenerate cells get NaN."""
+    points = np.asarray(points, dtype=float)
+    cells = np.asarray(addressing, dtype=int)
+    cell_count = len(cells)
+
+    side_indexes = np.array(HexCell.side_indexes)
+
+    # find neighbours by sides with the same vertex indexes
+    side_keys = np.sort(cells[:, side_indexes], axis=2).reshape(-1, 4)
+    _, inverse = np.unique(side_keys, axis=0, return_inverse=True)
+    order = np.argsort(inverse.ravel(), kind="stable")
+    pairs = np.nonzero(inverse.ravel()[order][1:] == inverse.ravel()[order][:-1])[0]
+
+    neighbours = np.full(cell_count * 6, -1)
+    neighbours[order[pairs]] = order[pairs + 1] // 6
+    neighbours[order[pairs + 1]] = order[pairs] // 6
+    neighbours = neighbours.reshape(cell_count, 6)
+
+    cell_points = points[cells]
+    centers = np.average(cell_points, axis=1)
+    sides = cell_points[:, side_indexes]
+    side_centers = np.average(sides, axis=2)
+
+    def q_scale(base, exponent, factor, value):
+        return factor * base ** (exponent * value) - factor
+
+    def normalize(vectors, small=0.0):
+        return vectors / (np.linalg.norm(vectors, axis=-1) + small)[..., np.newaxis]
+
+    with np.errstate(all="ignore"):
+        ### non-orthogonality
+        c2c = np.where(
+            (neighbours >= 0)[..., np.newaxis],
+            centers[:, np.newaxis] - centers[neighbours],
+            centers[:, np.newaxis] - side_centers,
+        )
+        side_normals = normalize(
+            np.cross(
+                sides - side_centers[:, :, np.newaxis], np.roll(sides, -1, axis=2) - side_centers[:, :, np.newaxis]
+            ),
+            VSMALL,
+        )
+        angles = 180 * np.arccos(np.sum(side_normals * normalize(c2c)[:, :, np.newaxis], axis=-1)) / np.pi
+        quality = np.sum(q_scale(1.25, 0.35, 0.8, angles), axis=(1, 2))
+
+        ### cell inner angles
+        sides_1 = normalize(np.roll(sides, -1, axis=2) - sides, VSMALL)
+        sides_2 = normalize(np.roll(sides, 1, axis=2) - sides, VSMALL)
+        inner_angles = 180 * np.arccos(np.sum(sides_1 * sides_2, axis=-1)) / np.pi - 90
+        quality += np.sum(q_scale(1.5, 0.25, 0.15, np.abs(inner_angles)), axis=(1, 2))
+
+        ### aspect ratio
+        edge_lengths = np.linalg.norm(cell_points[:, side_indexes[:, 1]] - cell_points[:, side_indexes[:, 0]], axis=-1)
+        aspect_factor = np.log10(np.max(edge_lengths, axis=1) / (np.min(edge_lengths, axis=1) + VSMALL))
+        quality += q_scale(3, 2.5, 3, aspect_factor)
+
+    return np.where(np.isfinite(quality), quality, np.nan)
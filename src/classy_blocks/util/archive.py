@@ -0,0 +1,251 @@
+"""Saving and loading of an assembled mesh to/from a compressed numpy archive (.npz);
+bulky data (positions, indexes, edge points) is stored in arrays and the rest
+in a JSON document so that no pickling is involved in either direction"""
+
+import dataclasses
+import json
+from typing import Any, Dict, FrozenSet, List, Tuple, get_args
+
+import numpy as np
+
+from classy_blocks.base.exceptions import MeshArchiveError
+from classy_blocks.construct import edges
+from classy_blocks.grading.chop import Chop
+from classy_blocks.items.block import Block
+from classy_blocks.items.edges.curve import CurveEdgeBase
+from classy_blocks.items.edges.edge import Edge
+from classy_blocks.items.edges.factory import factory
+from classy_blocks.items.side import Side
+from classy_blocks.items.vertex import Vertex
+from classy_blocks.lists.block_list import BlockList
+from classy_blocks.lists.edge_list import EdgeList
+from classy_blocks.lists.face_list import FaceList, ProjectedFace
+from classy_blocks.lists.geometry_list import GeometryList
+from classy_blocks.lists.patch_list import PatchList
+from classy_blocks.lists.vertex_list import DuplicatedEntry, VertexList
+from classy_blocks.types import DirectionType, OrientType
+from classy_blocks.util import constants
+
+ARCHIVE_VERSION = 1
+
+
+def get_edge_values(edge: Edge) -> Tuple[str, List[float], Any]:
+    """Returns kind, defining points and a parameter of an edge (a number or labels);
+    edges on curves are stored as splines or polylines through the same points"""
+    data = edge.data
+
+    if isinstance(data, edges.Arc):
+        return "arc", list(data.point.position), None
+
+    if isinstance(data, edges.Origin):
+        return "origin", list(data.origin.position), data.flatness
+
+    if isinstance(data, edges.Angle):
+        return "angle", list(data.axis.components), data.angle
+
+    if isinstance(data, edges.Project):
+        return "project", [], data.label
+
+    if isinstance(edge, CurveEdgeBase):
+        return edge.representation, list(np.ravel(edge.point_array)), None
+
+    return data.kind, [], None
+
+
+def get_edge_data(kind: str, values: np.ndarray, parameter: Any) -> edges.EdgeData:
+    """Re-creates edge data from what get_edge_values() returned"""
+    if kind == "arc":
+        return edges.Arc(values)
+
+    if kind == "origin":
+        return edges.Origin(values, parameter)
+
+    if kind == "angle":
+        return edges.Angle(parameter, values)
+
+    if kind == "project":
+        return edges.Project(parameter)
+
+    if kind == "spline":
+        return edges.Spline(values.reshape(-1, 3))
+
+    if kind == "polyLine":
+        return edges.PolyLine(values.reshape(-1, 3))
+
+    raise MeshArchiveError(f"Unknown edge kind: {kind}")
+
+
+def save_archive(
+    path: str,
+    settings: Dict[str, Any],
+    geometry_list: GeometryList,
+    vertex_list: VertexList,
+    edge_list: EdgeList,
+    block_list: BlockList,
+    patch_list: PatchList,
+    face_list: FaceList,
+) -> None:
+    """Saves contents of assembled lists to a .npz archive"""
+    edge_kinds: List[str] = []
+    edge_offsets = [0]
+    edge_values: List[float] = []
+    edge_parameters: Dict[int, Any] = {}
+
+    for i, edge in enumerate(edge_list.edges):
+        kind, values, parameter = get_edge_values(edge)
+
+        edge_kinds.append(kind)
+        edge_values += values
+        edge_offsets.append(len(edge_values))
+
+        if parameter is not None:
+            edge_parameters[i] = parameter
+
+    # chops are usually shared between many blocks; store each only once
+    chops: Dict[str, int] = {}
+    block_chops: List[List[List[int]]] = []
+
+    for block in block_list.blocks:
+        block_chops.append(
+            [
+                [chops.setdefault(json.dumps(dataclasses.asdict(chop)), len(chops)) for chop in axis.chops]
+                for axis in block.axes
+            ]
+        )
+
+    metadata = {
+        "version": ARCHIVE_VERSION,
+        "settings": settings,
+        "geometry": geometry_list.geometry,
+        "projected_vertices": {
+            vertex.index: vertex.projected_to for vertex in vertex_list.vertices if len(vertex.projected_to) > 0
+        },
+        "duplicated": [[dupe.vertex.index, dupe.patches] for dupe in vertex_list.duplicated],
+        "edge_kinds": edge_kinds,
+        "edge_parameters": edge_parameters,
+        "chops": [json.loads(chop) for chop in chops],
+        "block_chops": block_chops,
+        "cell_zones": [block.cell_zone for block in block_list.blocks],
+        "comments": [block.comment for block in block_list.blocks],
+        "patches": [
+            {
+                "name": patch.name,
+                "kind": patch.kind,
+                "settings": patch.settings,
+                "sides": [[vertex.index for vertex in side.vertices] for side in patch.sides],
+            }
+            for patch in patch_list.patches.values()
+        ],
+        "default_patch": patch_list.default,
+        "merged_patches": patch_list.merged,
+        "faces": [[[vertex.index for vertex in face.side.vertices], face.label] for face in face_list.faces],
+    }
+
+    np.savez_compressed(
+        path,
+        metadata=np.frombuffer(json.dumps(metadata).encode(), dtype=np.uint8),
+        vertices=np.array([vertex.position for vertex in vertex_list.vertices], dtype=float).reshape(-1, 3),
+        blocks=np.array([block.indexes for block in block_list.blocks], dtype=np.int64).reshape(-1, 8),
+        edge_vertices=np.array(
+            [[edge.vertex_1.index, edge.vertex_2.index] for edge in edge_list.edges], dtype=np.int64
+        ).reshape(-1, 2),
+        edge_offsets=np.array(edge_offsets, dtype=np.int64),
+        edge_values=np.array(edge_values, dtype=float),
+    )
+
+
+def load_archive(
+    path: str,
+    settings: Dict[str, Any],
+    geometry_list: GeometryList,
+    vertex_list: VertexList,
+    edge_list: EdgeList,
+    block_list: BlockList,
+    patch_list: PatchList,
+    face_list: FaceList,
+) -> None:
+    """Fills empty lists with data from an archive, created by save_archive()"""
+    with np.load(path, allow_pickle=False) as archive:
+        metadata = json.loads(archive["metadata"].tobytes().decode())
+
+        if metadata["version"] != ARCHIVE_VERSION:
+            raise MeshArchiveError(f"Unsupported archive version: {metadata['version']}")
+
+        positions = archive["vertices"]
+        block_indexes = archive["blocks"].tolist()
+        edge_vertices = archive["edge_vertices"].tolist()
+        edge_offsets = archive["edge_offsets"]
+        edge_values = archive["edge_values"]
+
+    settings.update(metadata["settings"])
+    geometry_list.geometry = metadata["geometry"]
+
+    # vertices
+    vertices = [Vertex(position, i) for i, position in enumerate(positions)]
+
+    for index, labels in metadata["projected_vertices"].items():
+        vertices[int(index)].projected_to = labels
+
+    vertex_list.vertices = vertices
+    vertex_list.duplicated = [DuplicatedEntry(vertices[index], patches) for index, patches in metadata["duplicated"]]
+
+    # edges
+    edge_map: Dict[FrozenSet[int], Edge] = {}
+
+    for i, kind in enumerate(metadata["edge_kinds"]):
+        data = get_edge_data(
+            kind, edge_values[edge_offsets[i] : edge_offsets[i + 1]], metadata["edge_parameters"].get(str(i))
+        )
+        edge = factory.create(vertices[edge_vertices[i][0]], vertices[edge_vertices[i][1]], data)
+
+        edge_list.edges.append(edge)
+        edge_map[frozenset(edge_vertices[i])] = edge
+
+    # blocks
+    chops = [Chop(**chop) for chop in metadata["chops"]]
+
+    # sides are stored by their vertex indexes; the same order can only be
+    # obtained from a block that contains that side
+    sides: Dict[Tuple[int, ...], Tuple[OrientType, List[Vertex]]] = {}
+
+    for i, indexes in enumerate(block_indexes):
+        block = Block(i, [vertices[index] for index in indexes])
+
+        for wire in block.wire_list:
+            wire_edge = edge_map.get(frozenset(vertex.index for vertex in wire.vertices))
+
+            if wire_edge is not None:
+                block.add_edge(wire.corners[0], wire.corners[1], wire_edge)
+
+        for direction in get_args(DirectionType):
+            block.add_chops(direction, [chops[chop] for chop in metadata["block_chops"][i][direction]])
+
+        block.cell_zone = metadata["cell_zones"][i]
+        block.comment = metadata["comments"][i]
+
+        block_list.add(block)
+
+        for orient, corners in constants.FACE_MAP.items():
+            sides.setdefault(tuple(indexes[corner] for corner in corners), (orient, block.vertices))
+
+    def get_side(indexes: List[int]) -> Side:
+        try:
+            orient, block_vertices = sides[tuple(indexes)]
+        except KeyError as err:
+            raise MeshArchiveError(f"No block has a side with vertices {indexes}") from err
+
+        return Side(orient, block_vertices)
+
+    # patches and faces
+    for patch_data in metadata["patches"]:
+        patch = patch_list.get(patch_data["name"])
+        patch.kind = patch_data["kind"]
+        patch.settings = patch_data["settings"]
+        patch.sides = [get_side(indexes) for indexes in patch_data["sides"]]
+
+    patch_list.default = metadata["default_patch"]
+    patch_list.merged = metadata["merged_patches"]
+
+    face_list.faces = [ProjectedFace(get_side(indexes), label) for indexes, label in metadata["faces"]]
+
+    block_list.update()
@@ -1,5 +1,7 @@
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from classy_blocks.types import OrientType
 
 # data type
@@ -32,6 +34,19 @@ SIDES_MAP: List[OrientType] = [
     "left",
 ]
 
+# block-local (i, j, k) position of each corner:
+# 0 is at the start of an axis and 1 at its end
+CORNER_IJK = (
+    (0, 0, 0),
+    (1, 0, 0),
+    (1, 1, 0),
+    (0, 1, 0),
+    (0, 0, 1),
+    (1, 0, 1),
+    (1, 1, 1),
+    (0, 1, 1),
+)
+
 # pairs of corner indexes along axes
 AXIS_PAIRS = (
     ((0, 1), (3, 2), (7, 6), (4, 5)),  # x
@@ -50,7 +65,15 @@ def vector_format(vector) -> str:
     return f"({vector[0]:.8f} {vector[1]:.8f} {vector[2]:.8f})"
 
 
-MESH_HEADER = (
+def vector_list_format(vectors, separator: str = " ") -> str:
+    """The same as vector_format() for many vectors at once, joined with separator;
+    all numbers are formatted in a single operation instead of an f-string per vector"""
+    values = np.asarray(vectors, dtype=float).reshape(-1, 3)
+
+    return separator.join(["(%.8f %.8f %.8f)"] * len(values)) % tuple(values.ravel().tolist())
+
+
+FOAM_BANNER = (
     "/*---------------------------------------------------------------------------*\\\n"
     "| =========                 |                                                 |\n"
     "| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |\n"
@@ -58,7 +81,10 @@ MESH_HEADER = (
     "|   \\  /    A nd           | Web:      https://www.OpenFOAM.com              |\n"
     "|    \\/     M anipulation  |           https://www.OpenFOAM.org              |\n"
     "\\*---------------------------------------------------------------------------*/\n"
-    "FoamFile\n"
+)
+
+MESH_HEADER = (
+    FOAM_BANNER + "FoamFile\n"
     "{\n"
     "    version     2.0;\n"
     "    format      ascii;\n"
@@ -0,0 +1,425 @@
+"""Reading of existing (hand-written or generated) blockMeshDicts;
+the file is read in chunks and tokenized on the fly, parsed into nested lists
+of tokens and then converted directly into contents of vertex, edge, block,
+patch and face lists, as if the mesh was assembled from operations"""
+
+import os
+import re
+import warnings
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple, Union, get_args
+
+import numpy as np
+
+from classy_blocks.base.exceptions import ArrayCreationError, DictParseError
+from classy_blocks.construct import edges
+from classy_blocks.grading.chop import Chop
+from classy_blocks.grading.grading import Grading
+from classy_blocks.items.block import Block
+from classy_blocks.items.edges.edge import Edge
+from classy_blocks.items.edges.factory import factory
+from classy_blocks.items.side import Side
+from classy_blocks.items.vertex import Vertex
+from classy_blocks.lists.block_list import BlockList
+from classy_blocks.lists.edge_list import EdgeList
+from classy_blocks.lists.face_list import FaceList, ProjectedFace
+from classy_blocks.lists.geometry_list import GeometryList
+from classy_blocks.lists.patch_list import PatchList
+from classy_blocks.lists.vertex_list import VertexList
+from classy_blocks.types import DirectionType, OrientType
+from classy_blocks.util import constants
+from classy_blocks.util.tools import GZIP_SUFFIX, open_text
+
+# the file is read this many characters at a time
+CHUNK_SIZE = 2**20
+
+# strings, punctuation, words (numbers, names, paths) and comments;
+# whitespace is skipped by finditer(); unterminated strings and comments
+# match until the end of buffer so that they can be completed with the next chunk
+TOKEN_PATTERN = re.compile(r'"[^"]*"?|[(){};]|(?:[^\s(){};"/]|/(?![/*]))+|//[^\n]*|/\*(?:.*?\*/|.*)', re.DOTALL)
+
+# entries that are read as mesh settings; 'convertToMeters' is an old name for 'scale'
+SETTINGS_ALIASES = {"convertToMeters": "scale"}
+
+
+def tokenize(path: str) -> Iterator[str]:
+    """Yields tokens from a (possibly compressed) file without comments, reading it in chunks"""
+    with open_text(path) as stream:
+        buffer = ""
+
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            buffer += chunk
+            position = 0
+
+            for match in TOKEN_PATTERN.finditer(buffer):
+                if chunk and match.end() == len(buffer):
+                    # this token might continue in the next chunk
+                    break
+
+                position = match.end()
+                token = match.group()
+
+                if not token.startswith(("//", "/*")):
+                    yield token
+
+            buffer = buffer[position:]
+
+            if not chunk:
+                return
+
+
+def read_tokens(path: str) -> Iterator[str]:
+    """Yields tokens from a file and replaces #include directives
+    with contents of included files (relative to the including one)"""
+    tokens = tokenize(path)
+
+    for token in tokens:
+        if token == "#include":
+            include_path = os.path.join(os.path.dirname(path), next(tokens, "").strip('"'))
+
+            if not os.path.isfile(include_path) and os.path.isfile(include_path + GZIP_SUFFIX):
+                # compressed files are referenced without the extension
+                include_path += GZIP_SUFFIX
+
+            yield from read_tokens(include_path)
+        elif token[0] in "#$":
+            raise DictParseError(f"Unsupported directive or macro in {path}: {token}")
+        else:
+            yield token
+
+
+def parse_list(tokens: Iterator[str]) -> List[Any]:
+    """Parses tokens until the closing parenthesis"""
+    items: List[Any] = []
+
+    for token in tokens:
+        if token == ")":
+            return items
+
+        if token == "(":
+            items.append(parse_list(tokens))
+        elif token == "{":
+            items.append(parse_dict(tokens))
+        elif token in ("}", ";"):
+            raise DictParseError(f"Unexpected '{token}' in a list")
+        else:
+            items.append(token)
+
+    raise DictParseError("Unexpected end of file, missing ')'")
+
+
+def parse_entry(tokens: Iterator[str]) -> Any:
+    """Parses a value of a dictionary entry: a list of items until ';' or a dictionary in braces"""
+    items: List[Any] = []
+
+    for token in tokens:
+        if token == ";":
+            return items
+
+        if token == "{" and len(items) == 0:
+            return parse_dict(tokens)
+
+        if token == "(":
+            items.append(parse_list(tokens))
+        elif token in (")", "{", "}"):
+            raise DictParseError(f"Unexpected '{token}' in an entry")
+        else:
+            items.append(token)
+
+    raise DictParseError("Unexpected end of file, missing ';'")
+
+
+def parse_dict(tokens: Iterator[str], top_level: bool = False) -> Dict[str, Any]:
+    """Parses keyword-value entries until the closing brace (or the end of file)"""
+    entries: Dict[str, Any] = {}
+
+    for keyword in tokens:
+        if keyword == "}" and not top_level:
+            return entries
+
+        if keyword == ";":
+            # a stray semicolon, such as after a sub-dictionary: '};'
+            continue
+
+        if keyword in ("(", ")", "{", "}"):
+            raise DictParseError(f"Unexpected '{keyword}', expected a keyword")
+
+        entries[keyword] = parse_entry(tokens)
+
+    if not top_level:
+        raise DictParseError("Unexpected end of file, missing '}'")
+
+    return entries
+
+
+def format_item(item: Any) -> str:
+    """Formats a parsed item back to text"""
+    if isinstance(item, dict):
+        return "{ " + " ".join(f"{key} {format_entry(value)};" for key, value in item.items()) + " }"
+
+    if isinstance(item, list):
+        return "(" + " ".join(format_item(i) for i in item) + ")"
+
+    return item
+
+
+def format_entry(value: Any) -> str:
+    if isinstance(value, dict):
+        return format_item(value)
+
+    return " ".join(format_item(item) for item in value)
+
+
+def get_list(value: Any) -> List[Any]:
+    """Returns the list from an entry such as 'vertices (...);' or 'vertices 8 (...);'"""
+    if not isinstance(value, list) or len(value) == 0 or not isinstance(value[-1], list):
+        raise DictParseError(f"Expected a list, got {format_entry(value)}")
+
+    return value[-1]
+
+
+def get_number(token: str) -> Union[int, float]:
+    """Converts a token to a number, keeping integers as written"""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def get_chops(specification: Any, count: int) -> List[Chop]:
+    """Converts a grading specification of a single edge (a number or
+    a multi-grading list) to chops that will produce the same grading"""
+    if isinstance(specification, str):
+        return [Chop(count=count, total_expansion=get_number(specification))]
+
+    values = np.array(specification, dtype=float).reshape(-1, 3)
+    length_ratios = values[:, 0] / np.sum(values[:, 0])
+
+    # the same as blockMesh: rounded fractions of cells, the last division takes the rest
+    fractions = (values[:-1, 1] / np.sum(values[:, 1])).tolist()
+    counts = [max(round(fraction * count), 1) for fraction in fractions]
+    counts.append(count - sum(counts))
+
+    if counts[-1] < 1:
+        raise DictParseError(f"Invalid grading specification: {format_item(specification)}")
+
+    return [
+        Chop(length_ratio=float(length_ratios[i]), count=counts[i], total_expansion=float(values[i, 2]))
+        for i in range(len(counts))
+    ]
+
+
+def read_dict(
+    path: str,
+    settings: Dict[str, Any],
+    geometry_list: GeometryList,
+    vertex_list: VertexList,
+    edge_list: EdgeList,
+    block_list: BlockList,
+    patch_list: PatchList,
+    face_list: FaceList,
+) -> None:
+    """Fills empty lists with data from an existing blockMeshDict"""
+    entries = parse_dict(read_tokens(path), top_level=True)
+
+    vertices: List[Vertex] = []
+    edge_map: Dict[FrozenSet[int], Edge] = {}
+    # sides of blocks by their (unordered) vertex indexes
+    sides: Dict[FrozenSet[int], Tuple[OrientType, List[Vertex]]] = {}
+
+    def read_settings() -> None:
+        for keyword, value in entries.items():
+            key = SETTINGS_ALIASES.get(keyword, keyword)
+
+            if key in settings:
+                if len(value) != 1 or not isinstance(value[0], str):
+                    raise DictParseError(f"Unsupported value of {keyword}: {format_entry(value)}")
+
+                settings[key] = get_number(value[0]) if key in ("scale", "prescale") else value[0]
+
+    def read_geometry() -> None:
+        for name, properties in entries.get("geometry", {}).items():
+            geometry_list.add({name: [f"{key} {format_entry(value)}" for key, value in properties.items()]})
+
+    def read_vertices() -> None:
+        items = get_list(entries.get("vertices", [[]]))
+
+        if all(isinstance(item, list) for item in items):
+            # the usual case, only positions
+            positions = np.array(items, dtype=float).reshape(-1, 3)
+            vertices.extend(Vertex(position, i) for i, position in enumerate(positions))
+        else:
+            i = 0
+            while i < len(items):
+                if items[i] == "project":
+                    vertex = Vertex(np.array(items[i + 1], dtype=float), len(vertices))
+                    vertex.projected_to = list(items[i + 2])
+                    i += 3
+                else:
+                    vertex = Vertex(np.array(items[i], dtype=float), len(vertices))
+                    i += 1
+
+                vertices.append(vertex)
+
+        vertex_list.vertices = vertices
+
+    def read_edges() -> None:
+        items = get_list(entries.get("edges", [[]]))
+
+        i = 0
+        while i < len(items):
+            kind = items[i]
+            indexes = (int(items[i + 1]), int(items[i + 2]))
+            value = items[i + 3]
+            i += 4
+
+            data: edges.EdgeData
+
+            if kind == "arc":
+                if value == "origin":
+                    flatness = 1.0
+                    if isinstance(items[i], str):
+                        flatness = float(items[i])
+                        i += 1
+
+                    data = edges.Origin(np.array(items[i], dtype=float), flatness)
+                    i += 1
+                else:
+                    data = edges.Arc(np.array(value, dtype=float))
+            elif kind == "spline":
+                data = edges.Spline(np.array(value, dtype=float))
+            elif kind == "polyLine":
+                data = edges.PolyLine(np.array(value, dtype=float))
+            elif kind == "project":
+                data = edges.Project(list(value))
+            else:
+                raise DictParseError(f"Unsupported edge type: {kind}")
+
+            edge = factory.create(vertices[indexes[0]], vertices[indexes[1]], data)
+            edge_list.edges.append(edge)
+            edge_map[frozenset(indexes)] = edge
+
+    def read_blocks() -> None:
+        items = get_list(entries.get("blocks", [[]]))
+
+        i = 0
+        while i < len(items):
+            if items[i] != "hex":
+                raise DictParseError(f"Unsupported block shape: {items[i]}")
+
+            indexes = [int(index) for index in items[i + 1]]
+            i += 2
+
+            cell_zone = ""
+            if isinstance(items[i], str):
+                cell_zone = items[i]
+                i += 1
+
+            counts = [int(count) for count in items[i]]
+            i += 1
+
+            specifications = ["1", "1", "1"]
+            if i < len(items) and items[i] in ("simpleGrading", "edgeGrading"):
+                specifications = items[i + 1]
+                i += 2
+
+            block = Block(len(block_list.blocks), [vertices[index] for index in indexes])
+
+            for wire in block.wire_list:
+                wire_edge = edge_map.get(frozenset(vertex.index for vertex in wire.vertices))
+
+                if wire_edge is not None:
+                    block.add_edge(wire.corners[0], wire.corners[1], wire_edge)
+
+            for direction in get_args(DirectionType):
+                if len(specifications) == 3:
+                    block.add_chops(direction, get_chops(specifications[direction], counts[direction]))
+                    continue
+
+                # edgeGrading: 4 specifications per axis, in the same order as block's wires
+                axis_specifications = specifications[4 * direction : 4 * direction + 4]
+
+                if all(specification == axis_specifications[0] for specification in axis_specifications):
+                    block.add_chops(direction, get_chops(axis_specifications[0], counts[direction]))
+                    continue
+
+                for wire, specification in zip(block.axes[direction].wires, axis_specifications):
+                    wire.grading = Grading(0)
+                    for chop in get_chops(specification, counts[direction]):
+                        wire.grading.add_chop(chop)
+
+            block.cell_zone = cell_zone
+            block_list.add(block)
+
+            for orient, corners in constants.FACE_MAP.items():
+                sides.setdefault(frozenset(indexes[corner] for corner in corners), (orient, block.vertices))
+
+    def get_side(indexes: List[str]) -> Side:
+        try:
+            orient, block_vertices = sides[frozenset(int(index) for index in indexes)]
+        except KeyError as err:
+            raise DictParseError(f"No block has a side with vertices {format_item(indexes)}") from err
+
+        return Side(orient, block_vertices)
+
+    def read_boundary() -> None:
+        items = get_list(entries.get("boundary", [[]]))
+
+        for name, properties in zip(items[::2], items[1::2]):
+            patch = patch_list.get(name)
+
+            for key, value in properties.items():
+                if key == "type":
+                    patch.kind = value[0]
+                elif key == "faces":
+                    patch.sides = [get_side(indexes) for indexes in get_list(value)]
+                else:
+                    patch.settings.append(f"{key} {format_entry(value)}")
+
+        # the old 'patches' syntax: (type name (faces))
+        items = get_list(entries.get("patches", [[]]))
+
+        for kind, name, faces in zip(items[::3], items[1::3], items[2::3]):
+            patch = patch_list.get(name)
+            patch.kind = kind
+            patch.sides = [get_side(indexes) for indexes in faces]
+
+        if "defaultPatch" in entries:
+            default = entries["defaultPatch"]
+            patch_list.set_default(default.get("name", ["defaultFaces"])[0], default.get("type", ["empty"])[0])
+
+        for pair in get_list(entries.get("mergePatchPairs", [[]])):
+            patch_list.merge(pair[0], pair[1])
+
+    def read_faces() -> None:
+        items = get_list(entries.get("faces", [[]]))
+
+        for i in range(0, len(items), 3):
+            if items[i] != "project":
+                raise DictParseError(f"Unsupported face type: {items[i]}")
+
+            face_list.faces.append(ProjectedFace(get_side(items[i + 1]), items[i + 2]))
+
+    readers: Dict[str, Callable[[], None]] = {
+        "settings": read_settings,
+        "geometry": read_geometry,
+        "vertices": read_vertices,
+        "edges": read_edges,
+        "blocks": read_blocks,
+        "boundary": read_boundary,
+        "faces": read_faces,
+    }
+
+    for section, reader in readers.items():
+        try:
+            reader()
+        except (ValueError, IndexError, TypeError, KeyError, AttributeError, ArrayCreationError) as err:
+            raise DictParseError(f"Invalid {section} in {path}: {err}") from err
+
+    known = {"FoamFile", "geometry", "vertices", "edges", "blocks", "boundary", "patches"}
+    known.update({"defaultPatch", "mergePatchPairs", "faces", *settings.keys(), *SETTINGS_ALIASES.keys()})
+
+    for keyword in sorted(entries.keys() - known):
+        warnings.warn(f"Ignoring unsupported entry in {path}: {keyword}", stacklevel=2)
+
+    block_list.update()
@@ -0,0 +1,83 @@
+"""Writing of blockMeshDict, either as a single file or with
+sections in separate files, referenced by #include directives;
+paths ending with .gz produce gzip-compressed files"""
+
+import concurrent.futures
+import functools
+import os
+from typing import Collection, Dict, List, Optional, Tuple
+
+from classy_blocks.util import constants
+from classy_blocks.util.section_hashes import format_hashes
+from classy_blocks.util.tools import GZIP_SUFFIX, open_text
+
+# sections that can be written to separate files
+INCLUDED_SECTIONS = ("vertices", "blocks", "edges", "faces", "boundary")
+
+# a compromise between speed and size, the same as zlib's default
+DEFAULT_COMPRESSION_LEVEL = 6
+
+
+def get_include_path(output_path: str, section: str) -> str:
+    """Path of a file with given section, next to the main file;
+    sections of a compressed file are compressed as well"""
+    if output_path.endswith(GZIP_SUFFIX):
+        return f"{output_path[: -len(GZIP_SUFFIX)]}.{section}{GZIP_SUFFIX}"
+
+    return f"{output_path}.{section}"
+
+
+def get_include_name(include_path: str) -> str:
+    """File name as referenced in #include directive; OpenFOAM
+    finds compressed files without the .gz extension"""
+    name = os.path.basename(include_path)
+
+    if name.endswith(GZIP_SUFFIX):
+        return name[: -len(GZIP_SUFFIX)]
+
+    return name
+
+
+def write_file(path_contents: Tuple[str, List[str]], compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> None:
+    """Writes parts of contents one by one, compressing them on the fly if required"""
+    path, contents = path_contents
+
+    with open_text(path, "w", compression_level) as output:
+        for part in contents:
+            output.write(part)
+
+
+def write_dict(
+    output_path: str,
+    sections: Dict[str, str],
+    hashes: Dict[str, str],
+    included: Collection[str] = (),
+    changed: Collection[str] = INCLUDED_SECTIONS,
+    workers: Optional[int] = None,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+) -> None:
+    """Writes blockMeshDict with given sections and their hashes;
+    included sections are written to separate files, referenced with #include
+    from the main file; only those in 'changed' (or missing) are rewritten.
+    Files are written concurrently by a pool of threads."""
+    contents: Dict[str, List[str]] = {}
+
+    main = [constants.MESH_HEADER, format_hashes(hashes)]
+
+    for name, text in sections.items():
+        if name not in included:
+            main.append(text)
+            continue
+
+        include_path = get_include_path(output_path, name)
+        main.append(f'#include "{get_include_name(include_path)}"\n\n')
+
+        if name in changed or not os.path.isfile(include_path):
+            contents[include_path] = [text]
+
+    main.append(constants.MESH_FOOTER)
+    contents[output_path] = main
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() re-raises exceptions from threads, if any
+        list(executor.map(functools.partial(write_file, compression_level=compression_level), contents.items()))
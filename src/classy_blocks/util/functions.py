@@ -1,7 +1,7 @@
 """Mathematical functions for general everyday household use"""
 
 from itertools import chain
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, Tuple, Union
 
 import numpy as np
 import scipy
@@ -9,7 +9,15 @@ import scipy.linalg
 import scipy.optimize
 import scipy.spatial
 
-from classy_blocks.types import NPPointListType, NPPointType, NPVectorType, PointListType, PointType, VectorType
+from classy_blocks.types import (
+    FloatListType,
+    NPPointListType,
+    NPPointType,
+    NPVectorType,
+    PointListType,
+    PointType,
+    VectorType,
+)
 from classy_blocks.util import constants
 
 
@@ -62,37 +70,52 @@ def angle_between(vect_1: VectorType, vect_2: VectorType) -> float:
     return np.arccos(np.clip(np.dot(v1_u, v2_u), -1.0, 1.0))
 
 
+def _snap_trig(angle):
+    """Returns cosine and sine of given angle(s) with round-off errors
+    around multiples of pi/2 removed so that rotations by right angles are exact"""
+    cos = np.cos(angle)
+    sin = np.sin(angle)
+
+    cos = np.where(np.abs(cos) < 1e-15, 0, cos)
+    sin = np.where(np.abs(sin) < 1e-15, 0, sin)
+
+    return cos, sin
+
+
 def rotation_matrix(axis: VectorType, theta: float):
     """
     Return the rotation matrix associated with counterclockwise rotation about
     the given axis by theta radians.
-    # Kudos to
-    # https://stackoverflow.com/questions/6802577/rotation-of-3d-vector
-    #import math
-    #
-    # axis = np.asarray(axis)
-    # axis = axis / math.sqrt(np.dot(axis, axis))
-    # a = math.cos(theta / 2.0)
-    # b, c, d = -axis * math.sin(theta / 2.0)
-    # aa, bb, cc, dd = a * a, b * b, c * c, d * d
-    # bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-    # return np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-    #                  [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-    #                  [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
-
-    # Also Kudos to the guy with another answer for the same question (used here):"""
-    axis = np.asarray(axis)
-    return scipy.linalg.expm(np.cross(np.eye(3), axis / norm(axis) * theta))
-
-
-def rotate(point: PointType, angle: float, axis: VectorType, origin: PointType) -> NPPointType:
-    """Rotate a point around an axis@origin by a given angle [radians]"""
+
+    Uses Rodrigues' formula: R = I + sin(theta)*K + (1 - cos(theta))*K^2,
+    where K is the cross-product matrix of unit axis; that is the closed form
+    of the matrix exponential expm(theta*K)."""
+    axis = unit_vector(axis)
+    skew = np.cross(np.eye(3), axis)
+    cos, sin = _snap_trig(theta)
+
+    return np.eye(3) + sin * skew + (1 - cos) * np.dot(skew, skew)
+
+
+def rotate(
+    point: Union[PointType, PointListType], angle: Union[float, FloatListType], axis: VectorType, origin: PointType
+) -> NPPointListType:
+    """Rotate a point around an axis@origin by a given angle [radians].
+
+    Works on batches too (Rodrigues' formula with numpy broadcasting):
+    - a list of points (N, 3) and a single angle rotates all points by the same angle;
+    - a single point and a list of angles (M,) returns the point rotated by each angle (M, 3);
+    - a list of points (N, 3) and a list of angles (N,) rotates each point by its own angle."""
     point = np.asarray(point, dtype=constants.DTYPE)
-    axis = np.asarray(axis, dtype=constants.DTYPE)
+    angle = np.asarray(angle, dtype=constants.DTYPE)[..., np.newaxis]
+    axis = unit_vector(axis)
     origin = np.asarray(origin, dtype=constants.DTYPE)
 
-    rotated_point = np.dot(rotation_matrix(axis, angle), point - origin)
-    return rotated_point + origin
+    arm = point - origin
+    cos, sin = _snap_trig(angle)
+    along = np.asarray(np.dot(arm, axis))[..., np.newaxis] * axis
+
+    return origin + arm * cos + np.cross(axis, arm) * sin + along * (1 - cos)
 
 
 def scale(point: PointType, ratio: float, origin: Optional[PointType]) -> NPPointType:
@@ -158,8 +181,8 @@ def lin_map(x: float, x_min: float, x_max: float, out_min: float, out_max: float
         return r
 
 
-def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointType) -> float:
-    """Returns length of arc defined by 3 points"""
+def arc_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointType) -> Tuple[NPPointType, float]:
+    """Returns centre and angle of arc defined by 3 points"""
     ### Meticulously transcribed from
     # https://develop.openfoam.com/Development/openfoam/-/blob/master/src/mesh/blockMesh/blockEdges/arcEdge/arcEdge.C
 
@@ -188,9 +211,6 @@ def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointTy
     mag1 = norm(rad_start)
     mag3 = norm(rad_end)
 
-    # The radius from r1 and from r3 will be identical
-    radius = rad_end
-
     # Determine the angle
     angle = np.arccos((rad_start.dot(rad_end)) / (mag1 * mag3))
 
@@ -198,7 +218,28 @@ def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointTy
     if np.dot(np.cross(rad_start, rad_btw), np.cross(rad_start, rad_end)) < 0:
         angle = 2 * np.pi - angle
 
-    return angle * norm(radius)
+    return centre, angle
+
+
+def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointType) -> float:
+    """Returns length of arc defined by 3 points"""
+    centre, angle = arc_3point(p_start, p_btw, p_end)
+
+    # The radius from r1 and from r3 will be identical
+    return angle * norm(p_end - centre)
+
+
+def divide_arc_3point(
+    p_start: NPPointType, p_btw: NPPointType, p_end: NPPointType, fractions: FloatListType
+) -> NPPointListType:
+    """Returns points at given fractions (0...1) of length of arc defined by 3 points"""
+    centre, angle = arc_3point(p_start, p_btw, p_end)
+
+    # three points on a circle in the order of the arc
+    # make a triangle that winds counterclockwise around rotation axis
+    axis = np.cross(p_btw - p_start, p_end - p_btw)
+
+    return rotate(p_start, np.asarray(fractions) * angle, axis, centre)
 
 
 def divide_arc(
@@ -276,6 +317,23 @@ def point_to_plane_distance(origin: PointType, normal: VectorType, point: PointT
     return abs(np.dot(point - origin, normal))
 
 
+def shear(
+    points: PointListType, normal: VectorType, origin: PointType, direction: VectorType, angle: float
+) -> NPPointListType:
+    """Moves points along a plane, given by origin and normal;
+    the amount of movement is proportional to distance from the plane
+    (regardless of the side) and points on the plane are not moved."""
+    points = np.array(points, dtype=constants.DTYPE)
+    normal = unit_vector(normal)
+    origin = np.asarray(origin, dtype=constants.DTYPE)
+    direction = unit_vector(direction)
+
+    distances = np.abs(np.dot(points - origin, normal))
+    amounts = np.where(distances > constants.TOL, distances / np.tan(angle), 0)
+
+    return points + amounts[..., np.newaxis] * direction
+
+
 def is_point_on_plane(origin: PointType, normal: VectorType, point: PointType) -> bool:
     """Calculated distance between a point and a plane, defined by origin and normal vector"""
     return point_to_plane_distance(origin, normal, point) < constants.TOL
@@ -301,6 +359,50 @@ def polyline_length(points: NPPointListType) -> float:
     return np.sum(np.sqrt(np.sum((points[:-1] - points[1:]) ** 2, axis=1)))
 
 
+def divide_polyline(points: PointListType, fractions: FloatListType) -> NPPointListType:
+    """Returns points at given fractions (0...1) of polyline's length"""
+    points = np.asarray(points, dtype=constants.DTYPE)
+
+    lengths = np.concatenate(([0], np.cumsum(np.sqrt(np.sum(np.diff(points, axis=0) ** 2, axis=1)))))
+    targets = np.asarray(fractions) * lengths[-1]
+
+    return np.stack([np.interp(targets, lengths, points[:, i]) for i in range(3)], axis=1)
+
+
+def catmull_rom(points: PointListType, count: int = 10) -> NPPointListType:
+    """Discretizes a Catmull-Rom spline through given points, as used by
+    blockMesh's spline edges; each segment between two points is divided into 'count' parts.
+
+    Transcribed and vectorized from
+    https://develop.openfoam.com/Development/openfoam/-/blob/master/src/mesh/blockMesh/blockEdges/splineEdge/CatmullRomSpline.C
+    """
+    points = np.asarray(points, dtype=constants.DTYPE)
+
+    # end points: vector symmetry
+    extended = np.concatenate(([2 * points[0] - points[1]], points, [2 * points[-1] - points[-2]]))
+    prev_points = extended[:-3][:, np.newaxis]
+    start_points = extended[1:-2][:, np.newaxis]
+    end_points = extended[2:-1][:, np.newaxis]
+    next_points = extended[3:][:, np.newaxis]
+
+    mu = np.linspace(0, 1, num=count, endpoint=False)[:, np.newaxis]
+
+    segments = 0.5 * (
+        2 * start_points
+        + mu
+        * (
+            (end_points - prev_points)
+            + mu
+            * (
+                (2 * prev_points - 5 * start_points + 4 * end_points - next_points)
+                + mu * (-prev_points + 3 * start_points - 3 * end_points + next_points)
+            )
+        )
+    )
+
+    return np.concatenate((segments.reshape(-1, 3), [points[-1]]))
+
+
 def flatten_2d_list(twodim: List[List]) -> List:
     """Flattens a list of lists to a 1d-list"""
     return list(chain.from_iterable(twodim))
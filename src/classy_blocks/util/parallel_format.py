@@ -0,0 +1,188 @@
+"""Formatting of blocks and edges for blockMeshDict in a pool of processes;
+data, needed for formatting, is collected from each chunk of blocks/edges
+into a compact snapshot of arrays so that no object graphs are pickled.
+Chunks are formatted with the same functions as Block/Edge.description
+and joined in order so that the output is identical to serial formatting."""
+
+import dataclasses
+import math
+import warnings
+from concurrent.futures import Executor
+from typing import Iterator, List
+
+import numpy as np
+
+from classy_blocks.base.exceptions import UndefinedGradingsError
+from classy_blocks.grading.grading import format_specification, is_same_specification
+from classy_blocks.items.block import Block, format_grading, format_hex
+from classy_blocks.items.edges.curve import CurveEdgeBase
+from classy_blocks.items.edges.edge import Edge
+from classy_blocks.types import GradingSpecType
+from classy_blocks.util import constants
+from classy_blocks.util.constants import vector_list_format
+
+# each worker gets this many chunks to balance the load
+CHUNKS_PER_WORKER = 4
+
+
+@dataclasses.dataclass
+class BlockSnapshot:
+    """Everything needed to format a chunk of blocks"""
+
+    # block index, as written in the comment
+    block_indexes: np.ndarray
+    # vertex indexes of each block (n, 8)
+    vertex_indexes: np.ndarray
+    # start of each wire's specification in values (12n + 1),
+    # in the same order as Block.wire_list
+    offsets: np.ndarray
+    # non-inverted (length_ratio, count, total_expansion) of each chop (m, 3)
+    values: np.ndarray
+    # True for values that are integers and must be formatted as such (m, 3)
+    integer: np.ndarray
+    # grading.inverted of each wire (12n)
+    inverted: np.ndarray
+    cell_zones: List[str]
+    comments: List[str]
+
+    @classmethod
+    def from_blocks(cls, blocks: List[Block]) -> "BlockSnapshot":
+        offsets = [0]
+        values: List[GradingSpecType] = []
+        inverted: List[bool] = []
+
+        for block in blocks:
+            for wire in block.wire_list:
+                grading = wire.grading
+
+                if not grading.is_defined:
+                    raise UndefinedGradingsError(f"Grading not defined: {grading}")
+
+                specification = grading.get_specification(False)
+
+                if len(specification) > 1:
+                    # warnings from worker processes would not reach the user
+                    length_ratio_sum = sum((spec[0] for spec in specification), 0.0)
+
+                    if not math.isclose(length_ratio_sum, 1, rel_tol=constants.TOL):
+                        warnings.warn(f"Length ratio doesn't add up to 1: {length_ratio_sum}", stacklevel=2)
+
+                values += specification
+                offsets.append(len(values))
+                inverted.append(grading.inverted)
+
+        integer = [[isinstance(value, (int, np.integer)) for value in spec] for spec in values]
+
+        return cls(
+            np.array([block.index for block in blocks], dtype=np.int64),
+            np.array([block.indexes for block in blocks], dtype=np.int64).reshape(-1, 8),
+            np.array(offsets, dtype=np.int64),
+            np.array(values, dtype=float).reshape(-1, 3),
+            np.array(integer, dtype=bool).reshape(-1, 3),
+            np.array(inverted, dtype=bool),
+            [block.cell_zone for block in blocks],
+            [block.comment for block in blocks],
+        )
+
+
+def format_block_snapshot(snapshot: BlockSnapshot) -> str:
+    """Formats all blocks in a snapshot, exactly as Block.description would"""
+    # restore python ints and floats as they were in chop data
+    values: List[GradingSpecType] = []
+
+    for spec, flags in zip(snapshot.values.tolist(), snapshot.integer.tolist()):
+        length_ratio, count, total_expansion = (int(value) if integer else value for value, integer in zip(spec, flags))
+        values.append((length_ratio, count, total_expansion))
+
+    offsets = snapshot.offsets.tolist()
+    specifications = [values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    # the same as Grading.specification
+    descriptions = [
+        format_specification(
+            [(spec[0], spec[1], 1 / spec[2]) for spec in reversed(specification)] if inverted else specification
+        )
+        for specification, inverted in zip(specifications, snapshot.inverted.tolist())
+    ]
+
+    out = []
+
+    for i, (block_index, indexes) in enumerate(zip(snapshot.block_indexes.tolist(), snapshot.vertex_indexes.tolist())):
+        # wires of each axis
+        axes = [range(12 * i + 4 * axis, 12 * i + 4 * axis + 4) for axis in range(3)]
+        counts = [sum(spec[1] for spec in specifications[wires[0]]) for wires in axes]
+
+        if all(
+            is_same_specification(specifications[wires[0]], specifications[wire]) for wires in axes for wire in wires
+        ):
+            grading = format_grading([descriptions[wires[0]] for wires in axes], True)
+        else:
+            grading = format_grading([" ".join(descriptions[wire] for wire in wires) for wires in axes], False)
+
+        out.append(format_hex(block_index, indexes, snapshot.cell_zones[i], counts, grading, snapshot.comments[i]))
+
+    return "".join(out)
+
+
+@dataclasses.dataclass
+class PointSnapshot:
+    """Points of a chunk of curved edges"""
+
+    # start of each edge's points (n + 1)
+    offsets: np.ndarray
+    # points of all edges (m, 3)
+    points: np.ndarray
+
+    @classmethod
+    def from_edges(cls, edges: List[CurveEdgeBase]) -> "PointSnapshot":
+        arrays = [np.asarray(edge.point_array, dtype=float).reshape(-1, 3) for edge in edges]
+
+        return cls(
+            np.cumsum([0] + [len(array) for array in arrays], dtype=np.int64),
+            np.concatenate(arrays) if len(arrays) > 0 else np.zeros((0, 3)),
+        )
+
+
+def format_point_snapshot(snapshot: PointSnapshot) -> List[str]:
+    """Formatted point list of each edge in a snapshot"""
+    offsets = snapshot.offsets.tolist()
+
+    if len(snapshot.points) == 0:
+        return [""] * (len(offsets) - 1)
+
+    points = vector_list_format(snapshot.points, "\n").split("\n")
+
+    return [" ".join(points[offsets[i] : offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
+
+def get_chunks(items: list, chunk_count: int) -> Iterator[list]:
+    """Splits items into (at most) chunk_count consecutive chunks of similar size"""
+    size = max(1, math.ceil(len(items) / chunk_count))
+
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def format_blocks(blocks: List[Block], executor: Executor, workers: int) -> str:
+    """The same as BlockList.description, formatted by executor's processes"""
+    snapshots = (BlockSnapshot.from_blocks(chunk) for chunk in get_chunks(blocks, workers * CHUNKS_PER_WORKER))
+
+    return "blocks\n(\n" + "".join(executor.map(format_block_snapshot, snapshots)) + ");\n\n"
+
+
+def format_edges(edges: List[Edge], executor: Executor, workers: int) -> str:
+    """The same as EdgeList.description; point lists of curved edges are formatted by executor's processes"""
+    curves = [edge for edge in edges if isinstance(edge, CurveEdgeBase)]
+    snapshots = (PointSnapshot.from_edges(chunk) for chunk in get_chunks(curves, workers * CHUNKS_PER_WORKER))
+
+    point_lists = iter([point_list for chunk in executor.map(format_point_snapshot, snapshots) for point_list in chunk])
+
+    out = "edges\n(\n"
+
+    for edge in edges:
+        if isinstance(edge, CurveEdgeBase):
+            out += edge.format_description(next(point_lists)) + "\n"
+        else:
+            out += edge.description + "\n"
+
+    return out + ");\n\n"
@@ -0,0 +1,348 @@
+"""Generates an OpenFOAM polyMesh directly from assembled blocks, without blockMesh"""
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from classy_blocks.base.exceptions import MeshGenerationError
+from classy_blocks.items.block import Block
+from classy_blocks.items.vertex import Vertex
+from classy_blocks.lists.patch_list import PatchList
+from classy_blocks.types import OrientType
+from classy_blocks.util import constants
+
+# sides whose FACE_MAP points inside the block
+INWARD_SIDES = ("bottom", "left", "front")
+
+# block-local offsets of points of a cell's face that
+# points in positive direction of each axis
+POSITIVE_FACES = (
+    ((1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)),
+    ((0, 1, 0), (0, 1, 1), (1, 1, 1), (1, 1, 0)),
+    ((0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)),
+)
+
+SideKeyType = Tuple[int, ...]
+
+
+def get_side(array: np.ndarray, orient: OrientType) -> np.ndarray:
+    """Returns a view of a block's side from an array, indexed by block-local (i, j, k);
+    the first axis of the returned grid runs from the first to the second corner
+    of FACE_MAP[orient] and the second axis from the first to the fourth corner"""
+    if orient == "bottom":
+        return array[:, :, 0]
+    if orient == "top":
+        return array[:, :, -1]
+    if orient == "left":
+        return array[0, :, ::-1].swapaxes(0, 1)
+    if orient == "right":
+        return array[-1, :, ::-1].swapaxes(0, 1)
+    if orient == "front":
+        return array[:, 0, ::-1]
+
+    # back
+    return array[:, -1, ::-1]
+
+
+def orient_side(corners: Sequence[int], grid: np.ndarray) -> np.ndarray:
+    """Rotates and/or flips a grid on a side, defined by vertex indexes of its corners,
+    so that it starts at the lowest index and runs towards the lower of its neighbours.
+    Grids of the same side, taken from different blocks, are then equal."""
+    corners = list(corners)
+
+    for _ in range(corners.index(min(corners))):
+        corners = corners[1:] + corners[:1]
+        grid = grid[::-1].swapaxes(0, 1)
+
+    if corners[3] < corners[1]:
+        grid = grid.swapaxes(0, 1)
+
+    return grid
+
+
+class PolyMesh:
+    """Points, faces and cells of a mesh, generated from blocks.
+
+    Points on shared vertices, edges and sides are created only once
+    and then found by index arithmetic by other blocks that share them;
+    the same goes for faces on shared sides of blocks."""
+
+    def __init__(self, vertices: List[Vertex], blocks: List[Block], patch_list: PatchList):
+        self.blocks = blocks
+        self.patch_list = patch_list
+
+        # points of vertices come first, in the same order as in blockMeshDict
+        self.point_chunks: List[np.ndarray] = [np.array([vertex.position for vertex in vertices])]
+        self.point_count = len(vertices)
+        self.cell_count = 0
+        self.cell_zones: Dict[str, List[np.ndarray]] = {}
+
+        # indexes of points on vertices, edges and sides, shared between blocks
+        self.edge_points: Dict[Tuple[int, int], np.ndarray] = {}
+        self.side_points: Dict[SideKeyType, np.ndarray] = {}
+
+        # faces within blocks and between blocks
+        self.internal_faces: List[np.ndarray] = []
+        self.internal_owners: List[np.ndarray] = []
+        self.internal_neighbours: List[np.ndarray] = []
+
+        # cells and faces on blocks' sides, oriented by orient_side()
+        self.sides: Dict[SideKeyType, List[Tuple[np.ndarray, np.ndarray]]] = {}
+
+        for block in blocks:
+            self.add_block(block)
+
+        self.faces, self.owner, self.neighbour, self.boundary = self.collect_faces()
+
+    def get_point_indexes(self, block: Block, shape: Tuple[int, ...]) -> np.ndarray:
+        """Returns indexes of all points in a block, reusing shared points
+        and creating new ones where necessary"""
+        indexes = np.full(shape, -1)
+
+        for corner, vertex in enumerate(block.vertices):
+            indexes[tuple(-ijk for ijk in constants.CORNER_IJK[corner])] = vertex.index
+
+        new_edges: List[Tuple[Tuple[int, int], np.ndarray]] = []
+        for wire in block.wire_list:
+            points = indexes[self._get_wire_slice(wire.corners[0], wire.direction)]
+            key = (wire.vertices[0].index, wire.vertices[1].index)
+
+            if key[0] > key[1]:
+                key = (key[1], key[0])
+                points = points[::-1]
+
+            if key in self.edge_points:
+                points[:] = self.edge_points[key]
+            else:
+                new_edges.append((key, points))
+
+        new_sides: List[Tuple[SideKeyType, np.ndarray]] = []
+        for orient, corners in constants.FACE_MAP.items():
+            side_corners = [block.vertices[corner].index for corner in corners]
+            points = orient_side(side_corners, get_side(indexes, orient)[1:-1, 1:-1])
+            side_key = tuple(sorted(side_corners))
+
+            if side_key in self.side_points:
+                points[:] = self.side_points[side_key]
+            else:
+                new_sides.append((side_key, points))
+
+        # whatever is not shared is new
+        new_points = indexes < 0
+        new_count = np.count_nonzero(new_points)
+
+        indexes[new_points] = np.arange(self.point_count, self.point_count + new_count)
+        self.point_chunks.append(block.get_points()[new_points])
+        self.point_count += new_count
+
+        # views of 'indexes' now hold indexes of new points
+        for edge_key, points in new_edges:
+            self.edge_points[edge_key] = points.copy()
+
+        for side_key, points in new_sides:
+            self.side_points[side_key] = points.copy()
+
+        return indexes
+
+    @staticmethod
+    def _get_wire_slice(corner: int, direction: int) -> Tuple:
+        """Index of points inside a wire that starts at given corner"""
+        return tuple(slice(1, -1) if i == direction else -constants.CORNER_IJK[corner][i] for i in range(3))
+
+    def add_block(self, block: Block) -> None:
+        if len(set(block.indexes)) < 8:
+            raise MeshGenerationError(f"Degenerate blocks (wedges, prisms) are not supported: {block.indexes}")
+
+        counts = [axis.count for axis in block.axes]
+
+        points = self.get_point_indexes(block, tuple(count + 1 for count in counts))
+        cells = self.cell_count + np.arange(np.prod(counts)).reshape(counts, order="F")
+        self.cell_count += cells.size
+
+        if block.cell_zone:
+            self.cell_zones.setdefault(block.cell_zone, []).append(cells.ravel("F"))
+
+        # faces between cells within this block
+        for direction, offsets in enumerate(POSITIVE_FACES):
+            owner_counts = list(counts)
+            owner_counts[direction] -= 1
+
+            owners = cells[tuple(slice(0, count) for count in owner_counts)]
+            neighbours = cells[tuple(slice(1, None) if i == direction else slice(None) for i in range(3))]
+
+            self.internal_faces.append(
+                np.stack(
+                    [
+                        points[tuple(slice(offset[i], offset[i] + owner_counts[i]) for i in range(3))].ravel("F")
+                        for offset in offsets
+                    ],
+                    axis=1,
+                )
+            )
+            self.internal_owners.append(owners.ravel("F"))
+            self.internal_neighbours.append(neighbours.ravel("F"))
+
+        # faces on block's sides, to be connected to other blocks or to patches later
+        for orient, corners in constants.FACE_MAP.items():
+            side_corners = [block.vertices[corner].index for corner in corners]
+            side_points = get_side(points, orient)
+
+            if orient in INWARD_SIDES:
+                faces = [side_points[:-1, :-1], side_points[:-1, 1:], side_points[1:, 1:], side_points[1:, :-1]]
+            else:
+                faces = [side_points[:-1, :-1], side_points[1:, :-1], side_points[1:, 1:], side_points[:-1, 1:]]
+
+            side_cells = orient_side(side_corners, get_side(cells, orient))
+            side_faces = orient_side(side_corners, np.stack(faces, axis=-1))
+
+            self.sides.setdefault(tuple(sorted(side_corners)), []).append((side_cells, side_faces))
+
+    def collect_faces(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[str, str, List[str], int]]]:
+        """Connects sides of blocks and sorts faces as OpenFOAM requires:
+        internal faces in upper-triangular order, then boundary faces grouped by patch;
+        returns faces, owner, neighbour and a list of patches (name, type, settings and face count)"""
+        patch_names: Dict[SideKeyType, str] = {}
+        for patch in self.patch_list.patches.values():
+            for side in patch.sides:
+                patch_names[tuple(sorted(vertex.index for vertex in side.vertices))] = patch.name
+
+        default_name = self.patch_list.default.get("name", "defaultFaces")
+        patch_faces: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {name: [] for name in self.patch_list.patches}
+
+        for key, sides in self.sides.items():
+            if len(sides) == 1:
+                side_cells, side_faces = sides[0]
+                patch_faces.setdefault(patch_names.get(key, default_name), []).append(
+                    (side_faces.reshape(-1, 4), side_cells.ravel())
+                )
+            elif len(sides) == 2:
+                (cells_1, faces_1), (cells_2, faces_2) = sides
+
+                # faces must point from owner to neighbour;
+                # take the face of the cell with lower index
+                self.internal_faces.append(
+                    np.where((cells_1 < cells_2)[..., np.newaxis], faces_1, faces_2).reshape(-1, 4)
+                )
+                self.internal_owners.append(np.minimum(cells_1, cells_2).ravel())
+                self.internal_neighbours.append(np.maximum(cells_1, cells_2).ravel())
+            else:
+                raise MeshGenerationError(f"A side is shared between more than two blocks: {key}")
+
+        owners = np.concatenate(self.internal_owners)
+        neighbours = np.concatenate(self.internal_neighbours)
+        order = np.lexsort((neighbours, owners))
+
+        faces = [np.concatenate(self.internal_faces)[order]]
+        owner = [owners[order]]
+        boundary: List[Tuple[str, str, List[str], int]] = []
+
+        for name, chunks in patch_faces.items():
+            if name in self.patch_list.patches:
+                patch = self.patch_list.patches[name]
+                kind, settings = patch.kind, patch.settings
+            elif len(chunks) == 0:
+                continue
+            else:
+                kind, settings = self.patch_list.default.get("kind", "empty"), []
+
+            for patch_points, patch_cells in chunks:
+                faces.append(patch_points)
+                owner.append(patch_cells)
+
+            boundary.append((name, kind, settings, sum(len(chunk[1]) for chunk in chunks)))
+
+        return np.concatenate(faces), np.concatenate(owner), neighbours[order], boundary
+
+    @property
+    def points(self) -> np.ndarray:
+        return np.concatenate(self.point_chunks)
+
+
+def get_header(kind: str, name: str, note: Optional[str] = None) -> str:
+    """FoamFile header for a file in constant/polyMesh"""
+    header = constants.FOAM_BANNER
+    header += "FoamFile\n{\n"
+    header += "    version     2.0;\n"
+    header += "    format      ascii;\n"
+    header += f"    class       {kind};\n"
+
+    if note is not None:
+        header += f'    note        "{note}";\n'
+
+    header += '    location    "constant/polyMesh";\n'
+    header += f"    object      {name};\n"
+    header += "}\n"
+    header += "// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //\n\n"
+
+    return header
+
+
+def write_list(path: str, header: str, data: np.ndarray, fmt: str) -> None:
+    """Writes a list of numbers in OpenFOAM's ascii format"""
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(header)
+        output.write(f"\n{len(data)}\n(\n")
+        np.savetxt(output, data, fmt=fmt)
+        output.write(")\n\n\n")
+        output.write(constants.MESH_FOOTER)
+
+
+def write_polymesh(
+    path: str, vertices: List[Vertex], blocks: List[Block], patch_list: PatchList, scale: float = 1
+) -> PolyMesh:
+    """Generates mesh points, faces and cells from blocks and writes them to
+    'path' (usually case/constant/polyMesh) as blockMesh would;
+    gradings must be defined (see BlockList.assemble())"""
+    mesh = PolyMesh(vertices, blocks, patch_list)
+    os.makedirs(path, exist_ok=True)
+
+    note = (
+        f"nPoints:{mesh.point_count} nCells:{mesh.cell_count} "
+        f"nFaces:{len(mesh.faces)} nInternalFaces:{len(mesh.neighbour)}"
+    )
+
+    write_list(
+        os.path.join(path, "points"), get_header("vectorField", "points"), mesh.points * scale, "(%.10g %.10g %.10g)"
+    )
+    write_list(os.path.join(path, "faces"), get_header("faceList", "faces"), mesh.faces, "4(%d %d %d %d)")
+    write_list(os.path.join(path, "owner"), get_header("labelList", "owner", note), mesh.owner, "%d")
+    write_list(os.path.join(path, "neighbour"), get_header("labelList", "neighbour", note), mesh.neighbour, "%d")
+
+    with open(os.path.join(path, "boundary"), "w", encoding="utf-8") as output:
+        output.write(get_header("polyBoundaryMesh", "boundary"))
+        output.write(f"\n{len(mesh.boundary)}\n(\n")
+
+        start_face = len(mesh.neighbour)
+        for name, kind, settings, count in mesh.boundary:
+            output.write(f"    {name}\n    {{\n")
+            output.write(f"        type            {kind};\n")
+
+            for option in settings:
+                output.write(f"        {option};\n")
+
+            output.write(f"        nFaces          {count};\n")
+            output.write(f"        startFace       {start_face};\n")
+            output.write("    }\n")
+
+            start_face += count
+
+        output.write(")\n\n\n")
+        output.write(constants.MESH_FOOTER)
+
+    if len(mesh.cell_zones) > 0:
+        with open(os.path.join(path, "cellZones"), "w", encoding="utf-8") as output:
+            output.write(get_header("regIOobject", "cellZones"))
+            output.write(f"\n{len(mesh.cell_zones)}\n(\n")
+
+            for name, chunks in mesh.cell_zones.items():
+                cells = np.concatenate(chunks)
+
+                output.write(f"{name}\n{{\n    type cellZone;\ncellLabels List<label> \n{len(cells)}\n(\n")
+                np.savetxt(output, cells, fmt="%d")
+                output.write(")\n;\n}\n\n")
+
+            output.write(")\n\n\n")
+            output.write(constants.MESH_FOOTER)
+
+    return mesh
@@ -0,0 +1,55 @@
+"""Content hashes of blockMeshDict sections, stored in a comment
+at the top of the file so that changes can be detected without
+reading (or parsing) the whole existing file"""
+
+import hashlib
+import itertools
+import os
+from typing import Collection, Dict
+
+from classy_blocks.util.tools import open_text
+
+HASH_PREFIX = "// section hashes:"
+
+# only this many lines are searched for hashes
+HASH_SEARCH_LINES = 30
+
+# prepended to contents of sections that are written to separate files
+INCLUDE_MARK = "#include\n"
+
+# length of stored hashes; truncated sha256 hex digests
+HASH_LENGTH = 16
+
+
+def get_hash(text: str) -> str:
+    """Returns a stable (across runs and platforms) hash of given text"""
+    return hashlib.sha256(text.encode()).hexdigest()[:HASH_LENGTH]
+
+
+def get_hashes(sections: Dict[str, str], included: Collection[str] = ()) -> Dict[str, str]:
+    """Hashes of all sections; hashes of included sections (written to separate files)
+    differ from inline ones so that changing the layout of output is also detected"""
+    return {name: get_hash(INCLUDE_MARK + text if name in included else text) for name, text in sections.items()}
+
+
+def format_hashes(hashes: Dict[str, str]) -> str:
+    return HASH_PREFIX + "".join(f" {name}={value}" for name, value in hashes.items()) + "\n\n"
+
+
+def read_hashes(path: str) -> Dict[str, str]:
+    """Returns section hashes, stored in an existing file;
+    an empty dict if there's no file or no hashes in it"""
+    if not os.path.isfile(path):
+        return {}
+
+    try:
+        with open_text(path, errors="replace") as existing:
+            for line in itertools.islice(existing, HASH_SEARCH_LINES):
+                if line.startswith(HASH_PREFIX):
+                    pairs = [item.split("=", 1) for item in line[len(HASH_PREFIX) :].split()]
+                    return {pair[0]: pair[1] for pair in pairs if len(pair) == 2}
+    except (OSError, EOFError):
+        # a damaged compressed file; treat it as if it wasn't there
+        pass
+
+    return {}
@@ -0,0 +1,78 @@
+import itertools
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from classy_blocks.types import NPPointType, PointType
+from classy_blocks.util import constants
+
+ItemT = TypeVar("ItemT")
+
+CellType = Tuple[int, int, int]
+
+# offsets of a cell and its 26 neighbours
+NEIGHBOURS: List[CellType] = list(itertools.product((-1, 0, 1), (-1, 0, 1), (-1, 0, 1)))
+
+
+class SpatialHash(Generic[ItemT]):
+    """Finds items by position in constant time instead of
+    comparing the position with every stored item.
+
+    Space is divided into cubic cells the size of tolerance and items are
+    stored in a dictionary by the cell their position falls into.
+    An item within tolerance of a given position can only be in the same
+    or one of the neighbouring cells so only those are searched.
+
+    When more items are within tolerance, the one added first is returned,
+    the same as a linear search would."""
+
+    def __init__(self, tolerance: float = constants.TOL):
+        self.tolerance = tolerance
+
+        self.cells: Dict[CellType, List[Tuple[int, NPPointType, ItemT]]] = {}
+        self.count = 0
+
+    def _get_cell(self, position: NPPointType) -> CellType:
+        cell = np.floor(position / self.tolerance).astype(int)
+
+        return (int(cell[0]), int(cell[1]), int(cell[2]))
+
+    def add(self, position: PointType, item: ItemT) -> None:
+        """Stores item at given position; a copy of position is kept so moving
+        the original afterwards does not affect the search"""
+        position = np.array(position, dtype=constants.DTYPE)
+
+        self.cells.setdefault(self._get_cell(position), []).append((self.count, position, item))
+        self.count += 1
+
+    def find(self, position: PointType) -> Optional[ItemT]:
+        """Returns the first added item within tolerance
+        of given position or None if there is none"""
+        position = np.asarray(position, dtype=constants.DTYPE)
+        cell = self._get_cell(position)
+
+        found: Optional[Tuple[int, NPPointType, ItemT]] = None
+
+        for offset in NEIGHBOURS:
+            entries = self.cells.get((cell[0] + offset[0], cell[1] + offset[1], cell[2] + offset[2]))
+            if entries is None:
+                continue
+
+            for entry in entries:
+                if found is not None and found[0] < entry[0]:
+                    continue
+
+                if np.linalg.norm(entry[1] - position) < self.tolerance:
+                    found = entry
+
+        if found is None:
+            return None
+
+        return found[2]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
@@ -1,7 +1,10 @@
 """Misc utilities"""
 
 import dataclasses
+import gzip
+import io
 import os
+from typing import IO
 
 from classy_blocks.base.exceptions import CornerPairError
 from classy_blocks.types import OrientType
@@ -22,6 +25,19 @@ def indent(text: str, levels: int) -> str:
     return "\t" * levels + text + "\n"
 
 
+# OpenFOAM reads gzip-compressed files transparently
+GZIP_SUFFIX = ".gz"
+
+
+def open_text(path: str, mode: str = "r", compression_level: int = 6, errors: str = "strict") -> IO[str]:
+    """Opens a text file for reading ('r') or writing ('w');
+    files ending with .gz are (de)compressed on the fly"""
+    if path.endswith(GZIP_SUFFIX):
+        return io.TextIOWrapper(gzip.GzipFile(path, mode, compression_level), encoding="utf-8", errors=errors)
+
+    return open(path, mode, encoding="utf-8", errors=errors)
+
+
 @dataclasses.dataclass
 class EdgeLocation:
     """A helper class that maps top/bottom/side faces of an operation and corner indexes"""
@@ -1,7 +1,27 @@
-from typing import List
+import base64
+import zlib
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 
 from classy_blocks.items.block import Block
+from classy_blocks.items.patch import Patch
 from classy_blocks.items.vertex import Vertex
+from classy_blocks.optimize.cell import get_hex_qualities
+from classy_blocks.util import constants
+
+VTKEncodingType = Literal["base64", "raw"]
+
+# numpy dtypes and their VTK names; all data is little-endian
+VTK_TYPES = {
+    "float64": "Float64",
+    "int32": "Int32",
+    "int64": "Int64",
+    "uint8": "UInt8",
+}
+
+# size of compressed blocks; VTK's default
+COMPRESSION_BLOCK_SIZE = 2**15
 
 
 def write_vtk(path: str, vertices: List[Vertex], blocks: List[Block]) -> None:
@@ -97,3 +117,251 @@ def write_vtk(path: str, vertices: List[Vertex], blocks: List[Block]) -> None:
 
         for i in range(n_blocks):
             output.write(f"{i}\n")
+
+
+def get_block_data(blocks: List[Block], patches: List[Patch]) -> Dict[str, np.ndarray]:
+    """Collects per-block data for debug output:
+    - block_ids: index of block in blockMeshDict
+    - cell_counts: number of cells along each axis (0 where gradings are not defined yet)
+    - quality: block quality as calculated by the optimizer (NaN for degenerate blocks)
+    - patches: index of patch on each side (in FACE_MAP order) or -1 for internal/default sides
+    - cell_zone: index of cell zone or -1 if the block is not in any"""
+    block_count = len(blocks)
+    vertex_indexes = np.array([block.indexes for block in blocks], dtype=int).reshape(block_count, 8)
+
+    points = np.zeros((np.max(vertex_indexes, initial=-1) + 1, 3))
+    for block in blocks:
+        for vertex in block.vertices:
+            points[vertex.index] = vertex.position
+
+    patch_indexes: Dict[Tuple[int, ...], int] = {}
+    for i, patch in enumerate(patches):
+        for side in patch.sides:
+            patch_indexes[tuple(sorted(vertex.index for vertex in side.vertices))] = i
+
+    side_patches = [
+        [patch_indexes.get(tuple(sorted(indexes[list(corners)])), -1) for corners in constants.FACE_MAP.values()]
+        for indexes in vertex_indexes
+    ]
+
+    zone_names = list(dict.fromkeys(block.cell_zone for block in blocks if block.cell_zone))
+
+    return {
+        "block_ids": np.arange(block_count),
+        "cell_counts": np.array(
+            [[axis.count if axis.is_defined else 0 for axis in block.axes] for block in blocks], dtype=int
+        ).reshape(block_count, 3),
+        "quality": get_hex_qualities(points, vertex_indexes) if block_count > 0 else np.zeros(0),
+        "patches": np.array(side_patches, dtype=int).reshape(block_count, 6),
+        "cell_zone": np.array([zone_names.index(block.cell_zone) if block.cell_zone else -1 for block in blocks]),
+    }
+
+
+def encode_array(data: np.ndarray, compress: bool) -> Tuple[bytes, bytes]:
+    """Returns a header and binary data of an array as VTK expects them;
+    compressed data is split into independently compressed blocks"""
+    raw = data.tobytes()
+
+    if not compress:
+        return np.array([len(raw)], dtype="<u8").tobytes(), raw
+
+    blocks = [raw[i : i + COMPRESSION_BLOCK_SIZE] for i in range(0, len(raw), COMPRESSION_BLOCK_SIZE)] or [b""]
+    compressed = [zlib.compress(block) for block in blocks]
+
+    # number of blocks, size of a block, size of the last block and sizes of compressed blocks
+    header = [len(blocks), COMPRESSION_BLOCK_SIZE, len(blocks[-1]), *[len(block) for block in compressed]]
+
+    return np.array(header, dtype="<u8").tobytes(), b"".join(compressed)
+
+
+ArrayListType = List[Tuple[str, Optional[str], int, np.ndarray]]
+
+
+def get_piece_arrays(points: np.ndarray, connectivity: np.ndarray, cell_data: Dict[str, np.ndarray]) -> ArrayListType:
+    """Collects arrays of a piece of unstructured grid with hexahedral cells,
+    given by 8 point indexes each, together with VTK section names,
+    array names and number of components"""
+    cell_count = len(connectivity)
+
+    arrays: ArrayListType = [
+        ("Points", None, 3, np.asarray(points, dtype="<f8").reshape(-1, 3)),
+        ("Cells", "connectivity", 1, np.asarray(connectivity, dtype="<i8").reshape(-1)),
+        ("Cells", "offsets", 1, np.arange(8, 8 * cell_count + 1, 8, dtype="<i8")),
+        ("Cells", "types", 1, np.full(cell_count, 12, dtype="<u1")),
+    ]
+
+    for name, values in cell_data.items():
+        values = np.asarray(values)
+        dtype = "<f8" if np.issubdtype(values.dtype, np.floating) else "<i4"
+        components = 1 if values.ndim == 1 else values.shape[1]
+
+        arrays.append(("CellData", name, components, values.astype(dtype)))
+
+    return arrays
+
+
+def format_piece(arrays: ArrayListType, compress: bool, appended: Optional[List[bytes]] = None) -> str:
+    """Returns XML of a piece; data is encoded inline (base64) unless
+    an 'appended' list is given, in which case data is added to that list
+    and referenced by offset from its beginning"""
+    point_count = len(arrays[0][3])
+    cell_count = len(arrays[3][3])
+
+    xml = f'<Piece NumberOfPoints="{point_count}" NumberOfCells="{cell_count}">\n'
+    section = ""
+
+    for array_section, array_name, components, values in arrays:
+        if array_section != section:
+            if section:
+                xml += f"</{section}>\n"
+            xml += f"<{array_section}>\n"
+            section = array_section
+
+        header, data = encode_array(np.ascontiguousarray(values), compress)
+
+        xml += f'<DataArray type="{VTK_TYPES[values.dtype.name]}"'
+        if array_name is not None:
+            xml += f' Name="{array_name}"'
+        xml += f' NumberOfComponents="{components}"'
+
+        if appended is not None:
+            xml += f' format="appended" offset="{sum(len(chunk) for chunk in appended)}"/>\n'
+            appended += [header, data]
+        else:
+            # uncompressed header and data are encoded together, compressed separately
+            if compress:
+                encoded = base64.b64encode(header) + base64.b64encode(data)
+            else:
+                encoded = base64.b64encode(header + data)
+
+            xml += f' format="binary">{encoded.decode()}</DataArray>\n'
+
+    return xml + f"</{section}>\n</Piece>\n"
+
+
+def get_vtu_header(compress: bool, comments: Sequence[str]) -> str:
+    compressor = ' compressor="vtkZLibDataCompressor"' if compress else ""
+
+    return (
+        '<?xml version="1.0"?>\n'
+        '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" '
+        f'header_type="UInt64"{compressor}>\n'
+        "<!-- classy_blocks debug output -->\n"
+        + "".join(f"<!-- {comment} -->\n" for comment in comments)
+        + "<UnstructuredGrid>\n"
+    )
+
+
+def write_vtu(
+    path: str,
+    vertices: List[Vertex],
+    blocks: List[Block],
+    cell_data: Optional[Dict[str, np.ndarray]] = None,
+    encoding: VTKEncodingType = "raw",
+    compress: bool = True,
+    comments: Sequence[str] = (),
+) -> None:
+    """Writes blocks as hexahedral cells to a binary VTK XML (.vtu) file; arrays are
+    written in one go from numpy buffers, either as raw appended data or inline base64,
+    optionally compressed with zlib. Cell data can contain scalars (N,) or vectors (N, components);
+    comments are written to the header, for instance to explain what indexes in cell data refer to."""
+    if cell_data is None:
+        cell_data = {"block_ids": np.arange(len(blocks))}
+
+    arrays = get_piece_arrays(
+        np.array([vertex.position for vertex in vertices]),
+        np.array([block.indexes for block in blocks]).reshape(-1, 8),
+        cell_data,
+    )
+
+    appended: Optional[List[bytes]] = [] if encoding == "raw" else None
+
+    with open(path, "wb") as output:
+        output.write(get_vtu_header(compress, comments).encode())
+        output.write(format_piece(arrays, compress, appended).encode())
+        output.write(b"</UnstructuredGrid>\n")
+
+        if appended is not None:
+            output.write(b'<AppendedData encoding="raw">\n_')
+            for chunk in appended:
+                output.write(chunk)
+            output.write(b"\n</AppendedData>\n")
+
+        output.write(b"</VTKFile>\n")
+
+
+def get_cell_sizes(points: np.ndarray) -> np.ndarray:
+    """Sizes of cells along each block axis: averaged lengths of 4 cell edges;
+    takes a grid of points of shape (n0 + 1, n1 + 1, n2 + 1, 3), as returned by Block.get_points(),
+    and returns an array of shape (n0, n1, n2, 3)"""
+    sizes = []
+
+    for direction in range(3):
+        grid = np.moveaxis(points, direction, 0)
+        lengths = np.linalg.norm(grid[1:] - grid[:-1], axis=-1)
+        lengths = (lengths[:, :-1, :-1] + lengths[:, 1:, :-1] + lengths[:, :-1, 1:] + lengths[:, 1:, 1:]) / 4
+
+        sizes.append(np.moveaxis(lengths, 0, direction))
+
+    return np.stack(sizes, axis=-1)
+
+
+def get_expansion_ratios(sizes: np.ndarray) -> np.ndarray:
+    """Ratios between sizes of neighbouring cells along each block axis:
+    size of a cell divided by size of the previous one; 1 for the first cell"""
+    ratios = np.ones_like(sizes)
+
+    for direction in range(3):
+        current = [slice(None)] * 3 + [direction]
+        previous = [slice(None)] * 3 + [direction]
+        current[direction] = slice(1, None)
+        previous[direction] = slice(None, -1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios[tuple(current)] = sizes[tuple(current)] / sizes[tuple(previous)]
+
+    return ratios
+
+
+def get_block_cells(block: Block) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """Points, hexahedral cells and cell data (size and expansion ratio along each block axis)
+    of a single block, interpolated from gradings and edges; points on block boundaries are not merged"""
+    points = block.get_points()
+    shape = points.shape[:3]
+    point_ids = np.arange(np.prod(shape)).reshape(shape)
+
+    connectivity = np.stack(
+        [
+            point_ids[i : i + shape[0] - 1, j : j + shape[1] - 1, k : k + shape[2] - 1]
+            for i, j, k in constants.CORNER_IJK
+        ],
+        axis=-1,
+    ).reshape(-1, 8)
+
+    sizes = get_cell_sizes(points)
+
+    cell_data = {
+        "cell_size": sizes.reshape(-1, 3),
+        "expansion_ratio": get_expansion_ratios(sizes).reshape(-1, 3),
+    }
+
+    return points.reshape(-1, 3), connectivity, cell_data
+
+
+def write_preview(path: str, blocks: List[Block], compress: bool = True) -> None:
+    """Writes actual cells of all blocks to a binary VTK XML (.vtu) file, without running blockMesh;
+    each block is written to its own piece as soon as its points are interpolated so that
+    only a single block is kept in memory at any time. Cell data: block id and
+    cell size and expansion ratio along each block axis.
+
+    Gradings must be defined first (see BlockList.assemble())."""
+    with open(path, "wb") as output:
+        output.write(get_vtu_header(compress, ["cell-level preview, one piece per block"]).encode())
+
+        for block in blocks:
+            points, connectivity, cell_data = get_block_cells(block)
+            cell_data = {"block_id": np.full(len(connectivity), block.index), **cell_data}
+
+            output.write(format_piece(get_piece_arrays(points, connectivity, cell_data), compress).encode())
+
+        output.write(b"</UnstructuredGrid>\n</VTKFile>\n")
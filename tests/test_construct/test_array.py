@@ -0,0 +1,26 @@
+import unittest
+
+import numpy as np
+
+from classy_blocks.construct.array import Array
+from classy_blocks.construct.point import Point
+
+
+class ArrayTests(unittest.TestCase):
+    def setUp(self):
+        self.points = np.random.random((20, 3))
+
+    def test_shear(self):
+        """Shear all points at once the same way as each point separately"""
+        args = ([1, 1, 0], [0.5, 0.5, 0.5], [1, -1, 0], np.pi / 3)
+        array = Array(self.points).shear(*args)
+
+        np.testing.assert_almost_equal(array.points, [Point(point).shear(*args).position for point in self.points])
+
+    def test_shear_version(self):
+        array = Array(self.points)
+        version = array.version
+
+        array.shear([0, 0, 1], [0, 0, 0], [1, 0, 0], np.pi / 4)
+
+        self.assertNotEqual(array.version, version)
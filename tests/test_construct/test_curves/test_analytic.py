@@ -147,9 +147,34 @@ class LineCurveTests(unittest.TestCase):
     def test_center(self):
         np.testing.assert_almost_equal(self.curve.center, [0.5, 0.5, 0])
 
+    def test_copy_translate(self):
+        """A copied curve must use its own points"""
+        curve = self.curve
+        copied = curve.copy().translate([0, 0, 1])
+
+        np.testing.assert_almost_equal(copied.get_point(0.5), [0.5, 0.5, 1])
+        np.testing.assert_almost_equal(curve.get_point(0.5), [0.5, 0.5, 0])
+
     def test_get_param_at_length(self):
         self.assertAlmostEqual(self.curve.get_param_at_length(0.5 * 2**0.5), 0.5)
 
+    @parameterized.expand(
+        (
+            ([0, 0, 0], 0),
+            ([0, 1, 0], 0.5),
+            ([1, 1, 1], 1),
+            ([-1, -1, 0], 0),
+            ([2, 2, 0], 1),
+        )
+    )
+    def test_closest_param(self, point, param):
+        self.assertAlmostEqual(self.curve.get_closest_param(point), param)
+
+    def test_closest_param_extended(self):
+        self.bounds = (-1, 2)
+
+        self.assertAlmostEqual(self.curve.get_closest_param([2, 2, 0]), 2)
+
 
 class CircleCurveTests(unittest.TestCase):
     def setUp(self):
@@ -184,3 +209,38 @@ class CircleCurveTests(unittest.TestCase):
         curve.scale(2)
 
         np.testing.assert_almost_equal(f.norm(curve.get_point(0) - curve.center), 2)
+
+    @parameterized.expand(
+        (
+            ([3, 1, 0], 0),
+            ([1, 3, 1], np.pi / 2),
+            ([0, 1, -1], np.pi),
+            ([1, 0, 0], 3 * np.pi / 2),
+        )
+    )
+    def test_closest_param(self, point, param):
+        self.assertAlmostEqual(self.curve.get_closest_param(point), param)
+
+    @parameterized.expand(
+        (
+            ([0.5, 1.5, 0], np.pi / 2),  # closer to the end
+            ([1.5, 0.5, 0], 0),  # closer to the start
+            ([1, 3, 0], np.pi / 2),
+        )
+    )
+    def test_closest_param_bounded(self, point, param):
+        self.bounds = (0, np.pi / 2)
+
+        self.assertAlmostEqual(self.curve.get_closest_param(point), param)
+
+    def test_closest_param_shifted_bounds(self):
+        self.bounds = (2 * np.pi, 3 * np.pi)
+
+        self.assertAlmostEqual(self.curve.get_closest_param([1, 2, 0]), 5 * np.pi / 2)
+
+    def test_copy_translate(self):
+        curve = self.curve
+        copied = curve.copy().translate([0, 0, 1])
+
+        np.testing.assert_almost_equal(copied.get_point(0), [2, 1, 1])
+        np.testing.assert_almost_equal(curve.get_point(0), [2, 1, 0])
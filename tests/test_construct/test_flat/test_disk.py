@@ -4,7 +4,19 @@ from unittest.mock import patch
 import numpy as np
 from parameterized import parameterized
 
-from classy_blocks.construct.flat.sketches.disk import HalfDisk, OneCoreDisk, Oval, QuarterDisk, WrappedDisk
+from classy_blocks.construct.edges import Spline
+from classy_blocks.construct.flat.sketches.disk import (
+    FourCoreDisk,
+    HalfDisk,
+    OneCoreDisk,
+    Oval,
+    QuarterDisk,
+    WrappedDisk,
+    circular_core_template,
+    get_spline_template,
+    map_spline_template,
+)
+from classy_blocks.construct.flat.sketches.spline_round import SplineDisk
 from classy_blocks.construct.shapes.sphere import get_named_points
 from classy_blocks.util import functions as f
 from classy_blocks.util.constants import TOL
@@ -148,3 +160,39 @@ class OvalTests(unittest.TestCase):
 
         self.assertEqual(len(oval.grid[0]), 6)
         self.assertEqual(len(oval.grid[1]), 10)
+
+
+class SplineTemplateTests(unittest.TestCase):
+    def get_splines(self, sketch):
+        return [edge.curve.discretize() for face in sketch.faces for edge in face.edges if isinstance(edge, Spline)]
+
+    def test_template_roundtrip(self):
+        points = np.random.random((10, 3))
+        points[:, 0] = 0
+
+        template = get_spline_template(points, np.array([0, 1, 0]), np.array([0, 1, 1]))
+
+        np.testing.assert_almost_equal(map_spline_template(template, [0, 1, 0], [0, 1, 1], [0, 0, 0]), points)
+
+    def test_template_readonly(self):
+        template = circular_core_template(FourCoreDisk.spline_ratios)
+
+        with self.assertRaises(ValueError):
+            template[0, 0] = 1
+
+    def test_template_cached(self):
+        FourCoreDisk([0, 0, 0], [1, 0, 0], [0, 0, 1])
+        hits = circular_core_template.cache_info().hits
+
+        FourCoreDisk([1, 1, 1], [3, 1, 1], [0, 1, 0])
+
+        self.assertGreater(circular_core_template.cache_info().hits, hits)
+
+    @parameterized.expand(((0, 0), (0.2, 0.1), (0, 0.3)))
+    def test_spline_disk_similar(self, side_1, side_2):
+        """Splines of a scaled and moved sketch are the same as those of a transformed one"""
+        sketch = SplineDisk([0, 0, 0], [1, 0, 0], [0, 0.5, 0], side_1, side_2)
+        moved = SplineDisk([1, 1, 1], [3, 1, 1], [1, 2, 1], 2 * side_1, 2 * side_2)
+
+        for spline, moved_spline in zip(self.get_splines(sketch), self.get_splines(moved)):
+            np.testing.assert_almost_equal(2 * spline + np.array([1, 1, 1]), moved_spline)
@@ -2,11 +2,13 @@ import unittest
 from typing import cast
 
 import numpy as np
+from parameterized import parameterized
 
 from classy_blocks.base.exceptions import FaceCreationError
 from classy_blocks.base.transforms import Rotation
 from classy_blocks.construct import edges
 from classy_blocks.construct.flat.face import Face
+from classy_blocks.construct.point import Point
 from classy_blocks.util import functions as f
 
 
@@ -216,3 +218,42 @@ class FaceTests(unittest.TestCase):
         face.shear([0, 1, 0], [0, 0, 0], [1, 0, 0], np.pi / 4)
 
         np.testing.assert_almost_equal(face.point_array, [[0, 0, 0], [1, 0, 0], [2, 1, 0], [1, 1, 0]])
+
+    def test_pack(self):
+        face = Face(self.points).pack()
+
+        self.assertTrue(face.is_packed)
+        np.testing.assert_equal(face.point_array, self.points)
+
+    @parameterized.expand(
+        [
+            ("invert", []),
+            ("shift", [1]),
+            ("reorient", [[1, 1, 0]]),
+        ]
+    )
+    def test_pack_reorder(self, method, args):
+        packed = getattr(Face(self.points).pack(), method)(*args)
+        unpacked = getattr(Face(self.points), method)(*args)
+
+        self.assertTrue(packed.is_packed)
+        np.testing.assert_equal(packed.point_array, unpacked.point_array)
+
+    def test_pack_transform(self):
+        packed = Face(self.points).pack()
+        unpacked = Face(self.points)
+
+        for face in (packed, unpacked):
+            face.rotate(1, [1, 1, 1]).translate([1, 2, 3])
+
+        np.testing.assert_almost_equal(packed.point_array, unpacked.point_array)
+
+    def test_pack_replaced_point(self):
+        """Points that are not in buffer are still transformed"""
+        face = Face(self.points).pack()
+        face.points[0] = Point([0, 0, 0])
+
+        face.translate([0, 0, 1])
+
+        self.assertFalse(face.is_packed)
+        np.testing.assert_equal(face.point_array[:, 2], [1, 1, 1, 1])
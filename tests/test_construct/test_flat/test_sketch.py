@@ -49,6 +49,28 @@ class MappedSketchTests(unittest.TestCase):
 
         np.testing.assert_equal(sketch.faces[0].point_array[0], [0.1, 0.1, 0.1])
 
+    def test_positions(self):
+        np.testing.assert_equal(self.sketch.positions, self.positions)
+
+    def test_positions_transformed(self):
+        sketch = self.sketch.translate([0, 0, 1])
+
+        np.testing.assert_equal(sketch.positions, np.array(self.positions) + np.array([0, 0, 1]))
+
+    def test_merge_list(self):
+        """Merge sketches that share points with the first one and with each other"""
+        sketch_1 = MappedSketch(self.positions, self.quads[:1])
+        others = [MappedSketch(self.positions, [quad]) for quad in self.quads[1:]]
+
+        sketch_1.merge(others)
+
+        np.testing.assert_equal(
+            np.asarray([face.point_array for face in sketch_1.faces]),
+            np.asarray([face.point_array for face in self.sketch.faces]),
+        )
+        # no duplicated points
+        self.assertEqual(len(np.unique(sketch_1.indexes)), 9)
+
     def test_merge(self):
         sketch_1_pos = self.positions[:6]
         sketch_2_pos = self.positions[3:]
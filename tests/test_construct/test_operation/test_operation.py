@@ -3,9 +3,11 @@ import unittest
 import numpy as np
 from parameterized import parameterized
 
+from classy_blocks.base import transforms as tr
+from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import EdgeCreationError
 from classy_blocks.base.transforms import Mirror
-from classy_blocks.construct.edges import Arc, Project, Spline
+from classy_blocks.construct.edges import Angle, Arc, Project, Spline
 from classy_blocks.construct.flat.face import Face
 from classy_blocks.construct.operations.extrude import Extrude
 from classy_blocks.construct.operations.loft import Loft
@@ -491,3 +493,67 @@ class OperationTransformTests(unittest.TestCase):
         mirror = extrude.copy().transform([Mirror([0, 0, 1])]).invert()
 
         np.testing.assert_equal(extrude.bottom_face.center, mirror.top_face.center)
+
+    def test_composed_transform(self):
+        """A composed transform gives the same result as transforms, applied one by one"""
+        loft = self.loft
+        loft.bottom_face.add_edge(0, Arc([0.5, -0.25, 0]))
+        loft.top_face.add_edge(1, Spline([[1.1, 0.3, 1], [1.1, 0.6, 1]]))
+        loft.add_side_edge(2, Angle(np.pi / 6, [0, 0, 1]))
+
+        transforms = [
+            tr.Translation([1, 2, 3]),
+            tr.Rotation([1, 1, 0], 0.5),
+            tr.Scaling(1.5),
+            tr.Shear([0, 0, 1], [0, 0, 0.5], [1, 0, 0], np.pi / 3),
+            tr.Rotation([0, 0, 1], -0.3, [1, 0, 0]),
+            tr.Mirror([1, 0, 1], [0.2, 0, 0]),
+        ]
+
+        composed = loft.copy()
+        with self.assertWarns(Warning):
+            composed.transform(transforms)
+
+        sequential = loft.copy()
+        sequential.translate([1, 2, 3])
+        sequential.rotate(0.5, [1, 1, 0])
+        sequential.scale(1.5)
+        sequential.shear([0, 0, 1], [0, 0, 0.5], [1, 0, 0], np.pi / 3)
+        sequential.rotate(-0.3, [0, 0, 1], [1, 0, 0])
+        # Operation.mirror would also invert it
+        ElementBase.mirror(sequential, [1, 0, 1], [0.2, 0, 0])
+
+        np.testing.assert_almost_equal(composed.point_array, sequential.point_array)
+        np.testing.assert_almost_equal(
+            composed.bottom_face.edges[0].point.position, sequential.bottom_face.edges[0].point.position
+        )
+        np.testing.assert_almost_equal(
+            composed.top_face.edges[1].curve.discretize(), sequential.top_face.edges[1].curve.discretize()
+        )
+        np.testing.assert_almost_equal(composed.side_edges[2].axis.components, sequential.side_edges[2].axis.components)
+
+    def test_copy_independent(self):
+        loft = self.loft
+        loft.bottom_face.add_edge(0, Arc([0.5, -0.25, 0]))
+        loft.bottom_face.points[0].project("terrain")
+
+        copied = loft.copy()
+        copied.translate([1, 1, 1])
+        copied.bottom_face.edges[0].translate([1, 1, 1])
+        copied.bottom_face.points[0].project("other")
+
+        np.testing.assert_almost_equal(loft.point_array + 1, copied.point_array)
+        np.testing.assert_almost_equal(loft.bottom_face.edges[0].point.position, [0.5, -0.25, 0])
+        self.assertListEqual(loft.bottom_face.points[0].projected_to, ["terrain"])
+
+    def test_copy_chops(self):
+        """Chops are shared but chopping a copy doesn't affect the original"""
+        self.loft.chop(0, count=10)
+
+        copied = self.loft.copy()
+        copied.chop(0, count=20)
+        copied.chop(1, count=5)
+
+        self.assertIs(copied.chops[0][0], self.loft.chops[0][0])
+        self.assertEqual(len(self.loft.chops[0]), 1)
+        self.assertEqual(len(self.loft.chops[1]), 0)
@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from classy_blocks.base import transforms as tr
+from classy_blocks.construct.operations.box import Box
+from classy_blocks.construct.pattern import LinearPattern, Pattern, PolarPattern
+from classy_blocks.construct.shapes.cylinder import Cylinder
+from classy_blocks.mesh import Mesh
+
+
+class PatternTests(unittest.TestCase):
+    def setUp(self):
+        self.box = Box([0, 0, 0], [1, 1, 1])
+        for axis in range(3):
+            self.box.chop(axis, count=5)
+
+    def test_lazy(self):
+        pattern = LinearPattern(self.box, 10, [2, 0, 0])
+
+        self.assertFalse(pattern.is_materialized)
+        self.assertEqual(len(pattern), 10)
+
+    def test_instances_cached(self):
+        pattern = LinearPattern(self.box, 10, [2, 0, 0])
+
+        self.assertIs(pattern.instances[3], pattern.instances[3])
+
+    def test_template_untouched(self):
+        pattern = LinearPattern(self.box, 3, [2, 0, 0])
+        _ = pattern.operations
+
+        np.testing.assert_equal(self.box.center, [0.5, 0.5, 0.5])
+        self.assertNotIn(self.box, pattern.operations)
+
+    def test_linear(self):
+        pattern = LinearPattern(self.box, 3, [2, 0, 0])
+
+        np.testing.assert_almost_equal(
+            [op.center for op in pattern.operations], [[0.5, 0.5, 0.5], [2.5, 0.5, 0.5], [4.5, 0.5, 0.5]]
+        )
+
+    def test_polar(self):
+        pattern = PolarPattern(self.box, 4, [0, 0, 1], [0, 0, 0])
+
+        np.testing.assert_almost_equal(
+            [op.center for op in pattern.operations],
+            [[0.5, 0.5, 0.5], [-0.5, 0.5, 0.5], [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5]],
+        )
+
+    def test_polar_angle(self):
+        pattern = PolarPattern(self.box, 2, [0, 0, 1], [0, 0, 0], np.pi / 2)
+
+        np.testing.assert_almost_equal(pattern.operations[1].center, [-0.5, 0.5, 0.5])
+
+    def test_shape_operations(self):
+        cylinder = Cylinder([0, 0, 0], [0, 0, 1], [1, 0, 0])
+        pattern = LinearPattern(cylinder, 3, [3, 0, 0])
+
+        self.assertEqual(len(pattern.operations), 3 * len(cylinder.operations))
+
+    def test_custom_transforms(self):
+        pattern = Pattern(self.box, [[], [tr.Scaling(2, [0, 0, 0]), tr.Translation([0, 0, 2])]])
+
+        np.testing.assert_almost_equal(pattern.operations[1].center, [1, 1, 3])
+
+    def test_add(self):
+        pattern = LinearPattern(self.box, 2, [2, 0, 0])
+        _ = pattern.operations
+
+        pattern.add([tr.Translation([0, 2, 0])])
+
+        self.assertEqual(len(pattern.operations), 3)
+        np.testing.assert_almost_equal(pattern.operations[2].center, [0.5, 2.5, 0.5])
+
+    def test_clear(self):
+        pattern = LinearPattern(self.box, 2, [2, 0, 0])
+        _ = pattern.operations
+
+        self.box.translate([0, 0, 1])
+        pattern.clear()
+
+        np.testing.assert_almost_equal(pattern.operations[1].center, [2.5, 0.5, 1.5])
+
+    def test_transform(self):
+        """Transforming a pattern transforms its instances"""
+        pattern = LinearPattern(self.box, 2, [2, 0, 0])
+
+        pattern.translate([0, 0, 1])
+
+        np.testing.assert_almost_equal(pattern.center, [1.5, 0.5, 1.5])
+        np.testing.assert_almost_equal(self.box.center, [0.5, 0.5, 0.5])
+
+    def test_mesh(self):
+        mesh = Mesh()
+        mesh.add(LinearPattern(self.box, 3, [1, 0, 0]))
+        mesh.assemble()
+
+        self.assertEqual(len(mesh.blocks), 3)
+        # neighbouring instances share vertices
+        self.assertEqual(len(mesh.vertices), 16)
@@ -4,7 +4,7 @@ import numpy as np
 from parameterized import parameterized
 
 from classy_blocks.base.exceptions import PointCreationError
-from classy_blocks.construct.point import Point, Vector
+from classy_blocks.construct.point import Point, PointBuffer, Vector
 from classy_blocks.util.constants import TOL
 
 
@@ -85,3 +85,91 @@ class PointTests(unittest.TestCase):
         point.mirror([1, 1, 1])
 
         np.testing.assert_almost_equal(point.position, [-1, -1, -1])
+
+    @parameterized.expand(
+        [
+            ("translate", [[1, 0, 0]]),
+            ("rotate", [1, [0, 0, 1]]),
+            ("scale", [2]),
+            ("mirror", [[1, 0, 0]]),
+            ("shear", [[0, 0, 1], [0, 0, 0], [1, 0, 0], np.pi / 4]),
+            ("move_to", [[2, 2, 2]]),
+        ]
+    )
+    def test_version_change(self, method, args):
+        point = self.point
+        version = point.version
+
+        getattr(point, method)(*args)
+
+        self.assertNotEqual(point.version, version)
+
+    def test_version_unique(self):
+        """Different points never share a version"""
+        self.assertNotEqual(Point([0, 0, 0]).version, Point([0, 0, 0]).version)
+
+
+class PointBufferTests(unittest.TestCase):
+    def setUp(self):
+        self.points = [Point([0, 0, 0]), Point([1, 0, 0]), Point([1, 1, 0])]
+
+    def test_create(self):
+        buffer = PointBuffer(self.points)
+
+        np.testing.assert_equal(buffer.array, [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+
+    def test_create_wrong_shape(self):
+        with self.assertRaises(PointCreationError):
+            PointBuffer(self.points, np.zeros((2, 3)))
+
+    def test_point_view(self):
+        """Moving a point writes to buffer"""
+        buffer = PointBuffer(self.points)
+
+        self.points[1].translate([0, 0, 1])
+
+        np.testing.assert_equal(buffer.array[1], [1, 0, 1])
+
+    def test_buffer_view(self):
+        """Transforming the buffer moves points"""
+        buffer = PointBuffer(self.points)
+
+        buffer.translate([0, 0, 1])
+
+        np.testing.assert_equal(self.points[2].position, [1, 1, 1])
+
+    def test_version_buffer(self):
+        buffer = PointBuffer(self.points)
+        version = self.points[0].version
+
+        buffer.translate([0, 0, 1])
+
+        self.assertNotEqual(self.points[0].version, version)
+
+    def test_detach(self):
+        buffer = PointBuffer(self.points)
+        self.points[0].detach()
+
+        buffer.translate([0, 0, 1])
+
+        np.testing.assert_equal(self.points[0].position, [0, 0, 0])
+        self.assertFalse(buffer.holds(self.points))
+
+    def test_copy(self):
+        buffer = PointBuffer(self.points)
+        clone = buffer.copy()
+
+        clone.translate([0, 0, 1])
+
+        np.testing.assert_equal(self.points[0].position, [0, 0, 0])
+        np.testing.assert_equal(clone.points[0].position, [0, 0, 1])
+        self.assertTrue(clone.holds(clone.points))
+
+    def test_copy_point(self):
+        """A copy of a single point is not attached to anything"""
+        PointBuffer(self.points)
+        point = self.points[0].copy()
+
+        point.translate([0, 0, 1])
+
+        np.testing.assert_equal(self.points[0].position, [0, 0, 0])
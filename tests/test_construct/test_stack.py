@@ -110,3 +110,27 @@ class StackTests(unittest.TestCase):
         stack = cb.ExtrudedStack(self.square_base, 1, 3)
 
         self.assertEqual(len(stack.get_slice(axis, index)), count)
+
+    def test_pack_transform(self):
+        packed = cb.ExtrudedStack(self.round_base, 1, 3).pack()
+        unpacked = cb.ExtrudedStack(self.round_base, 1, 3)
+
+        for stack in (packed, unpacked):
+            stack.rotate(1, [1, 0, 0]).scale(2).translate([1, 1, 1])
+
+        for packed_op, unpacked_op in zip(packed.operations, unpacked.operations):
+            np.testing.assert_almost_equal(packed_op.point_array, unpacked_op.point_array)
+
+    def test_pack_copy(self):
+        """A copy of a packed stack is packed into a new buffer"""
+        stack = cb.ExtrudedStack(self.square_base, 1, 3).pack()
+        clone = stack.copy()
+
+        clone.translate([0, 0, 1])
+
+        np.testing.assert_almost_equal(
+            clone.operations[-1].point_array, stack.operations[-1].point_array + np.array([0, 0, 1])
+        )
+
+        buffers = {id(op.bottom_face.buffer.array.base) for op in clone.operations}  # type: ignore
+        self.assertEqual(len(buffers), 1)
@@ -4,7 +4,13 @@ from classy_blocks.construct.flat.sketches.grid import Grid
 from classy_blocks.construct.shapes.cylinder import Cylinder
 from classy_blocks.construct.shapes.frustum import Frustum
 from classy_blocks.construct.stack import ExtrudedStack
-from classy_blocks.grading.autograding.grader import FixedCountGrader, HighReGrader, SimpleGrader
+from classy_blocks.grading.autograding.grader import (
+    FixedCountGrader,
+    HighReGrader,
+    SimpleGrader,
+    TargetCountGrader,
+    get_levels,
+)
 from classy_blocks.mesh import Mesh
 
 
@@ -59,3 +65,67 @@ class GraderTests(AutogradeTestsBase):
         # make sure all blocks are defined
         for block in self.mesh.blocks:
             self.assertTrue(block.is_defined)
+
+    def test_highre_parallel_same_as_serial(self):
+        def get_specifications(workers):
+            mesh = Mesh()
+            mesh.add(self.get_cylinder())
+            mesh.assemble()
+
+            HighReGrader(mesh, 0.025).grade(workers=workers)
+
+            return [wire.grading.specification for block in mesh.blocks for wire in block.wire_list]
+
+        self.assertEqual(get_specifications(1), get_specifications(2))
+
+    def test_levels_independent(self):
+        self.mesh.add(self.get_stack())
+        self.mesh.assemble()
+
+        grader = SimpleGrader(self.mesh, 0.1)
+        tasks = grader.get_tasks(0, "avg")
+        levels = get_levels(tasks)
+
+        # wires on the same level must not read each other's gradings
+        for i, (wire, _) in enumerate(tasks):
+            inline = {joint.wire for joint in [*wire.before, *wire.after]}
+
+            for j, (other, _) in enumerate(tasks):
+                if levels[i] == levels[j] and i != j:
+                    self.assertFalse(inline & {other, *other.coincidents})
+
+    def test_target_count_estimate(self):
+        self.mesh.add(self.get_stack())
+        self.mesh.assemble()
+
+        grader = TargetCountGrader(self.mesh, 1000)
+
+        # 27 blocks with 3x3x3 cells
+        self.assertEqual(grader.get_total_count(0.1), 27 * 27)
+
+    def test_target_count_stack(self):
+        self.mesh.add(self.get_stack())
+        self.mesh.assemble()
+
+        grader = TargetCountGrader(self.mesh, 1000)
+        grader.grade()
+        self.mesh.block_list.assemble()
+
+        # the next possible refinement would be 27*4**3 > 1000
+        self.assertEqual(self.mesh.cell_count, 27 * 27)
+
+    def test_target_count_cylinder(self):
+        self.mesh.add(self.get_cylinder())
+        self.mesh.assemble()
+
+        grader = TargetCountGrader(self.mesh, 20000)
+        cell_size = grader.get_cell_size()
+        estimated_count = grader.get_total_count(cell_size)
+        # a slightly smaller cell would exceed the target
+        self.assertGreater(grader.get_total_count(cell_size * (1 - 1e-6)), 20000)
+
+        grader.grade()
+        self.mesh.block_list.assemble()
+
+        self.assertLessEqual(self.mesh.cell_count, 20000)
+        self.assertEqual(self.mesh.cell_count, estimated_count)
@@ -84,6 +84,41 @@ class TestGrading(unittest.TestCase):
 
         self.assertEqual(str(self.g.description), expected_output)
 
+    def test_divisions_uniform(self):
+        self.add_chop(1, 4, 1)
+
+        np.testing.assert_almost_equal(self.g.divisions, [0, 0.25, 0.5, 0.75, 1])
+
+    def test_divisions_expansion(self):
+        self.add_chop(1, 10, 5)
+
+        sizes = np.diff(self.g.divisions)
+
+        self.assertAlmostEqual(sizes[-1] / sizes[0], 5)
+        self.assertAlmostEqual(np.sum(sizes), 1)
+
+    def test_divisions_inverted(self):
+        self.add_chop(1, 10, 5)
+        self.g.inverted = True
+
+        sizes = np.diff(self.g.divisions)
+
+        self.assertAlmostEqual(sizes[0] / sizes[-1], 5)
+
+    def test_divisions_multi(self):
+        self.add_chop(0.25, 4, 2)
+        self.add_chop(0.75, 6, 1)
+
+        divisions = self.g.divisions
+
+        self.assertEqual(len(divisions), 11)
+        self.assertAlmostEqual(divisions[4], 0.25)
+        np.testing.assert_almost_equal(np.diff(divisions[4:]), 0.125)
+
+    def test_divisions_undefined(self):
+        with self.assertRaises(UndefinedGradingsError):
+            _ = self.g.divisions
+
     def test_copy_invert_simple(self):
         self.add_chop(1, 10, 5)
 
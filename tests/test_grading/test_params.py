@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from classy_blocks.grading.autograding.params import (
+    HighReChopParams,
+    get_length_ratio,
+    get_length_ratios,
+    get_series_length,
+)
+
+
+class SeriesLengthTests(unittest.TestCase):
+    def test_uniform(self):
+        self.assertAlmostEqual(get_series_length(np.array(0.1), np.array(0.1), np.array(10)), 1)
+
+    def test_graded(self):
+        # 1 + 2 + 4 + 8
+        self.assertAlmostEqual(get_series_length(np.array(1.0), np.array(8.0), np.array(4)), 15)
+
+
+class HighReChopParamsTests(unittest.TestCase):
+    @parameterized.expand(
+        (
+            (10, 1, 0.01, 0.01),
+            (10, 1, 0.01, 0.05),
+            (20, 2, 0.05, 0.01),
+            (6, 1, 0.1, 0.2),
+        )
+    )
+    def test_middle_sizes(self, count, length, size_before, size_after):
+        """The last cell of the first chop and the first cell of the second must match"""
+        params = HighReChopParams(length / count / 2)
+        chops = params.get_chops(1, count, length, size_before, size_after)
+
+        data_1 = chops[0].calculate(length)
+        data_2 = chops[1].calculate(length)
+
+        self.assertAlmostEqual(data_1.start_size, size_before)
+        self.assertAlmostEqual(data_2.end_size, size_after)
+        self.assertAlmostEqual(data_1.end_size, data_2.start_size, places=5)
+
+    def test_symmetric(self):
+        self.assertAlmostEqual(get_length_ratio(5, 1, 0.02, 0.02), 0.5)
+
+    def test_single_cell(self):
+        self.assertEqual(get_length_ratio(1, 1, 0.02, 0.3), 0.5)
+
+    def test_clamped(self):
+        self.assertEqual(get_length_ratio(5, 1, 0.001, 0.5), 0.1)
+
+    def test_batch(self):
+        counts = [5, 10, 3]
+        lengths = [1, 2, 0.5]
+        sizes_before = [0.01, 0.05, 0.1]
+        sizes_after = [0.1, 0.02, 0.1]
+
+        batch = get_length_ratios(counts, lengths, sizes_before, sizes_after)
+        single = [get_length_ratio(*args) for args in zip(counts, lengths, sizes_before, sizes_after)]
+
+        np.testing.assert_array_equal(batch, single)
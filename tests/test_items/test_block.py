@@ -9,6 +9,7 @@ from classy_blocks.items.block import Block
 from classy_blocks.items.vertex import Vertex
 from classy_blocks.items.wires.wire import Wire
 from classy_blocks.types import DirectionType
+from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 from tests.fixtures.block import BlockTestCase
 
@@ -230,6 +231,66 @@ class BlockSimpleGradingTests(BlockTestCase):
         self.assertEqual(block_0.description, expected_description)
 
 
+class BlockPointsTests(BlockTestCase):
+    """Generation of cell points within a block"""
+
+    def get_block(self, index: int) -> Block:
+        block = self.make_block(index)
+
+        for axis in get_args(DirectionType):
+            block.axes[axis].chops = []
+
+        block.add_chops(0, [Chop(count=2)])
+        block.add_chops(1, [Chop(count=3)])
+        block.add_chops(2, [Chop(count=4, total_expansion=3)])
+
+        block.update_wires()
+        block.grade()
+
+        return block
+
+    def test_shape(self):
+        self.assertEqual(self.get_block(2).get_points().shape, (3, 4, 5, 3))
+
+    @parameterized.expand(((0,), (2,)))
+    def test_corners(self, index):
+        block = self.get_block(index)
+        points = block.get_points()
+
+        for corner, vertex in enumerate(block.vertices):
+            np.testing.assert_almost_equal(points[tuple(-ijk for ijk in constants.CORNER_IJK[corner])], vertex.position)
+
+    @parameterized.expand(((0, 0), (0, 1), (0, 2), (2, 0), (2, 1), (2, 2)))
+    def test_wires(self, index, direction):
+        """Points on block edges are taken from wires"""
+        block = self.get_block(index)
+        points = block.get_points()
+
+        for wire in block.get_axis_wires(direction):
+            point_index = [-ijk for ijk in constants.CORNER_IJK[wire.corners[0]]]
+            point_index[direction] = slice(None)
+
+            np.testing.assert_almost_equal(points[tuple(point_index)], wire.get_points())
+
+    def test_straight(self):
+        """Points inside a box-shaped block lie on a regular grid"""
+        block = self.get_block(2)
+        points = block.get_points()
+
+        coords = [
+            block.get_axis_wires(direction)[0].get_points()[:, direction] for direction in get_args(DirectionType)
+        ]
+
+        np.testing.assert_almost_equal(points, np.stack(np.meshgrid(*coords, indexing="ij"), axis=-1))
+
+    def test_curved(self):
+        """Points on curved edges follow the curve"""
+        points = self.get_block(0).get_points()
+
+        # arc edge between corners 0 and 1 bulges outwards
+        self.assertLess(points[1, 0, 0, 1], 0)
+
+
 class BlockEdgeGradingTests(BlockTestCase):
     """Refer to test_edge_grading.py for more involved (function) tests"""
 
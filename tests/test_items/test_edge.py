@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 
 import numpy as np
+from parameterized import parameterized
 
-from classy_blocks.base.exceptions import EdgeCreationError
+from classy_blocks.base.exceptions import EdgeCreationError, MeshGenerationError
 from classy_blocks.construct import edges
 from classy_blocks.construct.curves.interpolated import LinearInterpolatedCurve
 from classy_blocks.construct.point import Point
@@ -261,6 +263,50 @@ class EdgeLengthTests(unittest.TestCase):
         )
 
 
+class EdgePointsTests(unittest.TestCase):
+    """Points along edges for mesh generation"""
+
+    def get_edge(self, data: edges.EdgeData) -> Edge:
+        return factory.create(Vertex([0, 0, 0], 0), Vertex([1, 0, 0], 1), data)
+
+    def test_line(self):
+        np.testing.assert_almost_equal(
+            self.get_edge(edges.Line()).get_points([0, 0.25, 1]), [[0, 0, 0], [0.25, 0, 0], [1, 0, 0]]
+        )
+
+    def test_arc(self):
+        points = self.get_edge(edges.Arc([0.5, 0.5, 0])).get_points([0, 0.5, 1])
+
+        np.testing.assert_almost_equal(points, [[0, 0, 0], [0.5, 0.5, 0], [1, 0, 0]])
+
+    def test_arc_exterior(self):
+        """An arc that spans more than a half circle"""
+        edge = self.get_edge(edges.Origin([0.5, 0.2, 0]))
+        points = edge.get_points(np.linspace(0, 1, 20))
+
+        np.testing.assert_almost_equal(points[[0, -1]], [[0, 0, 0], [1, 0, 0]])
+        self.assertAlmostEqual(f.polyline_length(points), edge.length, places=2)
+
+    def test_degenerate_arc(self):
+        np.testing.assert_almost_equal(self.get_edge(edges.Arc([0.5, 0, 0])).get_points([0.5]), [[0.5, 0, 0]])
+
+    def test_polyline(self):
+        points = self.get_edge(edges.PolyLine([[0, 1, 0], [1, 1, 0]])).get_points([0, 0.5, 1])
+
+        np.testing.assert_almost_equal(points, [[0, 0, 0], [0.5, 1, 0], [1, 0, 0]])
+
+    def test_spline(self):
+        """Spline passes through given points"""
+        points = self.get_edge(edges.Spline([[0, 1, 0], [1, 1, 0]])).get_points(np.linspace(0, 1, 101))
+
+        distances = [np.min(np.linalg.norm(points - point, axis=1)) for point in ([0, 1, 0], [1, 1, 0])]
+        np.testing.assert_array_less(distances, 0.05)
+
+    def test_project(self):
+        with self.assertRaises(MeshGenerationError):
+            self.get_edge(edges.Project("terrain")).get_points([0, 1])
+
+
 class AlternativeArcTests(unittest.TestCase):
     """Origin and Axis arc specification"""
 
@@ -351,6 +397,51 @@ class EdgeDescriptionTests(unittest.TestCase):
             self.get_edge(edges.Project(["terrain", "walls"])).description, "\tproject 0 1 (terrain walls)"
         )
 
+    @parameterized.expand(
+        [
+            (edges.Line(),),
+            (edges.Arc([0.5, 0.5, 0]),),
+            (edges.Origin([0.5, -0.5, 0]),),
+            (edges.Angle(np.pi / 2, [0, 0, 1]),),
+            (edges.Spline([[0.3, 0.2, 0], [0.6, 0.2, 0]]),),
+            (edges.Project("terrain"),),
+            (edges.OnCurve(LinearInterpolatedCurve([[0, 0, 0], [0.5, 0.5, 0], [1, 0, 0]])),),
+        ]
+    )
+    def test_length_cached(self, data):
+        edge = self.get_edge(data)
+        length = edge.length
+
+        with mock.patch.object(type(edge), "calculate_length") as calculate:
+            self.assertEqual(edge.length, length)
+            calculate.assert_not_called()
+
+    def test_length_vertex_moved(self):
+        edge = self.get_edge(edges.Arc([0.5, 0.5, 0]))
+        length = edge.length
+
+        edge.vertex_2.move_to([2, 0, 0])
+
+        self.assertGreater(edge.length, length)
+
+    def test_length_edge_data_moved(self):
+        edge = self.get_edge(edges.Arc([0.5, 0.1, 0]))
+        length = edge.length
+
+        edge.data.translate([0, 0.4, 0])
+
+        self.assertAlmostEqual(edge.length, 0.5 * np.pi)
+        self.assertGreater(edge.length, length)
+
+    def test_length_curve_moved(self):
+        curve = LinearInterpolatedCurve([[0, 0, 0], [0.5, 0.1, 0], [1, 0, 0]])
+        edge = self.get_edge(edges.OnCurve(curve))
+        length = edge.length
+
+        curve.rotate(np.pi / 2, [0, 0, 1], [0, 0, 0])
+
+        self.assertLess(edge.length, length)
+
 
 class OnCurveEdgeTests(unittest.TestCase):
     def setUp(self):
@@ -385,3 +476,24 @@ class OnCurveEdgeTests(unittest.TestCase):
 
     def test_representation(self):
         self.assertEqual(self.edge.representation, "spline")
+
+    def test_params_cached(self):
+        edge = self.edge
+        params = edge.params
+
+        with mock.patch.object(self.curve, "get_closest_param") as closest:
+            _ = edge.length
+            _ = edge.point_array
+            _ = edge.description
+
+            self.assertEqual(edge.params, params)
+            closest.assert_not_called()
+
+    def test_params_vertex_moved(self):
+        edge = self.edge
+        _ = edge.params
+
+        self.vertex_2.move_to([0.5, 0.3, 0])
+
+        self.assertAlmostEqual(edge.param_end, self.curve.get_closest_param([0.5, 0.3, 0]))
+        self.assertLess(edge.param_end, 1)
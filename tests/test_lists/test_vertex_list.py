@@ -108,3 +108,16 @@ class VertexListTests(DataTestCase):
         self.vlist.add(Point(self.vlist.vertices[0].position), ["terrain"])
 
         self.assertEqual(len(self.vlist.vertices), 9)
+
+    def test_description(self):
+        """Bulk-formatted output is the same as descriptions of single vertices"""
+        self.add_all(self.blocks[0].points)
+        self.vlist.vertices[1].project("terrain")
+        self.vlist.vertices[2].move_to([-1e-9, 1 / 3, 12345.678901234])
+
+        expected = "".join([f"\t{vertex.description}\n" for vertex in self.vlist.vertices])
+
+        self.assertEqual(self.vlist.description, "vertices\n(\n" + expected + ");\n\n")
+
+    def test_description_empty(self):
+        self.assertEqual(self.vlist.description, "vertices\n(\n);\n\n")
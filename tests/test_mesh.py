@@ -1,8 +1,13 @@
+import gzip
+import os
+import tempfile
 from unittest import mock
 
 import numpy as np
 from parameterized import parameterized
 
+from classy_blocks.base.exceptions import MeshArchiveError
+from classy_blocks.construct import edges
 from classy_blocks.construct.operations.box import Box
 from classy_blocks.construct.shapes.cylinder import Cylinder
 from classy_blocks.construct.shapes.sphere import EighthSphere
@@ -280,3 +285,270 @@ class MeshTests(BlockTestCase):
         self.mesh.assemble()
 
         self.assertEqual(len(self.mesh.blocks), 3)
+
+    def test_cell_count(self):
+        for i in range(2):
+            box = Box([i, 0, 0], [i + 1, 1, 1])
+            box.chop(0, count=2)
+            box.chop(1, count=3)
+            box.chop(2, count=4)
+
+            self.mesh.add(box)
+
+        self.mesh.assemble()
+        self.mesh.block_list.assemble()
+
+        self.assertListEqual(self.mesh.block_cell_counts, [24, 24])
+        self.assertEqual(self.mesh.cell_count, 48)
+
+
+class MeshWriteTests(BlockTestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+        box = Box([0, 0, 0], [1, 1, 1])
+        for axis in range(3):
+            box.chop(axis, count=2)
+
+        self.box = box
+        self.mesh.add(box)
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "blockMeshDict")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_new(self):
+        self.assertListEqual(
+            self.mesh.write(self.path), ["settings", "geometry", "vertices", "blocks", "edges", "faces", "boundary"]
+        )
+
+    def test_write_unchanged(self):
+        self.mesh.write(self.path)
+
+        self.assertListEqual(self.mesh.write(self.path), [])
+
+    def test_changed_sections(self):
+        self.mesh.write(self.path)
+
+        self.mesh.clear()
+        self.box.set_patch("top", "lid")
+        self.box.chop(0, count=3)
+
+        self.assertListEqual(self.mesh.get_changed_sections(self.path), ["blocks", "boundary"])
+
+    def test_changed_sections_foreign(self):
+        """Files without hashes are considered completely changed"""
+        with open(self.path, "w", encoding="utf-8") as output:
+            output.write("FoamFile {}")
+
+        self.assertEqual(len(self.mesh.get_changed_sections(self.path)), 7)
+
+    def test_skip_unchanged(self):
+        self.mesh.write(self.path)
+        os.utime(self.path, (0, 0))
+
+        self.mesh.write(self.path, skip_unchanged=True)
+
+        self.assertEqual(os.path.getmtime(self.path), 0)
+
+    def test_skip_changed(self):
+        self.mesh.write(self.path)
+        os.utime(self.path, (0, 0))
+
+        self.mesh.clear()
+        self.box.set_patch("top", "lid")
+        self.mesh.write(self.path, skip_unchanged=True)
+
+        self.assertNotEqual(os.path.getmtime(self.path), 0)
+
+    def test_split_files(self):
+        self.mesh.write(self.path, split=True)
+
+        self.assertCountEqual(
+            os.listdir(self.tmpdir.name),
+            ["blockMeshDict"]
+            + [f"blockMeshDict.{name}" for name in ("vertices", "blocks", "edges", "faces", "boundary")],
+        )
+
+    def test_split_includes(self):
+        self.mesh.write(self.path, split=True)
+
+        with open(self.path, encoding="utf-8") as main_file:
+            contents = main_file.read()
+
+        self.assertIn('#include "blockMeshDict.vertices"\n', contents)
+        self.assertNotIn("hex", contents)
+
+        with open(self.path + ".blocks", encoding="utf-8") as blocks_file:
+            self.assertEqual(blocks_file.read(), self.mesh.block_list.description)
+
+    def test_split_unchanged(self):
+        self.mesh.write(self.path, split=True)
+        os.utime(self.path + ".vertices", (0, 0))
+
+        self.mesh.clear()
+        self.box.set_patch("top", "lid")
+
+        self.assertListEqual(self.mesh.write(self.path, split=True), ["boundary"])
+        # vertices are not rewritten
+        self.assertEqual(os.path.getmtime(self.path + ".vertices"), 0)
+
+    def test_split_missing(self):
+        """Deleted include files are rewritten"""
+        self.mesh.write(self.path, split=True)
+        os.remove(self.path + ".edges")
+
+        self.assertListEqual(self.mesh.get_changed_sections(self.path, split=True), ["edges"])
+
+        self.mesh.write(self.path, split=True, skip_unchanged=True)
+        self.assertTrue(os.path.isfile(self.path + ".edges"))
+
+    def test_split_layout_change(self):
+        """Switching between single and split files is a change of included sections"""
+        self.mesh.write(self.path)
+
+        self.assertListEqual(
+            self.mesh.get_changed_sections(self.path, split=True), ["vertices", "blocks", "edges", "faces", "boundary"]
+        )
+
+    def test_write_compressed(self):
+        """Contents of a compressed file are the same as of an uncompressed one"""
+        self.mesh.write(self.path)
+        self.mesh.write(self.path + ".gz")
+
+        with open(self.path, encoding="utf-8") as plain, gzip.open(self.path + ".gz", "rt") as compressed:
+            self.assertEqual(plain.read(), compressed.read())
+
+    @parameterized.expand(((1,), (9,)))
+    def test_compressed_unchanged(self, level):
+        self.mesh.write(self.path + ".gz")
+
+        self.assertListEqual(self.mesh.write(self.path + ".gz", compression_level=level), [])
+
+    def test_compressed_damaged(self):
+        """A file that can't be decompressed is completely rewritten"""
+        with open(self.path + ".gz", "wb") as output:
+            output.write(b"not compressed")
+
+        self.assertEqual(len(self.mesh.write(self.path + ".gz")), 7)
+
+    def test_split_compressed(self):
+        self.mesh.write(self.path + ".gz", split=True)
+
+        self.assertTrue(os.path.isfile(self.path + ".blocks.gz"))
+
+        with gzip.open(self.path + ".gz", "rt") as compressed:
+            # OpenFOAM finds compressed files without the extension
+            self.assertIn('#include "blockMeshDict.blocks"\n', compressed.read())
+
+        with gzip.open(self.path + ".blocks.gz", "rt") as compressed:
+            self.assertEqual(compressed.read(), self.mesh.block_list.description)
+
+    def test_write_parallel(self):
+        """Output, formatted by multiple processes, is identical"""
+        cylinder = Cylinder([4, 0, 0], [4, 0, 1], [5, 0, 0])
+        cylinder.chop_axial(count=3)
+        cylinder.chop_radial(count=4, total_expansion=2)
+        cylinder.chop_tangential(count=5)
+        self.mesh.add(cylinder)
+
+        self.mesh.write(self.path)
+
+        with open(self.path, encoding="utf-8") as serial:
+            contents = serial.read()
+
+        self.assertListEqual(self.mesh.write(self.path, workers=2), [])
+
+        with open(self.path, encoding="utf-8") as parallel:
+            self.assertEqual(parallel.read(), contents)
+
+
+class MeshArchiveTests(BlockTestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+        cylinder = Cylinder([0, 0, 0], [0, 0, 1], [1, 0, 0])
+        cylinder.chop_axial(count=3)
+        cylinder.chop_radial(count=4, total_expansion=2)
+        cylinder.chop_tangential(count=5)
+        cylinder.set_start_patch("inlet")
+        cylinder.set_outer_patch("walls")
+        cylinder.set_cell_zone("fluid")
+        self.mesh.add(cylinder)
+
+        box = Box([2, 0, 0], [3, 1, 1])
+        for axis in range(3):
+            box.chop(axis, count=2)
+        box.add_side_edge(0, edges.Origin([2.5, -1, 0.5], 1.1))
+        box.add_side_edge(1, edges.Angle(0.5, [0, 1, 0]))
+        box.add_side_edge(2, edges.Spline([[3.1, 1, 0.3], [3.1, 1, 0.6]]))
+        box.project_side("top", "terrain", edges=True)
+        self.mesh.add(box)
+
+        self.mesh.modify_patch("walls", "wall")
+        self.mesh.set_default_patch("rest", "wall")
+        self.mesh.merge_patches("inlet", "rest")
+        self.mesh.add_geometry({"terrain": ["type triSurfaceMesh", 'file "terrain.stl"']})
+        self.mesh.settings["scale"] = 0.001
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "mesh.npz")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, mesh: Mesh) -> str:
+        path = os.path.join(self.tmpdir.name, "blockMeshDict")
+        mesh.write(path)
+
+        with open(path, encoding="utf-8") as bmd:
+            return bmd.read()
+
+    def test_roundtrip(self):
+        """A loaded mesh writes an identical blockMeshDict"""
+        self.mesh.save(self.path)
+
+        self.assertEqual(self.write(Mesh.load(self.path)), self.write(self.mesh))
+
+    def test_assembled(self):
+        self.mesh.save(self.path)
+
+        self.assertTrue(Mesh.load(self.path).is_assembled)
+
+    def test_chops(self):
+        self.mesh.save(self.path)
+        mesh = Mesh.load(self.path)
+
+        for original, loaded in zip(self.mesh.blocks, mesh.blocks):
+            for direction in range(3):
+                self.assertListEqual(original.axes[direction].chops, loaded.axes[direction].chops)
+
+    def test_neighbours(self):
+        self.mesh.save(self.path)
+        mesh = Mesh.load(self.path)
+
+        for original, loaded in zip(self.mesh.blocks, mesh.blocks):
+            for direction in range(3):
+                self.assertSetEqual(
+                    {axis.wires[0].vertices[0].index for axis in original.axes[direction].neighbours},
+                    {axis.wires[0].vertices[0].index for axis in loaded.axes[direction].neighbours},
+                )
+
+    def test_cell_count(self):
+        self.mesh.save(self.path)
+
+        self.assertEqual(Mesh.load(self.path).cell_count, self.mesh.cell_count)
+
+    def test_version(self):
+        self.mesh.save(self.path)
+
+        with np.load(self.path) as archive:
+            arrays = dict(archive)
+
+        arrays["metadata"] = np.frombuffer(b'{"version": -1}', dtype=np.uint8)
+        np.savez(self.path, **arrays)
+
+        with self.assertRaises(MeshArchiveError):
+            Mesh.load(self.path)
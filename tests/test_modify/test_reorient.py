@@ -162,3 +162,43 @@ class ViewpointReorienterTests(BlockTestCase):
         self.reorienter.reorient(loft)
 
         np.testing.assert_array_almost_equal(loft.top_face.point_array, [[0, 0, 1], [1, 0, 1], [3, 3, 3], [0, 1, 1]])
+
+    def test_reorient_all(self):
+        """Reorient many operations in different positions at once"""
+        lofts = []
+        for i, (angle, axis) in enumerate(((np.pi / 2, [1, 0, 0]), (np.pi, [0, 1, 0]), (3 * np.pi / 2, [0, 0, 1]))):
+            loft = self.loft.rotate(angle, axis, self.loft.center).translate([i, 0, 0])
+            lofts.append(loft)
+
+        self.reorienter.reorient_all(lofts)
+
+        for i, loft in enumerate(lofts):
+            np.testing.assert_array_almost_equal(
+                loft.point_array,
+                np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]])
+                + np.array([i, 0, 0]),
+            )
+
+    def test_reorient_all_empty(self):
+        self.reorienter.reorient_all([])
+
+    def test_reorient_all_same(self):
+        """Batch reorienting gives the same results as one-by-one"""
+        lofts = [self.loft for _ in range(3)]
+        lofts[0].top_face.rotate(0.9 * np.pi / 4, [0, 0, 1])
+        lofts[1].top_face.points[2].translate([2, 2, 2])
+        lofts[2].rotate(np.pi, [1, 1, 0])
+
+        expected = [loft.copy() for loft in lofts]
+        for loft in expected:
+            self.reorienter.reorient(loft)
+
+        self.reorienter.reorient_all(lofts)
+
+        for loft, expected_loft in zip(lofts, expected):
+            np.testing.assert_array_almost_equal(loft.point_array, expected_loft.point_array)
+
+    def test_permutations(self):
+        points = np.array([self.loft.point_array[[6, 1, 0, 3, 4, 7, 5, 2]]] * 2)
+
+        np.testing.assert_array_equal(self.reorienter.get_permutations(points), [[2, 1, 7, 3, 4, 6, 0, 5]] * 2)
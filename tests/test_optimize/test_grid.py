@@ -5,6 +5,7 @@ from classy_blocks.construct.flat.sketches.disk import OneCoreDisk
 from classy_blocks.construct.flat.sketches.grid import Grid as GridSketch
 from classy_blocks.construct.stack import ExtrudedStack
 from classy_blocks.mesh import Mesh
+from classy_blocks.optimize.cell import get_hex_qualities
 from classy_blocks.optimize.grid import HexGrid, QuadGrid
 from classy_blocks.util import functions as f
 from tests.fixtures.mesh import MeshTestCase
@@ -51,6 +52,23 @@ class HexGridTests(MeshTestCase):
 
             self.assertTrue(junction.is_boundary)
 
+    def test_hex_qualities(self):
+        """Vectorized qualities are the same as qualities of cells"""
+        sketch = GridSketch([0, 0, 0], [1, 1, 0], 2, 2)
+        stack = ExtrudedStack(sketch, 1, 2)
+
+        mesh = Mesh()
+        mesh.add(stack)
+        mesh.assemble()
+        mesh.vertices[0].move_to([-0.2, -0.1, 0.1])
+
+        grid = self.get_grid(mesh)
+        addressing = [block.indexes for block in mesh.blocks]
+
+        np.testing.assert_almost_equal(
+            get_hex_qualities(grid.points, addressing), [cell.quality for cell in grid.cells]
+        )
+
     @parameterized.expand(((0, 1), (1, 2), (2, 3), (3, 1), (4, 1), (5, 2), (6, 3), (7, 1)))
     def test_junction_cells(self, index, count):
         """Each junction contains cells that include that vertex"""
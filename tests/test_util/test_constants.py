@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from classy_blocks.util import constants
+
+
+class VectorFormatTests(unittest.TestCase):
+    @parameterized.expand(
+        (
+            ([[0, 0, 0]],),
+            ([[-0.0, 1e-9, -1e-9], [1 / 3, 2 / 3, 5e-9]],),
+            ([[1e12, -123456.123456785, 0.123456785]],),
+            (np.random.default_rng(0).normal(scale=100, size=(50, 3)),),
+        )
+    )
+    def test_list_format(self, vectors):
+        """Bulk formatting is the same as formatting each vector"""
+        expected = " ".join(constants.vector_format(vector) for vector in vectors)
+
+        self.assertEqual(constants.vector_list_format(vectors), expected)
+
+    def test_list_format_separator(self):
+        self.assertEqual(
+            constants.vector_list_format([[0, 0, 0], [1, 1, 1]], "\n"),
+            "(0.00000000 0.00000000 0.00000000)\n(1.00000000 1.00000000 1.00000000)",
+        )
+
+    def test_list_format_empty(self):
+        self.assertEqual(constants.vector_list_format([]), "")
@@ -0,0 +1,295 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from parameterized import parameterized
+
+from classy_blocks.base.exceptions import DictParseError
+from classy_blocks.construct import edges
+from classy_blocks.construct.operations.box import Box
+from classy_blocks.grading.autograding.grader import FixedCountGrader
+from classy_blocks.mesh import Mesh
+from classy_blocks.util.dict_reader import get_chops, parse_dict, read_tokens
+
+HAND_WRITTEN = """/*--------------------------------*- C++ -*----------------------------------*\\
+  =========                 |
+\\*---------------------------------------------------------------------------*/
+FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       dictionary;
+    object      blockMeshDict;
+}
+
+convertToMeters 0.1;
+
+geometry
+{
+    wall { type searchableBox; min (0 0 0); max (1 1 1); }
+};
+
+vertices
+(
+    (0 0 0)   // 0
+    (1 0 0)
+    (1 1 0)
+    (0 1 0)
+    (0 0 0.1)
+    (1 0 0.1)
+    project (1 1 0.1) (wall)
+    (0 1 0.1)
+    (2 0 0) (2 1 0) (2 0 0.1) (2 1 0.1)
+);
+
+blocks
+(
+    hex (0 1 2 3 4 5 6 7) inner (10 8 1) simpleGrading (((0.2 0.3 4) (0.6 0.4 1) (0.2 0.3 0.25)) 2 1)
+    hex (1 8 9 2 5 10 11 6) (5 8 1) edgeGrading (1 2 2 1  2 2 2 2  1 1 1 1)
+);
+
+edges
+(
+    arc 8 9 (2.2 0.5 0)
+    arc 10 11 origin 1.1 (1.5 0.5 0.1)
+    polyLine 3 7 ((-0.1 1 0.03) (-0.1 1 0.06))
+    project 2 6 (wall)
+);
+
+faces
+(
+    project (7 3 2 6) wall
+);
+
+boundary
+(
+    inlet { type patch; faces ((0 4 7 3)); }
+    walls
+    {
+        type wall;
+        inGroups (walls);
+        faces
+        (
+            (2 6 11 9)
+        );
+    }
+);
+
+defaultPatch { name frontAndBack; type empty; }
+mergePatchPairs ((inlet walls));
+"""
+
+
+class TokenizerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "blockMeshDict")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def get_tokens(self, text: str):
+        with open(self.path, "w", encoding="utf-8") as dict_file:
+            dict_file.write(text)
+
+        return list(read_tokens(self.path))
+
+    def test_comments(self):
+        self.assertListEqual(self.get_tokens("a // b\n/* c\nd */ e; /* f */"), ["a", "e", ";"])
+
+    def test_punctuation(self):
+        self.assertListEqual(self.get_tokens("a(1 2){b;}"), ["a", "(", "1", "2", ")", "{", "b", ";", "}"])
+
+    def test_strings_paths(self):
+        self.assertListEqual(self.get_tokens('file "a b.stl"; dir c/d;'), ["file", '"a b.stl"', ";", "dir", "c/d", ";"])
+
+    @parameterized.expand(((1,), (2,), (3,), (7,)))
+    def test_chunks(self, chunk_size):
+        """Tokens and comments that span multiple chunks"""
+        with mock.patch("classy_blocks.util.dict_reader.CHUNK_SIZE", chunk_size):
+            tokens = self.get_tokens("keyword (1.2345 -6.789) /* long\ncomment */ // another\n last;")
+
+        self.assertListEqual(tokens, ["keyword", "(", "1.2345", "-6.789", ")", "last", ";"])
+
+    def test_include(self):
+        with open(os.path.join(self.tmpdir.name, "included"), "w", encoding="utf-8") as included:
+            included.write("b (1 2);")
+
+        self.assertListEqual(self.get_tokens('a 0;\n#include "included"\nc 3;'), "a 0 ; b ( 1 2 ) ; c 3 ;".split())
+
+    def test_macro(self):
+        with self.assertRaises(DictParseError):
+            self.get_tokens("a $b;")
+
+
+class ParserTests(unittest.TestCase):
+    def parse(self, text: str):
+        return parse_dict(iter(text.split()), top_level=True)
+
+    def test_entries(self):
+        self.assertDictEqual(
+            self.parse("a 1 ; b ( 1 ( 2 3 ) ) ; c { d e ; } ;"),
+            {"a": ["1"], "b": [["1", ["2", "3"]]], "c": {"d": ["e"]}},
+        )
+
+    @parameterized.expand((("a ( 1 ;",), ("a 1",), ("c { d e ;",), ("a ) ;",), ("( a ;",)))
+    def test_invalid(self, text):
+        with self.assertRaises(DictParseError):
+            self.parse(text)
+
+
+class GetChopsTests(unittest.TestCase):
+    def test_single(self):
+        chops = get_chops("4", 10)
+
+        self.assertEqual(len(chops), 1)
+        self.assertEqual(chops[0].count, 10)
+        self.assertEqual(chops[0].total_expansion, 4)
+
+    def test_multi(self):
+        chops = get_chops([["0.2", "0.3", "4"], ["0.6", "0.4", "1"], ["0.2", "0.3", "0.25"]], 10)
+
+        self.assertListEqual([chop.count for chop in chops], [3, 4, 3])
+        self.assertListEqual([chop.length_ratio for chop in chops], [0.2, 0.6, 0.2])
+        self.assertListEqual([chop.total_expansion for chop in chops], [4, 1, 0.25])
+
+    def test_multi_unnormalized(self):
+        chops = get_chops([["1", "1", "1"], ["3", "2", "1"]], 7)
+
+        self.assertListEqual([chop.count for chop in chops], [2, 5])
+        self.assertListEqual([chop.length_ratio for chop in chops], [0.25, 0.75])
+
+
+class ReadDictTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "blockMeshDict")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read(self, text: str = HAND_WRITTEN) -> Mesh:
+        with open(self.path, "w", encoding="utf-8") as dict_file:
+            dict_file.write(text)
+
+        return Mesh.read(self.path)
+
+    def test_settings(self):
+        self.assertEqual(self.read().settings["scale"], 0.1)
+
+    def test_geometry(self):
+        self.assertListEqual(
+            self.read().geometry_list.geometry["wall"], ["type searchableBox", "min (0 0 0)", "max (1 1 1)"]
+        )
+
+    def test_vertices(self):
+        mesh = self.read()
+
+        self.assertEqual(len(mesh.vertices), 12)
+        np.testing.assert_equal(mesh.vertices[6].position, [1, 1, 0.1])
+        self.assertListEqual(mesh.vertices[6].projected_to, ["wall"])
+
+    def test_edges(self):
+        mesh = self.read()
+
+        self.assertListEqual([edge.kind for edge in mesh.edge_list.edges], ["arc", "origin", "polyLine", "project"])
+        self.assertIsInstance(mesh.edge_list.edges[1].data, edges.Origin)
+        self.assertEqual(mesh.edge_list.edges[1].data.flatness, 1.1)
+
+    def test_block_edges(self):
+        mesh = self.read()
+
+        self.assertEqual(mesh.blocks[1].wires[1][2].edge.kind, "arc")
+
+    def test_cell_zone(self):
+        mesh = self.read()
+
+        self.assertEqual(mesh.blocks[0].cell_zone, "inner")
+        self.assertEqual(mesh.blocks[1].cell_zone, "")
+
+    def test_simple_grading(self):
+        mesh = self.read()
+        mesh.block_list.assemble()
+
+        self.assertListEqual([axis.count for axis in mesh.blocks[0].axes], [10, 8, 1])
+        self.assertListEqual(
+            mesh.blocks[0].axes[0].wires[0].grading.specification, [(0.2, 3, 4), (0.6, 4, 1), (0.2, 3, 0.25)]
+        )
+
+    def test_edge_grading(self):
+        mesh = self.read()
+        mesh.block_list.assemble()
+
+        self.assertListEqual([wire.grading.specification[0][2] for wire in mesh.blocks[1].axes[0].wires], [1, 2, 2, 1])
+        self.assertIn("edgeGrading ( 1 2 2 1 2 2 2 2 1 1 1 1 )", mesh.blocks[1].description)
+
+    def test_autograde(self):
+        mesh = self.read()
+        FixedCountGrader(mesh, 5).grade()
+        mesh.block_list.assemble()
+
+        self.assertEqual(mesh.cell_count, 2 * 5**3)
+
+    def test_patches(self):
+        mesh = self.read()
+        patches = mesh.patch_list.patches
+
+        self.assertListEqual(list(patches.keys()), ["inlet", "walls"])
+        self.assertEqual(patches["walls"].kind, "wall")
+        self.assertListEqual(patches["walls"].settings, ["inGroups (walls)"])
+        self.assertSetEqual({vertex.index for vertex in patches["walls"].sides[0].vertices}, {2, 6, 11, 9})
+
+    def test_default_merged(self):
+        mesh = self.read()
+
+        self.assertDictEqual(mesh.patch_list.default, {"name": "frontAndBack", "kind": "empty"})
+        self.assertListEqual(mesh.patch_list.merged, [["inlet", "walls"]])
+
+    def test_faces(self):
+        mesh = self.read()
+
+        self.assertEqual(mesh.face_list.faces[0].label, "wall")
+        self.assertSetEqual({vertex.index for vertex in mesh.face_list.faces[0].side.vertices}, {7, 3, 2, 6})
+
+    def test_old_patches(self):
+        text = HAND_WRITTEN.split("boundary")[0] + "patches ( wall walls ( (0 4 7 3) ) );"
+
+        self.assertEqual(self.read(text).patch_list.patches["walls"].kind, "wall")
+
+    def test_missing_side(self):
+        with self.assertRaises(DictParseError):
+            self.read(HAND_WRITTEN.replace("(2 6 11 9)", "(2 6 11 8)"))
+
+    def test_invalid_vertex(self):
+        with self.assertRaises(DictParseError):
+            self.read(HAND_WRITTEN.replace("hex (0 1 2", "hex (0 1 20"))
+
+    def test_unsupported_shape(self):
+        with self.assertRaises(DictParseError):
+            self.read(HAND_WRITTEN.replace("hex (0 1 2", "prism (0 1 2"))
+
+    def test_unknown_entry(self):
+        with self.assertWarns(UserWarning):
+            self.read(HAND_WRITTEN + "\nnamedVertices ();")
+
+    @parameterized.expand(((False, ""), (True, ""), (False, ".gz"), (True, ".gz")))
+    def test_roundtrip(self, split, suffix):
+        """A mesh, read from a blockMeshDict written by classy_blocks, writes the same mesh"""
+        mesh = Mesh()
+        for i in range(2):
+            box = Box([i, 0, 0], [i + 1, 1, 1])
+            for axis in range(3):
+                box.chop(axis, count=3 + i, total_expansion=2)
+            box.add_side_edge(0, edges.Arc([i + 0.5, -0.2, 0]))
+            box.set_patch("bottom", "floor")
+            mesh.add(box)
+        mesh.operations[0].project_side("top", "terrain", edges=True)
+        mesh.add_geometry({"terrain": ["type triSurfaceMesh", 'file "terrain.stl"']})
+        mesh.set_default_patch("walls", "wall")
+
+        path = self.path + suffix
+        mesh.write(path, split=split)
+
+        self.assertListEqual(Mesh.read(path).get_changed_sections(path, split=split), [])
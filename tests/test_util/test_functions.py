@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import scipy.linalg
 from parameterized import parameterized
 
 from classy_blocks.util import functions as f
@@ -62,6 +63,55 @@ class TestFunctions(unittest.TestCase):
 
         self.assert_np_almost_equal(f.rotate(point, np.pi, axis, origin), f.vector(0, 1, 0))
 
+    def test_rotation_matrix(self):
+        """Rodrigues' formula yields the same matrix as a matrix exponential"""
+        axis = f.vector(0.3, -0.5, 0.8)
+        angle = 1.1
+
+        expected = scipy.linalg.expm(np.cross(np.eye(3), f.unit_vector(axis) * angle))
+
+        self.assert_np_almost_equal(f.rotation_matrix(axis, angle), expected)
+
+    def test_rotate_points(self):
+        """Rotate multiple points by the same angle"""
+        points = [[1, 0, 0], [0, 1, 0], [2, 0, 1]]
+
+        self.assert_np_almost_equal(
+            f.rotate(points, np.pi / 2, [0, 0, 1], [0, 0, 0]), [[0, 1, 0], [-1, 0, 0], [0, 2, 1]]
+        )
+
+    def test_rotate_angles(self):
+        """Rotate a single point by multiple angles"""
+        angles = np.linspace(0, 2 * np.pi, num=5)
+
+        self.assert_np_almost_equal(
+            f.rotate([1, 0, 0], angles, [0, 0, 1], [0, 0, 0]),
+            [[1, 0, 0], [0, 1, 0], [-1, 0, 0], [0, -1, 0], [1, 0, 0]],
+        )
+
+    def test_rotate_points_angles(self):
+        """Rotate each point by its own angle"""
+        points = np.random.random((10, 3))
+        angles = np.random.random(10)
+        axis = f.vector(1, 2, 3)
+        origin = f.vector(0.5, 0.5, 0.5)
+
+        expected = [f.rotate(point, angle, axis, origin) for point, angle in zip(points, angles)]
+
+        self.assert_np_almost_equal(f.rotate(points, angles, axis, origin), expected)
+
+    def test_shear_points(self):
+        """Points on both sides of the plane are moved in the same direction, those on the plane are not"""
+        points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, -2, 0]]
+
+        self.assert_np_almost_equal(
+            f.shear(points, [0, 1, 0], [0, 0, 0], [1, 0, 0], np.pi / 4),
+            [[0, 0, 0], [1, 0, 0], [1, 1, 0], [2, -2, 0]],
+        )
+
+    def test_shear_single(self):
+        self.assert_np_almost_equal(f.shear([0, 1, 0], [0, 2, 0], [0, 0, 0], [3, 0, 0], np.pi / 4), [1, 1, 0])
+
     def test_to_polar_z_axis(self):
         """cartesian coordinate system to polar c.s., rotation around z-axis"""
         cartesian = f.vector(2, 2, 5)
@@ -267,6 +317,34 @@ class TestFunctions(unittest.TestCase):
 
         self.assertAlmostEqual(f.polyline_length(points), 3)
 
+    def test_divide_polyline(self):
+        points = [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]]
+
+        self.assert_np_almost_equal(f.divide_polyline(points, [0, 0.5, 1]), [[0, 0, 0], [0.5, 1, 0], [1, 0, 0]])
+
+    def test_divide_arc_3point(self):
+        points = f.divide_arc_3point(f.vector(1, 0, 0), f.vector(0, 1, 0), f.vector(-1, 0, 0), [0, 0.25, 1])
+
+        self.assert_np_almost_equal(points, [[1, 0, 0], [2**0.5 / 2, 2**0.5 / 2, 0], [-1, 0, 0]])
+
+    def test_divide_arc_3point_exterior(self):
+        """An arc that goes around the long way"""
+        points = f.divide_arc_3point(f.vector(1, 0, 0), f.vector(0, 1, 0), f.vector(0, -1, 0), [0, 1 / 3, 1])
+
+        self.assert_np_almost_equal(points, [[1, 0, 0], [0, 1, 0], [0, -1, 0]])
+
+    def test_catmull_rom(self):
+        """Spline passes through all points"""
+        points = np.array([[0, 0, 0], [1, 1, 0], [2, 0, 0], [3, 1, 0]])
+
+        self.assert_np_almost_equal(f.catmull_rom(points, 5)[::5], points)
+
+    def test_catmull_rom_line(self):
+        """Points on a line produce a line"""
+        spline = f.catmull_rom([[0, 0, 0], [1, 0, 0], [2, 0, 0]], 4)
+
+        self.assert_np_almost_equal(spline[:, 0], np.linspace(0, 2, 9))
+
     def test_polyline_singlepoint(self):
         points = np.array(
             [
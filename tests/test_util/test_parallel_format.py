@@ -0,0 +1,79 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from parameterized import parameterized
+
+from classy_blocks.base.exceptions import UndefinedGradingsError
+from classy_blocks.construct import edges
+from classy_blocks.construct.operations.box import Box
+from classy_blocks.construct.shapes.cylinder import Cylinder
+from classy_blocks.mesh import Mesh
+from classy_blocks.util.parallel_format import format_blocks, format_edges, get_chunks
+
+
+class GetChunksTests(unittest.TestCase):
+    @parameterized.expand(((0, 3, []), (5, 2, [3, 2]), (5, 10, [1, 1, 1, 1, 1]), (9, 3, [3, 3, 3])))
+    def test_sizes(self, count, chunk_count, sizes):
+        self.assertListEqual([len(chunk) for chunk in get_chunks(list(range(count)), chunk_count)], sizes)
+
+    def test_order(self):
+        chunks = list(get_chunks(list(range(10)), 3))
+
+        self.assertListEqual([item for chunk in chunks for item in chunk], list(range(10)))
+
+
+class ParallelFormatTests(unittest.TestCase):
+    """Formatting in chunks produces the same output as serial formatting;
+    threads are used instead of processes to keep tests quick"""
+
+    def setUp(self):
+        self.mesh = Mesh()
+
+        # inverted wires and mixed int/float expansion ratios
+        cylinder = Cylinder([0, 0, 0], [0, 0, 1], [1, 0, 0])
+        cylinder.chop_axial(count=3)
+        cylinder.chop_radial(count=4, total_expansion=2)
+        cylinder.chop_tangential(count=5)
+        cylinder.set_cell_zone("fluid")
+        self.mesh.add(cylinder)
+
+        # multi-grading, edgeGrading and curved edges
+        box = Box([2, 0, 0], [3, 1, 1])
+        box.add_side_edge(0, edges.Spline([[1.8, -0.2, 0.3], [1.7, -0.3, 0.6]]))
+        box.add_side_edge(1, edges.PolyLine([[3.2, -0.1, 0.3], [3.3, -0.1, 0.6]]))
+        box.chop(0, count=2)
+        box.chop(1, length_ratio=0.5, count=3, total_expansion=4)
+        box.chop(1, length_ratio=0.5, count=3, total_expansion=0.25)
+        box.chop(2, start_size=0.05, preserve="start_size")
+        self.mesh.add(box)
+
+        self.mesh.assemble()
+
+    def format_blocks(self, workers: int) -> str:
+        with ThreadPoolExecutor(workers) as executor:
+            return format_blocks(self.mesh.block_list.blocks, executor, workers)
+
+    def format_edges(self, workers: int) -> str:
+        with ThreadPoolExecutor(workers) as executor:
+            return format_edges(self.mesh.edge_list.edges, executor, workers)
+
+    @parameterized.expand(((1,), (2,), (5,)))
+    def test_blocks(self, workers):
+        self.mesh.block_list.assemble()
+
+        self.assertEqual(self.format_blocks(workers), self.mesh.block_list.description)
+
+    def test_edge_grading(self):
+        self.mesh.block_list.assemble()
+
+        self.assertIn("edgeGrading", self.format_blocks(2))
+
+    @parameterized.expand(((1,), (2,), (5,)))
+    def test_edges(self, workers):
+        self.assertEqual(self.format_edges(workers), self.mesh.edge_list.description)
+
+    def test_undefined_grading(self):
+        self.mesh.block_list.update()
+
+        with self.assertRaises(UndefinedGradingsError):
+            self.format_blocks(2)
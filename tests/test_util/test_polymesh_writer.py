@@ -0,0 +1,220 @@
+import os
+import tempfile
+import unittest
+from typing import get_args
+
+import numpy as np
+from parameterized import parameterized
+
+from classy_blocks.base.exceptions import MeshGenerationError
+from classy_blocks.construct import edges
+from classy_blocks.construct.operations.box import Box
+from classy_blocks.construct.shapes.cylinder import Cylinder
+from classy_blocks.mesh import Mesh
+from classy_blocks.types import DirectionType
+from classy_blocks.util.polymesh_writer import PolyMesh, orient_side
+
+
+class OrientSideTests(unittest.TestCase):
+    @parameterized.expand(
+        (
+            ([0, 1, 2, 3],),
+            ([1, 2, 3, 0],),
+            ([2, 3, 0, 1],),
+            ([3, 0, 1, 2],),
+            ([0, 3, 2, 1],),
+            ([1, 0, 3, 2],),
+            ([2, 1, 0, 3],),
+            ([3, 2, 1, 0],),
+        )
+    )
+    def test_orient(self, corners):
+        """The same side, viewed from all possible orientations"""
+        # corners 0, 1, 2 and 3 are at [0, 0], [-1, 0], [-1, -1] and [0, -1]
+        grid = np.arange(12).reshape(3, 4)
+        corner_values = [grid[0, 0], grid[-1, 0], grid[-1, -1], grid[0, -1]]
+
+        # find a view of the grid that starts at corners[0] and runs towards corners[1] and corners[3]
+        views = [np.rot90(grid, i) for i in range(4)] + [np.rot90(grid.T, i) for i in range(4)]
+        view = next(
+            view
+            for view in views
+            if [view[0, 0], view[-1, 0], view[0, -1]] == [corner_values[corners[i]] for i in (0, 1, 3)]
+        )
+
+        np.testing.assert_equal(orient_side(corners, view), grid)
+
+
+class PolyMeshTests(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+    def get_polymesh(self) -> PolyMesh:
+        self.mesh.assemble()
+        self.mesh.block_list.assemble()
+
+        return PolyMesh(self.mesh.vertices, self.mesh.blocks, self.mesh.patch_list)
+
+    def add_box(self, point_1, point_2, count: int = 2) -> Box:
+        box = Box(point_1, point_2)
+        for axis in get_args(DirectionType):
+            box.chop(axis, count=count)
+
+        self.mesh.add(box)
+
+        return box
+
+    def check_validity(self, polymesh: PolyMesh) -> None:
+        """Checks that cells are closed, have positive volumes and all
+        points are properly merged, and that faces are ordered as OpenFOAM expects"""
+        internal_count = len(polymesh.neighbour)
+        faces = polymesh.points[polymesh.faces]
+
+        areas = 0.5 * np.cross(faces[:, 2] - faces[:, 0], faces[:, 3] - faces[:, 1])
+        volumes = np.sum(np.average(faces, axis=1) * areas, axis=1) / 3
+
+        sums = np.zeros((polymesh.cell_count, 3))
+        np.add.at(sums, polymesh.owner, areas)
+        np.add.at(sums, polymesh.neighbour, -areas[:internal_count])
+
+        cell_volumes = np.zeros(polymesh.cell_count)
+        np.add.at(cell_volumes, polymesh.owner, volumes)
+        np.add.at(cell_volumes, polymesh.neighbour, -volumes[:internal_count])
+
+        # closed cells
+        np.testing.assert_almost_equal(sums, 0)
+        # not inside-out
+        self.assertGreater(np.min(cell_volumes), 0)
+        # no duplicated points
+        self.assertEqual(len(np.unique(np.round(polymesh.points, 6), axis=0)), polymesh.point_count)
+        # upper-triangular order
+        self.assertTrue(np.all(polymesh.owner[:internal_count] < polymesh.neighbour))
+        order = np.lexsort((polymesh.neighbour, polymesh.owner[:internal_count]))
+        np.testing.assert_equal(order, np.arange(internal_count))
+
+    def test_single(self):
+        self.add_box([0, 0, 0], [1, 1, 1])
+        polymesh = self.get_polymesh()
+
+        self.assertEqual(polymesh.point_count, 27)
+        self.assertEqual(polymesh.cell_count, 8)
+        self.assertEqual(len(polymesh.faces), 36)
+        self.assertEqual(len(polymesh.neighbour), 12)
+        self.check_validity(polymesh)
+
+    def test_two_blocks(self):
+        self.add_box([0, 0, 0], [1, 1, 1])
+        self.add_box([1, 0, 0], [2, 1, 1])
+        polymesh = self.get_polymesh()
+
+        self.assertEqual(polymesh.point_count, 45)
+        self.assertEqual(len(polymesh.neighbour), 28)
+        self.check_validity(polymesh)
+
+    def test_two_blocks_rotated(self):
+        """Blocks with different orientations"""
+        self.add_box([0, 0, 0], [1, 1, 1])
+        box = self.add_box([1, 0, 0], [2, 1, 1])
+        box.rotate(np.pi / 2, [1, 0, 0], [1.5, 0.5, 0.5])
+
+        polymesh = self.get_polymesh()
+
+        self.assertEqual(polymesh.point_count, 45)
+        self.check_validity(polymesh)
+
+    def test_edge_neighbours(self):
+        """Blocks that only share an edge"""
+        self.add_box([0, 0, 0], [1, 1, 1])
+        self.add_box([1, 1, 0], [2, 2, 1])
+
+        polymesh = self.get_polymesh()
+
+        self.assertEqual(polymesh.point_count, 2 * 27 - 3)
+        self.check_validity(polymesh)
+
+    def test_cylinder(self):
+        cylinder = Cylinder([0, 0, 0], [0, 0, 1], [1, 0, 0])
+        cylinder.chop_axial(count=3)
+        cylinder.chop_radial(count=4, total_expansion=2)
+        cylinder.chop_tangential(count=5)
+        self.mesh.add(cylinder)
+
+        polymesh = self.get_polymesh()
+
+        self.check_validity(polymesh)
+
+    def test_curved_edge(self):
+        """Both blocks use the same points on a shared curved edge"""
+        box = self.add_box([0, 0, 0], [1, 1, 1], 4)
+        box.add_side_edge(1, edges.Arc([1.2, 0, 0.5]))
+        self.add_box([1, 0, 0], [2, 1, 1], 4)
+
+        polymesh = self.get_polymesh()
+
+        self.check_validity(polymesh)
+        self.assertAlmostEqual(np.max(polymesh.points[:, 0]), 2)
+
+    def test_patches(self):
+        box = self.add_box([0, 0, 0], [1, 1, 1])
+        box.set_patch("bottom", "floor")
+        self.mesh.modify_patch("floor", "wall")
+        self.mesh.set_default_patch("walls", "wall")
+
+        polymesh = self.get_polymesh()
+
+        self.assertEqual(polymesh.boundary, [("floor", "wall", [], 4), ("walls", "wall", [], 20)])
+        np.testing.assert_almost_equal(polymesh.points[polymesh.faces[12:16]][:, :, 2], 0)
+
+    def test_cell_zones(self):
+        box = self.add_box([0, 0, 0], [1, 1, 1])
+        box.set_cell_zone("solid")
+        self.add_box([1, 0, 0], [2, 1, 1])
+
+        polymesh = self.get_polymesh()
+
+        np.testing.assert_equal(polymesh.cell_zones["solid"][0], np.arange(8))
+
+
+class WritePolyMeshTests(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+        box = Box([0, 0, 0], [1, 1, 1])
+        for axis in range(3):
+            box.chop(axis, count=2)
+
+        box.set_patch("top", "lid")
+        self.mesh.add(box)
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as case_path:
+            self.mesh.write_polymesh(case_path)
+
+            path = os.path.join(case_path, "constant", "polyMesh")
+            self.assertCountEqual(os.listdir(path), ["points", "faces", "owner", "neighbour", "boundary"])
+
+            with open(os.path.join(path, "boundary"), encoding="utf-8") as boundary:
+                contents = boundary.read()
+
+            self.assertIn("nFaces          4;\n        startFace       12;", contents)
+
+    def test_scale(self):
+        self.mesh.settings["scale"] = 0.001
+
+        with tempfile.TemporaryDirectory() as case_path:
+            self.mesh.write_polymesh(case_path)
+
+            with open(os.path.join(case_path, "constant", "polyMesh", "points"), encoding="utf-8") as points:
+                self.assertIn("(0.001 0.001 0.001)", points.read())
+
+    def test_merged_patches(self):
+        self.mesh.merge_patches("lid", "top")
+
+        with self.assertRaises(MeshGenerationError):
+            self.mesh.write_polymesh("")
+
+    def test_project(self):
+        self.mesh.operations[0].project_side("bottom", "terrain")
+
+        with self.assertRaises(MeshGenerationError):
+            self.mesh.write_polymesh("")
@@ -0,0 +1,58 @@
+import unittest
+
+from parameterized import parameterized
+
+from classy_blocks.util.constants import TOL
+from classy_blocks.util.spatial_hash import SpatialHash
+
+
+class SpatialHashTests(unittest.TestCase):
+    def setUp(self):
+        self.hash = SpatialHash[str]()
+
+    def test_find_empty(self):
+        self.assertIsNone(self.hash.find([0, 0, 0]))
+
+    def test_find_exact(self):
+        self.hash.add([1, 2, 3], "a")
+
+        self.assertEqual(self.hash.find([1, 2, 3]), "a")
+
+    @parameterized.expand(
+        (
+            ([0.5 * TOL, 0, 0],),
+            ([-0.5 * TOL, 0, 0],),
+            ([0, 0.3 * TOL, -0.3 * TOL],),
+        )
+    )
+    def test_find_neighbouring_cell(self, offset):
+        """Points within tolerance are found even across cell boundaries"""
+        self.hash.add([0, 0, 0], "a")
+
+        self.assertEqual(self.hash.find(offset), "a")
+
+    def test_not_found(self):
+        self.hash.add([0, 0, 0], "a")
+
+        self.assertIsNone(self.hash.find([2 * TOL, 0, 0]))
+
+    def test_first_added(self):
+        """When more items are within tolerance, return the first added"""
+        self.hash.add([0.4 * TOL, 0, 0], "a")
+        self.hash.add([0, 0, 0], "b")
+
+        self.assertEqual(self.hash.find([0, 0, 0]), "a")
+
+    def test_position_copied(self):
+        position = [1.0, 1.0, 1.0]
+        self.hash.add(position, "a")
+        position[0] = 0
+
+        self.assertEqual(self.hash.find([1, 1, 1]), "a")
+
+    def test_clear(self):
+        self.hash.add([0, 0, 0], "a")
+        self.hash.clear()
+
+        self.assertIsNone(self.hash.find([0, 0, 0]))
+        self.assertEqual(len(self.hash), 0)
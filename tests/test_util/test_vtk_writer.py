@@ -0,0 +1,224 @@
+import base64
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import zlib
+from typing import Dict, List, get_args
+
+import numpy as np
+from parameterized import parameterized
+
+from classy_blocks.base.exceptions import UndefinedGradingsError
+from classy_blocks.construct.operations.box import Box
+from classy_blocks.mesh import Mesh
+from classy_blocks.types import DirectionType
+from classy_blocks.util.vtk_writer import get_block_cells, get_block_data, write_preview, write_vtu
+
+DTYPES = {"Float64": "<f8", "Int32": "<i4", "Int64": "<i8", "UInt8": "<u1"}
+
+
+def read_vtu(path: str) -> Dict[str, np.ndarray]:
+    """Reads arrays from a file written by write_vtu or write_preview;
+    arrays with the same name from all pieces are concatenated"""
+    with open(path, "rb") as vtu_file:
+        contents = vtu_file.read()
+
+    appended = b""
+    if b"<AppendedData" in contents:
+        xml_start, data_start = contents.split(b'<AppendedData encoding="raw">\n_', 1)
+        appended = data_start.rsplit(b"\n</AppendedData>", 1)[0]
+        contents = xml_start + b"</VTKFile>"
+
+    root = ET.fromstring(contents)
+    compressed = "compressor" in root.attrib
+
+    def decode(header: bytes, data: bytes) -> bytes:
+        if not compressed:
+            return data
+
+        sizes = np.frombuffer(header, dtype="<u8")
+        chunks = []
+        position = 0
+        for size in sizes[3:].tolist():
+            chunks.append(zlib.decompress(data[position : position + size]))
+            position += size
+
+        return b"".join(chunks)
+
+    arrays: Dict[str, List[np.ndarray]] = {}
+
+    for element in root.iter("DataArray"):
+        if element.attrib["format"] == "appended":
+            offset = int(element.attrib["offset"])
+            count = int(np.frombuffer(appended[offset : offset + 8], dtype="<u8")[0])
+            header_size = 8 * (3 + count) if compressed else 8
+            header = appended[offset : offset + header_size]
+            data_size = int(np.sum(np.frombuffer(header, dtype="<u8")[3:])) if compressed else count
+            data = decode(header, appended[offset + header_size : offset + header_size + data_size])
+        else:
+            encoded = element.text or ""
+            if compressed:
+                count = int(np.frombuffer(base64.b64decode(encoded[:12])[:8], dtype="<u8")[0])
+                header_length = 4 * ((8 * (3 + count) + 2) // 3)
+                header = base64.b64decode(encoded[:header_length])
+                data = decode(header, base64.b64decode(encoded[header_length:]))
+            else:
+                data = base64.b64decode(encoded)[8:]
+
+        values = np.frombuffer(data, dtype=DTYPES[element.attrib["type"]])
+        values = values.reshape(-1, int(element.attrib["NumberOfComponents"]))
+        arrays.setdefault(element.attrib.get("Name", "Points"), []).append(values)
+
+    return {name: np.concatenate(values) for name, values in arrays.items()}
+
+
+class VTUWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+        for i in range(3):
+            box = Box([i, 0, 0], [i + 1, 1, 1])
+            for axis in get_args(DirectionType):
+                box.chop(axis, count=i + 1 if axis == 0 else axis + 1)
+
+            self.mesh.add(box)
+
+        self.mesh.operations[0].set_patch("left", "inlet")
+        self.mesh.operations[2].set_patch(["right", "top"], "outlet")
+        self.mesh.operations[1].set_cell_zone("porous")
+
+        self.mesh.assemble()
+        self.mesh.block_list.assemble()
+
+    @property
+    def block_data(self):
+        return get_block_data(self.mesh.blocks, list(self.mesh.patch_list.patches.values()))
+
+    def test_cell_counts(self):
+        np.testing.assert_equal(self.block_data["cell_counts"], [[1, 2, 3], [2, 2, 3], [3, 2, 3]])
+
+    def test_quality(self):
+        self.assertEqual(len(self.block_data["quality"]), 3)
+        self.assertTrue(np.all(np.isfinite(self.block_data["quality"])))
+
+    def test_patches(self):
+        np.testing.assert_equal(self.block_data["patches"], [[-1, -1, 0, -1, -1, -1], [-1] * 6, [-1, 1, -1, 1, -1, -1]])
+
+    def test_cell_zone(self):
+        np.testing.assert_equal(self.block_data["cell_zone"], [-1, 0, -1])
+
+    @parameterized.expand(((True, "raw"), (False, "raw"), (True, "base64"), (False, "base64")))
+    def test_write(self, compress, encoding):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "debug.vtu")
+            write_vtu(path, self.mesh.vertices, self.mesh.blocks, self.block_data, encoding, compress)
+
+            arrays = read_vtu(path)
+
+        np.testing.assert_almost_equal(arrays["Points"], [vertex.position for vertex in self.mesh.vertices])
+        np.testing.assert_equal(arrays["connectivity"].reshape(-1, 8), [block.indexes for block in self.mesh.blocks])
+        np.testing.assert_equal(arrays["offsets"].flatten(), [8, 16, 24])
+        np.testing.assert_equal(arrays["types"].flatten(), [12, 12, 12])
+        np.testing.assert_equal(arrays["cell_counts"], self.block_data["cell_counts"])
+        np.testing.assert_equal(arrays["patches"], self.block_data["patches"])
+
+    def test_write_large(self):
+        """Data larger than a single compressed block"""
+        cell_data = {"values": np.linspace(0, 1, 3 * 5000).reshape(-1, 5000)}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "debug.vtu")
+            write_vtu(path, self.mesh.vertices, self.mesh.blocks, cell_data)
+
+            arrays = read_vtu(path)
+
+        np.testing.assert_equal(arrays["values"], cell_data["values"])
+
+    def test_mesh_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "debug.vtu")
+            self.mesh.write(os.path.join(tmpdir, "blockMeshDict"), path)
+
+            arrays = read_vtu(path)
+
+            with open(path, "rb") as vtu_file:
+                self.assertIn(b"<!-- patches: 0=inlet 1=outlet -->", vtu_file.read())
+
+        np.testing.assert_equal(arrays["cell_zone"].flatten(), [-1, 0, -1])
+
+    def test_debug_on_failure(self):
+        """Debug file is written even if gradings fail"""
+        mesh = Mesh()
+        mesh.add(Box([0, 0, 0], [1, 1, 1]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "debug.vtu")
+
+            with self.assertRaises(UndefinedGradingsError):
+                mesh.write(os.path.join(tmpdir, "blockMeshDict"), path)
+
+            np.testing.assert_equal(read_vtu(path)["cell_counts"], [[0, 0, 0]])
+
+
+class PreviewTests(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh()
+
+        box = Box([0, 0, 0], [1, 2, 3])
+        box.chop(0, count=4, total_expansion=8)
+        box.chop(1, count=2)
+        box.chop(2, count=3)
+        self.mesh.add(box)
+
+    def get_block_cells(self):
+        self.mesh.assemble()
+        self.mesh.block_list.assemble()
+
+        return get_block_cells(self.mesh.blocks[0])
+
+    def test_block_cells(self):
+        points, connectivity, _ = self.get_block_cells()
+
+        self.assertEqual(len(points), 5 * 3 * 4)
+        self.assertEqual(len(connectivity), 4 * 2 * 3)
+        # the first cell is the smallest one in the first corner
+        np.testing.assert_almost_equal(np.min(points[connectivity[0]], axis=0), [0, 0, 0])
+        np.testing.assert_almost_equal(np.max(points[connectivity[0]], axis=0), [1 / 15, 1, 1])
+
+    def test_cell_sizes(self):
+        _, _, cell_data = self.get_block_cells()
+
+        sizes = cell_data["cell_size"].reshape(4, 2, 3, 3)
+
+        np.testing.assert_almost_equal(sizes[:, 0, 0, 0], [1 / 15, 2 / 15, 4 / 15, 8 / 15])
+        np.testing.assert_almost_equal(sizes[..., 1], 1)
+        np.testing.assert_almost_equal(sizes[..., 2], 1)
+
+    def test_expansion_ratios(self):
+        _, _, cell_data = self.get_block_cells()
+
+        ratios = cell_data["expansion_ratio"].reshape(4, 2, 3, 3)
+
+        np.testing.assert_almost_equal(ratios[:, 0, 0, 0], [1, 2, 2, 2])
+        np.testing.assert_almost_equal(ratios[..., 1:], 1)
+
+    @parameterized.expand(((True,), (False,)))
+    def test_write(self, compress):
+        box = Box([1, 0, 0], [2, 2, 3])
+        box.chop(0, count=5)
+        self.mesh.add(box)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "preview.vtu")
+            if compress:
+                self.mesh.write_preview(path)
+            else:
+                self.get_block_cells()
+                write_preview(path, self.mesh.blocks, compress)
+
+            arrays = read_vtu(path)
+
+        self.assertEqual(len(arrays["Points"]), 5 * 3 * 4 + 6 * 3 * 4)
+        np.testing.assert_equal(np.unique(arrays["block_id"], return_counts=True)[1], [24, 30])
+        np.testing.assert_almost_equal(np.sum(np.prod(arrays["cell_size"], axis=1)), 12)